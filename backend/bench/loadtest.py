@@ -0,0 +1,173 @@
+"""
+Load test of the Hive API with many simulated players making random legal turns.
+
+Each simulated client plays its own game (game_id "load-<n>") the way the
+frontend does: it reads /state, asks /valid-placements or /valid-moves for
+randomly chosen reserve bug types and board bugs until one has a destination,
+then plays it with /place or /move, or calls /pass when nothing is legal.
+By default the app runs in-process through httpx's ASGI transport, so no
+server is needed; pass --url to load a running server (e.g. uvicorn) instead.
+
+Usage:
+    PYTHONPATH=src python bench/loadtest.py --clients 32 --duration 20
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import defaultdict
+
+import httpx
+from stats import format_table, summarize
+
+# Plies after which a simulated game is abandoned and a new one started
+MAX_PLIES = 120
+
+
+class Recorder:
+    """Collects the latency of every request by endpoint."""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors = 0
+        self.turns = 0
+        self.games = 0
+
+    async def request(self, client: httpx.AsyncClient, method: str, route: str,
+                      url: str, **kwargs) -> httpx.Response:
+        """Sends a request, recording its latency under "<method> <route>"."""
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies[f"{method} {route}"].append(time.perf_counter() - start)
+        if response.is_error:
+            self.errors += 1
+        return response
+
+
+def top_bugs(state: dict, color: str) -> list[tuple[int, int]]:
+    """Returns the positions of the stacks topped by a player's bug."""
+    tops: dict[tuple[int, int], dict] = {}
+    for bug in state["bugs"]:
+        pos = (bug["q"], bug["r"])
+        if pos not in tops or bug["height"] > tops[pos]["height"]:
+            tops[pos] = bug
+    return [pos for pos, bug in tops.items() if bug["owner"] == color]
+
+
+async def play_turn(client: httpx.AsyncClient, recorder: Recorder, rng: random.Random,
+                    game_id: str, state: dict) -> dict:
+    """Plays one random legal turn and returns the new state."""
+    color = state["current_player"]
+    player = next(p for p in state["players"] if p["color"] == color)
+    params = {"game_id": game_id}
+
+    options = [("place", bug["bug_type"]) for bug in player["remaining_bugs"]]
+    options += [("move", pos) for pos in top_bugs(state, color)]
+    rng.shuffle(options)
+    for kind, choice in options:
+        if kind == "place":
+            response = await recorder.request(
+                client, "GET", "/valid-placements", "/valid-placements",
+                params={**params, "bug_type": choice})
+            if response.json():
+                to = rng.choice(response.json())
+                response = await recorder.request(
+                    client, "POST", "/place", "/place", params=params,
+                    json={"bug_type": choice, "q": to["q"], "r": to["r"]})
+                return response.json()
+        else:
+            q, r = choice
+            response = await recorder.request(
+                client, "GET", "/valid-moves", "/valid-moves",
+                params={**params, "q": q, "r": r})
+            if response.json():
+                to = rng.choice(response.json())
+                response = await recorder.request(
+                    client, "POST", "/move", "/move", params=params,
+                    json={"from_q": q, "from_r": r, "to_q": to["q"], "to_r": to["r"]})
+                return response.json()
+
+    response = await recorder.request(client, "POST", "/pass", "/pass", params=params)
+    return response.json()
+
+
+async def run_client(client: httpx.AsyncClient, recorder: Recorder, number: int,
+                     seed: int, deadline: float) -> None:
+    """Plays games in one session until the deadline."""
+    rng = random.Random(seed + number)
+    game_id = f"load-{number}"
+    params = {"game_id": game_id}
+    while time.perf_counter() < deadline:
+        await recorder.request(client, "POST", "/newgame", "/newgame", params=params)
+        recorder.games += 1
+        for _ in range(MAX_PLIES):
+            # The frontend reads the state before every turn, served from the state cache
+            response = await recorder.request(client, "GET", "/state", "/state", params=params)
+            state = response.json()
+            if state["phase"] == "GameOver" or time.perf_counter() >= deadline:
+                break
+            await play_turn(client, recorder, rng, game_id, state)
+            recorder.turns += 1
+
+
+def make_client(url: str | None) -> httpx.AsyncClient:
+    """Returns a client for a running server, or for the app in this process."""
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=30)
+
+    # Lazy import so loading a remote server does not need the app importable
+    from api.main import app
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://hive")
+
+
+async def run(clients: int, duration: float, seed: int, url: str | None) -> dict:
+    """Runs the load test and returns its report."""
+    recorder = Recorder()
+    async with make_client(url) as client:
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(*(run_client(client, recorder, n, seed, deadline)
+                               for n in range(clients)))
+        elapsed = time.perf_counter() - start
+
+    endpoints = {name: summarize(values) for name, values in sorted(recorder.latencies.items())}
+    requests = sum(e["count"] for e in endpoints.values())
+    return {
+        "clients": clients,
+        "seconds": elapsed,
+        "requests": requests,
+        "errors": recorder.errors,
+        "games": recorder.games,
+        "turns": recorder.turns,
+        "requests_per_second": requests / elapsed,
+        "turns_per_second": recorder.turns / elapsed,
+        "endpoints": endpoints,
+    }
+
+
+def format_report(report: dict) -> str:
+    """Formats a report as a summary line and a latency table."""
+    summary = (f"{report['clients']} clients, {report['seconds']:.1f}s: "
+               f"{report['requests']} requests ({report['requests_per_second']:.0f}/s), "
+               f"{report['turns']} turns ({report['turns_per_second']:.0f}/s), "
+               f"{report['games']} games, {report['errors']} errors")
+    return "\n".join([summary, *format_table(report["endpoints"])])
+
+
+def main() -> None:
+    """Runs simulated players against the Hive API and reports throughput and latency."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--clients", type=int, default=16, help="concurrent players")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="base URL of a running server (default: in-process)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.clients, args.duration, args.seed, args.url))
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
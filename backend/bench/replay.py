@@ -0,0 +1,168 @@
+"""
+Benchmark replaying a corpus of recorded games, with per-turn timing.
+
+Every move is played through Game.play (validated, as by POST /place, /move
+and /pass), and after each one the work of the read endpoints is repeated:
+encoding the state (GET /state) and listing every valid action
+(GET /valid-actions). The report summarizes each call's latency and lists the
+slowest turns with the moves leading to them, which rebuild the position
+with Game.from_moves or show it through GET /history/{ply}.
+
+The corpus is a game archive (see hive.importer) or a text file with one
+game per line, as read by hive.importer.read_game_records.
+
+Usage:
+    PYTHONPATH=src python bench/replay.py games.arc --slowest 20
+"""
+import argparse
+import heapq
+import json
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+
+from stats import format_table, summarize
+
+from api.models import GameStateResponse, ValidActionsResponse
+from hive.archive import MAGIC, GameArchive
+from hive.game import Game
+from hive.importer import read_game_records
+from hive.openings import get_opening_book
+
+DEFAULT_SLOWEST = 10
+
+
+@dataclass
+class Turn:
+    """The timings of one replayed move."""
+
+    game: int  # Index of the game in the corpus
+    ply: int  # Number of moves played, including this one
+    move: str
+    pieces: int  # Bugs on the board after the move
+    play_ms: float
+    movegen_ms: float  # Part of play_ms spent computing the next player's valid actions
+    state_ms: float
+    actions_ms: float
+    position: str = ""  # Moves up to and including this one, joined by ";"
+
+
+def read_corpus(path: str) -> Iterator[list[str]]:
+    """Yields the move strings of each game in an archive or a text file of games."""
+    with open(path, "rb") as file:
+        is_archive = file.read(len(MAGIC)) == MAGIC
+
+    if is_archive:
+        with GameArchive(path) as archive:
+            yield from archive
+    else:
+        with open(path) as file:
+            yield from read_game_records(file)
+
+
+def timed(func, *args) -> tuple[object, float]:
+    """Calls a function, returning its result and the elapsed milliseconds."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def replay_game(index: int, moves: list[str], cold: bool) -> tuple[list[Turn], str | None]:
+    """Replays one game, returning its turns and the reason it stopped early, if any."""
+    # Recorded games are not being served, so they stay out of the shared move cache
+    game = Game(use_move_cache=False)
+    turns = []
+    for ply, move in enumerate(moves, start=1):
+        if cold:
+            game.board.move_cache.clear()
+        try:
+            ok, play_ms = timed(game.play, move)
+        except ValueError as error:
+            return turns, f"move {ply} ({move}): {error}"
+        if not ok:
+            return turns, f"move {ply} ({move}) is illegal"
+
+        _, state_ms = timed(GameStateResponse.encode, game)
+        _, actions_ms = timed(ValidActionsResponse.from_game, game)
+        turns.append(Turn(index, ply, move, len(game.all_bugs), play_ms,
+                          game.movegen_seconds * 1e3, state_ms, actions_ms))
+    return turns, None
+
+
+def run(path: str, slowest: int, cold: bool, limit: int | None) -> dict:
+    """Replays the corpus and returns the report."""
+    timings: dict[str, list[float]] = defaultdict(list)
+    heap: list[tuple[float, int, Turn]] = []  # The slowest turns, fastest first
+    errors = []
+    games = turns = 0
+    get_opening_book()  # Built on first use, which would otherwise be charged to the first move
+    start = time.perf_counter()
+    for index, moves in enumerate(read_corpus(path)):
+        if limit is not None and index >= limit:
+            break
+        game_turns, error = replay_game(index, moves, cold)
+        games += 1
+        turns += len(game_turns)
+        if error:
+            errors.append(f"game {index}: {error}")
+
+        for turn in game_turns:
+            timings["play"].append(turn.play_ms / 1e3)
+            timings["movegen"].append(turn.movegen_ms / 1e3)
+            timings["state"].append(turn.state_ms / 1e3)
+            timings["valid_actions"].append(turn.actions_ms / 1e3)
+            if len(heap) < slowest or (heap and turn.play_ms > heap[0][0]):
+                turn.position = ";".join(moves[:turn.ply])
+                entry = (turn.play_ms, id(turn), turn)
+                if len(heap) < slowest:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heapreplace(heap, entry)
+
+    return {
+        "corpus": path,
+        "cold_caches": cold,
+        "games": games,
+        "turns": turns,
+        "seconds": time.perf_counter() - start,
+        "calls": {name: summarize(values) for name, values in timings.items()},
+        "slowest": [asdict(turn) for _, _, turn in sorted(heap, reverse=True)],
+        "errors": errors,
+    }
+
+
+def format_report(report: dict) -> str:
+    """Formats a report as a summary, a latency table, and the slowest turns."""
+    lines = [f"Replayed {report['turns']} turns of {report['games']} games "
+             f"in {report['seconds']:.1f}s ({len(report['errors'])} stopped early)"]
+    lines += format_table(report["calls"])
+    lines.append("")
+    lines.append(f"{'game':>6} {'ply':>4} {'move':<14} {'pieces':>6} {'play ms':>8} "
+                 f"{'movegen':>8} position")
+    for turn in report["slowest"]:
+        lines.append(f"{turn['game']:>6} {turn['ply']:>4} {turn['move']:<14} "
+                     f"{turn['pieces']:>6} {turn['play_ms']:>8.2f} {turn['movegen_ms']:>8.2f} "
+                     f"{turn['position']}")
+    lines.extend(report["errors"])
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Replays recorded games, timing every turn, and reports the slowest ones."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("corpus", help="game archive, or text file with one UHP game per line")
+    parser.add_argument("--slowest", type=int, default=DEFAULT_SLOWEST,
+                        help="number of slowest turns to list")
+    parser.add_argument("--cold", action="store_true",
+                        help="clear the per-bug move cache before every move")
+    parser.add_argument("--limit", type=int, help="replay only the first games")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = run(args.corpus, args.slowest, args.cold, args.limit)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+Benchmark of move generation cost as the hive grows, emitted as JSON.
+
+Synthesizes random legal hives of each shape and size (one connected hive,
+both queens on the ground and free, only beetles above ground level), then
+times, with the caches bypassed:
+  - each behavior's get_valid_moves, per bug of that type
+  - RuleEngine.get_all_valid_places for the player to move
+  - Game.switch_turn, recomputing every valid action
+
+Sizes may exceed the 22 pieces of the base game, which the engine handles like
+expansion sets. Beside the raw timings, the report fits each metric's growth
+exponent (the slope of log time over log pieces), so a quadratic regression
+shows up as an exponent near 2.
+
+Usage:
+    PYTHONPATH=src python bench/scaling.py --sizes 5 10 20 40 60 --out scaling.json
+"""
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import time
+from collections.abc import Callable
+
+from hive.game import Game, Phase
+from hive.models.bugtype import BugType
+from hive.models.player import COLORS
+from hive.models.position import Position, get_neighbors
+from hive.movecache import move_cache
+from hive.rules import RuleEngine
+from hive.snapshot import GameSnapshot
+
+# A synthetic hive: the stack at each position, bottom first, as (color, bug type)
+Hive = dict[Position, list[tuple[str, BugType]]]
+
+DEFAULT_SIZES = (5, 10, 15, 20, 30, 40, 60, 80)
+DEFAULT_REPEATS = 5
+# Smallest hive with room for both queens and another bug
+MIN_PIECES = 3
+# Relative frequency of ground bug types, as in the base game reserve
+GROUND_WEIGHTS = {BugType.ANT: 3, BugType.GRASSHOPPER: 3, BugType.SPIDER: 2, BugType.BEETLE: 2}
+# Attempts at generating a hive where neither queen is surrounded
+MAX_ATTEMPTS = 100
+
+
+def _random_ground_bug(rng: random.Random) -> tuple[str, BugType]:
+    """Returns a random color and ground bug type."""
+    bug_type = rng.choices(list(GROUND_WEIGHTS), weights=list(GROUND_WEIGHTS.values()))[0]
+    return rng.choice(COLORS), bug_type
+
+
+def _frontier(hive: Hive) -> list[Position]:
+    """Returns the empty positions touching the hive, in a deterministic order."""
+    cells = {nbor for pos in hive for nbor in pos.neighbors() if nbor not in hive}
+    return sorted(cells, key=lambda pos: (pos.q, pos.r))
+
+
+def _grow(hive: Hive, cells: int, rng: random.Random,
+          allowed: Callable[[Position], bool] = lambda pos: True) -> None:
+    """Adds ground bugs at random empty positions touching the hive."""
+    for _ in range(cells):
+        pos = rng.choice([pos for pos in _frontier(hive) if allowed(pos)])
+        hive[pos] = [_random_ground_bug(rng)]
+
+
+def blob_hive(pieces: int, rng: random.Random) -> Hive:
+    """Returns a compact hive grown one random neighboring cell at a time."""
+    hive: Hive = {Position(0, 0): [_random_ground_bug(rng)]}
+    _grow(hive, pieces - 1, rng)
+    return hive
+
+
+def chain_hive(pieces: int, rng: random.Random) -> Hive:
+    """Returns a winding chain, branching only where it cannot continue."""
+    hive: Hive = {Position(0, 0): [_random_ground_bug(rng)]}
+    tip = Position(0, 0)
+    for _ in range(pieces - 1):
+        def is_free_end(pos: Position) -> bool:
+            return sum(nbor in hive for nbor in pos.neighbors()) == 1
+
+        options = [pos for pos in tip.neighbors() if pos not in hive and is_free_end(pos)]
+        if not options:
+            options = [pos for pos in _frontier(hive) if is_free_end(pos)]
+        tip = rng.choice(options)
+        hive[tip] = [_random_ground_bug(rng)]
+    return hive
+
+
+def ring_hive(pieces: int, rng: random.Random) -> Hive:
+    """Returns a ring around a hole as wide as the pieces allow, with the rest outside it."""
+    radius = max(pieces // 6, 1)
+    directions = get_neighbors(0, 0)
+    ring = []
+    pos = Position(directions[4].q * radius, directions[4].r * radius)
+    for side in range(6):
+        for _ in range(radius):
+            ring.append(pos)
+            pos = Position(pos.q + directions[side].q, pos.r + directions[side].r)
+
+    hive: Hive = {pos: [_random_ground_bug(rng)] for pos in ring[:pieces]}
+    _grow(hive, pieces - len(hive), rng,
+          lambda pos: pos.distance(Position(0, 0)) > radius)
+    return hive
+
+
+def stack_hive(pieces: int, rng: random.Random) -> Hive:
+    """Returns a compact hive of half the pieces with the other half as beetles on 3 stacks."""
+    hive = blob_hive(pieces - pieces // 2, rng)
+    # Leave at least two single bugs for the queens
+    stacks = rng.sample(sorted(hive, key=lambda pos: (pos.q, pos.r)), min(3, len(hive) - 2))
+    for _ in range(pieces // 2):
+        hive[rng.choice(stacks)].append((rng.choice(COLORS), BugType.BEETLE))
+    return hive
+
+
+SHAPES: dict[str, Callable[[int, random.Random], Hive]] = {
+    "blob": blob_hive,
+    "chain": chain_hive,
+    "ring": ring_hive,
+    "stack": stack_hive,
+}
+
+
+def _place_queens(hive: Hive, rng: random.Random) -> bool:
+    """Turns a random ground bug of each color into its queen; False if one is surrounded."""
+    singles = sorted((pos for pos, stack in hive.items() if len(stack) == 1),
+                     key=lambda pos: (pos.q, pos.r))
+    for color, pos in zip(COLORS, rng.sample(singles, 2), strict=True):
+        hive[pos] = [(color, BugType.QUEEN_BEE)]
+        if all(nbor in hive for nbor in pos.neighbors()):
+            return False
+    return True
+
+
+def make_game(shape: str, pieces: int, rng: random.Random) -> Game:
+    """
+    Returns a game in the place-or-move phase on a random hive of the given shape.
+
+    Raises:
+        RuntimeError: If no hive with both queens free could be generated.
+    """
+    for _ in range(MAX_ATTEMPTS):
+        hive = SHAPES[shape](pieces, rng)
+        if _place_queens(hive, rng):
+            break
+    else:
+        raise RuntimeError(f"Could not generate a {shape} hive of {pieces} pieces")
+
+    placed: dict[str, list] = {color: [] for color in COLORS}
+    for pos, stack in hive.items():
+        for height, (color, bug_type) in enumerate(stack):
+            placed[color].append((bug_type, pos.q, pos.r, height))
+    # Queens first, as they are placed within each player's first turns
+    for bugs in placed.values():
+        bugs.sort(key=lambda bug: bug[0] != BugType.QUEEN_BEE)
+
+    snapshot = GameSnapshot(tuple(placed["WHITE"]), tuple(placed["BLACK"]), "WHITE",
+                            Phase.PLACE_MOVE, False, False, None, False)
+    return Game.from_snapshot(snapshot)
+
+
+def best_time(func: Callable[[], object], repeats: int,
+              setup: Callable[[], object] | None = None) -> float:
+    """Returns the fastest of several timed calls, in seconds, running setup untimed before each."""
+    times = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def measure(game: Game, repeats: int) -> dict:
+    """Times move generation on a game's position."""
+    board = game.board
+    tops = [bug for bug in game.all_bugs if RuleEngine.is_on_top(board, bug)]
+    behaviors = {}
+    for bug_type in BugType:
+        bugs = [bug for bug in tops if bug.bug_type == bug_type]
+        if bugs:
+            seconds = best_time(lambda bugs=bugs: [bug.get_valid_moves(board) for bug in bugs],
+                                repeats)
+            behaviors[bug_type.value] = {"bugs": len(bugs), "seconds_per_bug": seconds / len(bugs)}
+
+    # Every repeat switches the turn of a fresh copy, so each times the same position
+    snapshot = game.snapshot()
+    fresh = game
+
+    def reset() -> None:
+        nonlocal fresh
+        fresh = Game.from_snapshot(snapshot)
+        move_cache.clear()
+        fresh.board.move_cache.clear()
+
+    def cold_switch_turn() -> None:
+        fresh.switch_turn()
+
+    return {
+        "pieces": len(game.all_bugs),
+        "max_height": max(len(board.get_stack(pos)) for pos in board.occupied_positions()),
+        "behaviors": behaviors,
+        "valid_places_seconds": best_time(
+            lambda: RuleEngine.get_all_valid_places(board, game.cur_player), repeats),
+        "switch_turn_seconds": best_time(cold_switch_turn, repeats, setup=reset),
+    }
+
+
+def growth_exponent(points: list[tuple[int, float]]) -> float | None:
+    """Returns the least squares slope of log(seconds) over log(pieces)."""
+    points = [(math.log(n), math.log(t)) for n, t in points if t > 0]
+    if len({x for x, _ in points}) <= 1:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in points)
+            / sum((x - mean_x) ** 2 for x, _ in points))
+
+
+def run(shapes: list[str], sizes: list[int], repeats: int, seed: int) -> dict:
+    """Runs the benchmark and returns its report."""
+    rng = random.Random(seed)
+    results = []
+    for shape in shapes:
+        for pieces in sizes:
+            result = measure(make_game(shape, pieces, rng), repeats)
+            results.append({"shape": shape, **result})
+            move_cache.clear()
+
+    exponents = {}
+    for shape in shapes:
+        rows = [r for r in results if r["shape"] == shape]
+        series = {
+            "valid_places": [(r["pieces"], r["valid_places_seconds"]) for r in rows],
+            "switch_turn": [(r["pieces"], r["switch_turn_seconds"]) for r in rows],
+        }
+        for bug_type in BugType:
+            series[bug_type.value] = [
+                (r["pieces"], r["behaviors"][bug_type.value]["seconds_per_bug"])
+                for r in rows if bug_type.value in r["behaviors"]]
+        exponents[shape] = {name: growth_exponent(points) for name, points in series.items()}
+
+    return {
+        "python": platform.python_version(),
+        "seed": seed,
+        "repeats": repeats,
+        "results": results,
+        "exponents": exponents,
+    }
+
+
+def main() -> None:
+    """Times move generation over synthetic hives of growing size and prints JSON."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--shapes", nargs="+", choices=list(SHAPES), default=list(SHAPES))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="file to write the JSON report to (default: stdout)")
+    args = parser.parse_args()
+
+    if min(args.sizes) < MIN_PIECES:
+        parser.error(f"hives need at least {MIN_PIECES} pieces")
+    report = json.dumps(run(args.shapes, args.sizes, args.repeats, args.seed), indent=2)
+    if args.out:
+        with open(args.out, "w") as file:
+            file.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
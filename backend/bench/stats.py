@@ -0,0 +1,29 @@
+"""Summary statistics shared by the benchmarks."""
+import math
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Returns the nearest-rank percentile of already sorted values."""
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(seconds: list[float]) -> dict:
+    """Returns the count and the p50/p90/p99/max in milliseconds of timings."""
+    values = sorted(seconds)
+    return {
+        "count": len(values),
+        "p50_ms": percentile(values, 0.50) * 1e3,
+        "p90_ms": percentile(values, 0.90) * 1e3,
+        "p99_ms": percentile(values, 0.99) * 1e3,
+        "max_ms": values[-1] * 1e3,
+    }
+
+
+def format_table(rows: dict[str, dict]) -> list[str]:
+    """Formats summaries by name as the lines of a table."""
+    lines = [f"{'':<24} {'count':>8} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}"]
+    for name, s in rows.items():
+        lines.append(f"{name:<24} {s['count']:>8} {s['p50_ms']:>8.2f} {s['p90_ms']:>8.2f} "
+                     f"{s['p99_ms']:>8.2f} {s['max_ms']:>8.2f}")
+    return lines
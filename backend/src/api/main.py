@@ -1,18 +1,71 @@
 """Entrypoint for the FastAPI Hive backend server."""
-from fastapi import FastAPI  # type: ignore
+import os
+import time
+from contextlib import asynccontextmanager
 
+from fastapi import FastAPI, Request, Response  # type: ignore
+
+from api import metrics, profiles
 from api.router import api_router
+from api.sessions import sessions
+from hive import oracle, parallel, profiling
+from hive.profiling import StackProfiler
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Enables profiling or oracle checks if requested, and flushes persisted games on shutdown."""
+    parallel.get_executor()  # Reads HIVE_MOVEGEN_THREADS now, so a bad value is logged at startup
+    if os.environ.get(profiling.PROFILE_ENV):
+        profiling.enable()
+    if os.environ.get(oracle.ORACLE_ENV):
+        oracle.enable()
+    yield
+    sessions.close()
+
 
 # Create the FastAPI app instance
 app = FastAPI(
     title="Hive Game API",
     description="API for interacting with the Hive board game backend",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Registers all routes
 app.include_router(api_router)
 
+@app.middleware("http")
+async def profile_request(request: Request, call_next):
+    """Profiles the handler when an admin sends the profiling header; returns the profile id."""
+    if not profiles.should_profile(request.url.path, request.headers.get(profiles.PROFILE_HEADER)):
+        return await call_next(request)
+
+    profiler = StackProfiler()
+    token = profiles.requested_profiler.set(profiler)
+    try:
+        response = await call_next(request)
+    finally:
+        profiles.requested_profiler.reset(token)
+    if profiler.stacks:
+        response.headers[profiles.PROFILE_ID_HEADER] = profiles.profiles.save(profiler.collapsed())
+    return response
+
+@app.middleware("http")
+async def record_latency(request: Request, call_next):
+    """Records each request's latency under its route template (e.g. /history/{ply})."""
+    start = time.perf_counter()
+    response = await call_next(request)
+    route = request.scope.get("route")
+    path = route.path if route is not None else "unmatched"
+    metrics.request_latency.observe(time.perf_counter() - start, request.method, path)
+    return response
+
+@app.get("/metrics")
+def get_metrics():
+    """Returns server metrics in the Prometheus text format."""
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 @app.get("/")
 def root():
     """Returns welcome message."""
@@ -0,0 +1,151 @@
+"""Server metrics rendered in the Prometheus text exposition format."""
+
+import math
+import threading
+from collections.abc import Callable, Sequence
+
+from api.sessions import sessions
+from hive import profiling
+from hive.game import Game
+from hive.movecache import move_cache
+
+# Content type of the Prometheus text format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket upper bounds (seconds for latencies, pieces for board sizes)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+MOVEGEN_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+BOARD_SIZE_BUCKETS = (2, 4, 6, 8, 10, 12, 14, 16, 18, 20, 22)
+
+
+def _escape_label(value: str) -> str:
+    """Escapes a label value's backslashes, double quotes, and newlines."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Formats label pairs as {a="x",b="y"}, or an empty string if there are none."""
+    if not names:
+        return ""
+    pairs = (f'{name}="{_escape_label(value)}"'
+             for name, value in zip(names, values, strict=True))
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Formats a sample value, using the Prometheus spelling of infinity."""
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """A thread-safe histogram with cumulative buckets, optionally split by labels."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float],
+                 label_names: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = (*buckets, math.inf)
+        self.label_names = tuple(label_names)
+        # Per label values: (count per bucket, sum of observations)
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        """Records one observation."""
+        with self._lock:
+            counts, total = self._series.setdefault(
+                label_values, ([0] * len(self.buckets), [0.0]))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            total[0] += value
+
+    def render(self) -> list[str]:
+        """Returns the histogram's lines in the text format."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = [(labels, list(counts), total[0])
+                      for labels, (counts, total) in sorted(self._series.items())]
+
+        for label_values, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts, strict=True):
+                cumulative += count
+                labels = _format_labels((*self.label_names, "le"),
+                                        (*label_values, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def _sample(name: str, kind: str, help_text: str,
+            samples: Sequence[tuple[str, float]]) -> list[str]:
+    """Returns the lines of a gauge or counter given (labels, value) samples."""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{labels} {_format_value(value)}" for labels, value in samples)
+    return lines
+
+
+request_latency = Histogram(
+    "hive_request_duration_seconds", "HTTP request latency by route.",
+    LATENCY_BUCKETS, ("method", "route"))
+movegen_time = Histogram(
+    "hive_movegen_duration_seconds", "Time to compute the valid actions after a turn.",
+    MOVEGEN_BUCKETS)
+board_size = Histogram(
+    "hive_board_pieces", "Pieces on the board after each turn.", BOARD_SIZE_BUCKETS)
+
+
+def record_turn(game: Game) -> None:
+    """Records the move generation time and board size of a game's latest turn."""
+    movegen_time.observe(game.movegen_seconds)
+    board_size.observe(len(game.all_bugs))
+
+
+def _engine_metrics() -> list[str]:
+    """Returns session, cache, and (if enabled) rule engine profiling metrics."""
+    lines = _sample("hive_active_sessions", "gauge", "Games held in memory.",
+                    [("", len(sessions))])
+    lines += _sample("hive_session_evictions_total", "counter",
+                     "Games dropped from memory for being idle or least recently used.",
+                     [("", sessions.evictions)])
+    lines += _sample("hive_move_cache_hits_total", "counter",
+                     "Valid action lookups answered by the shared cache.", [("", move_cache.hits)])
+    lines += _sample("hive_move_cache_misses_total", "counter",
+                     "Valid action lookups computed by the rule engine.",
+                     [("", move_cache.misses)])
+    lines += _sample("hive_move_cache_hit_ratio", "gauge",
+                     "Fraction of valid action lookups answered by the shared cache.",
+                     [("", move_cache.hit_rate)])
+    lines += _sample("hive_move_cache_entries", "gauge", "Positions in the shared cache.",
+                     [("", len(move_cache))])
+    lines += _sample("hive_move_cache_bytes", "gauge",
+                     "Estimated memory used by the shared cache.", [("", move_cache.nbytes)])
+
+    stats = profiling.process_stats()
+    if stats:
+        labels = {label: _format_labels(("function",), (label,)) for label in stats}
+        lines += _sample("hive_rule_calls_total", "counter",
+                         "Profiled rule engine calls (see HIVE_PROFILE).",
+                         [(labels[label], s.count) for label, s in sorted(stats.items())])
+        lines += _sample("hive_rule_seconds_total", "counter",
+                         "Time spent in profiled rule engine calls.",
+                         [(labels[label], s.total_seconds) for label, s in sorted(stats.items())])
+    return lines
+
+
+# Metric families rendered by render(), in order
+COLLECTORS: list[Callable[[], list[str]]] = [
+    request_latency.render, movegen_time.render, board_size.render, _engine_metrics,
+]
+
+
+def render() -> str:
+    """Returns all metrics in the Prometheus text format."""
+    lines = [line for collect in COLLECTORS for line in collect()]
+    return "\n".join(lines) + "\n"
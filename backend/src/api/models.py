@@ -1,6 +1,7 @@
 """Pydantic models for request/response payloads used in the Hive API."""
 
 from collections import Counter
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel  # type: ignore
 
@@ -66,6 +67,51 @@ class PositionView(BaseModel):
     q: int
     r: int
 
+class BugMovesView(BaseModel):
+    """View model of a movable bug's position and its valid destinations."""
+
+    q: int
+    r: int
+    destinations: list[PositionView]
+
+class BugPlacementsView(BaseModel):
+    """View model of the valid placement positions for a bug type in reserve."""
+
+    bug_type: str
+    positions: list[PositionView]
+
+class ValidActionsResponse(BaseModel):
+    """View model of every valid move and placement for the current player."""
+
+    moves: list[BugMovesView]
+    placements: list[BugPlacementsView]
+
+    @staticmethod
+    def from_game(game: Game) -> "ValidActionsResponse":
+        """Creates a ValidActionsResponse from a Game instance."""
+        moves = [
+            BugMovesView(
+                q=bug.position.q,
+                r=bug.position.r,
+                destinations=[PositionView(q=p.q, r=p.r) for p in dests],
+            )
+            for bug, dests in game.valid_moves.items()
+        ]
+
+        # One entry per distinct bug type still in reserve, in reserve order
+        placements = [
+            BugPlacementsView(
+                bug_type=bug_type.value,
+                positions=[PositionView(q=p.q, r=p.r) for p in game.valid_positions(bug_type)],
+            )
+            for bug_type in dict.fromkeys(game.cur_player.reserve)
+        ]
+
+        return ValidActionsResponse(moves=moves, placements=placements)
+
+# Pre-encoded game state per game, reused until the game's version changes
+_state_cache: WeakKeyDictionary[Game, tuple[int, bytes]] = WeakKeyDictionary()
+
 class GameStateResponse(BaseModel):
     """View model for the current game state."""
 
@@ -96,6 +142,23 @@ class GameStateResponse(BaseModel):
             visible_positions=visible_positions
         )
 
+    @staticmethod
+    def encode(game: Game) -> bytes:
+        """Returns the game state as JSON bytes, cached until the game state changes."""
+        cached = _state_cache.get(game)
+        if cached and cached[0] == game.version:
+            return cached[1]
+
+        encoded = GameStateResponse.from_game(game).model_dump_json().encode()
+        _state_cache[game] = (game.version, encoded)
+        return encoded
+
+class HistoryResponse(BaseModel):
+    """View model of the game's move history in UHP notation."""
+
+    ply: int
+    moves: list[str]
+
 # Request DTO (Data Transfer Object) is a structured object that defines the data a client must
 # send when calling endpoints. It separates incoming data from internal logic.
 
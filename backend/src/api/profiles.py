@@ -0,0 +1,101 @@
+"""Admin-only, per-request call profiles of route handlers, as collapsed stacks."""
+
+import functools
+import hmac
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from contextvars import ContextVar
+
+from fastapi.routing import APIRoute  # type: ignore
+
+from hive.profiling import StackProfiler
+
+# Request header that asks for a profile; its value must match HIVE_PROFILE_TOKEN
+PROFILE_HEADER = "X-Hive-Profile"
+# Response header carrying the id of the stored profile
+PROFILE_ID_HEADER = "X-Hive-Profile-Id"
+# Set HIVE_PROFILE_TOKEN to enable profiling requests; unset, every request is refused
+TOKEN_ENV = "HIVE_PROFILE_TOKEN"
+# Set HIVE_PROFILE_DIR to also write each profile to <dir>/<id>.collapsed
+DIR_ENV = "HIVE_PROFILE_DIR"
+# Number of most recent profiles kept in memory
+MAX_PROFILES = 100
+# Route prefix for fetching stored profiles; these requests are never profiled themselves
+PROFILES_PATH = "/profiles"
+
+# Profiler for the handler of the current request, set by the API middleware
+requested_profiler: ContextVar[StackProfiler | None] = ContextVar(
+    "requested_profiler", default=None)
+
+
+def is_authorized(token: str | None) -> bool:
+    """Returns True if a request token matches the configured admin token."""
+    expected = os.environ.get(TOKEN_ENV)
+    if not expected or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), expected.encode())
+
+
+class ProfileStore:
+    """Keeps the most recent profiles in memory, and optionally writes them to disk."""
+
+    def __init__(self, capacity: int = MAX_PROFILES):
+        self.capacity = capacity
+        self._profiles: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, collapsed: str) -> str:
+        """Stores a profile and returns its id."""
+        profile_id = uuid.uuid4().hex[:16]
+        with self._lock:
+            self._profiles[profile_id] = collapsed
+            while len(self._profiles) > self.capacity:
+                self._profiles.popitem(last=False)
+
+        directory = os.environ.get(DIR_ENV)
+        if directory:
+            with open(os.path.join(directory, f"{profile_id}.collapsed"), "w") as file:
+                file.write(collapsed)
+        return profile_id
+
+    def get(self, profile_id: str) -> str | None:
+        """Returns a stored profile, or None if unknown or evicted."""
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+
+profiles = ProfileStore()
+
+
+def should_profile(path: str, token: str | None) -> bool:
+    """Returns True if an admin asked to profile a request, unless it fetches a profile."""
+    return not path.startswith(PROFILES_PATH) and is_authorized(token)
+
+
+def profiled_endpoint(endpoint: Callable) -> Callable:
+    """Wraps a sync endpoint to run under the request's profiler, if one was requested."""
+    # Routes are rebuilt when a router is included, so an endpoint may already be wrapped
+    if getattr(endpoint, "__profiled__", False):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        profiler = requested_profiler.get()
+        if profiler is None:
+            return endpoint(*args, **kwargs)
+        # Runs in the worker thread executing the handler, which is the thread traced
+        with profiler:
+            return endpoint(*args, **kwargs)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """An APIRoute whose handler can be profiled per request (see PROFILE_HEADER)."""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, profiled_endpoint(endpoint), **kwargs)
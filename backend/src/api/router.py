@@ -1,67 +1,129 @@
 """Defines and registers all API routes for the Hive backend."""
 
-from fastapi import APIRouter, Query  # type: ignore
+from fastapi import APIRouter, Header, HTTPException, Query, Response  # type: ignore
 
-from api.models import GameStateResponse, MoveBugRequest, PlaceBugRequest, PositionView
-from hive.game import Game
+from api.metrics import record_turn
+from api.models import (
+    GameStateResponse,
+    HistoryResponse,
+    MoveBugRequest,
+    PlaceBugRequest,
+    PositionView,
+    ValidActionsResponse,
+)
+from api.profiles import (
+    PROFILE_HEADER,
+    PROFILES_PATH,
+    ProfiledRoute,
+    is_authorized,
+    profiles,
+)
+from api.sessions import DEFAULT_GAME_ID, sessions
+from hive.game import Game, Phase
 from hive.models.bugtype import BugType
 from hive.models.position import Position
 
-# Create a router instance
-api_router = APIRouter()
-# Initialize the game instance
-game = Game()
+# Create a router instance; its handlers can be profiled per request by admins
+api_router = APIRouter(route_class=ProfiledRoute)
+
+def state_response(cur_game: Game) -> Response:
+    """Wraps the cached JSON encoding of the game state in a response."""
+    return Response(content=GameStateResponse.encode(cur_game), media_type="application/json")
 
 # GET endpoint retrieves data without modifying the server.
 
 @api_router.get("/state", response_model=GameStateResponse)
-def get_state():
+def get_state(game_id: str = Query(DEFAULT_GAME_ID)):
     """Returns the current game state."""
-    return GameStateResponse.from_game(game)
+    game = sessions.get(game_id)
+    return state_response(game)
 
 @api_router.get("/valid-placements", response_model=list[PositionView])
-def get_valid_placements(bug_type: str = Query(...)):
+def get_valid_placements(bug_type: str = Query(...), game_id: str = Query(DEFAULT_GAME_ID)):
     """Returns valid placement positions considering queen placement rules."""
+    game = sessions.get(game_id)
     bt = BugType(bug_type)
     valid_pos = game.valid_positions(bt)
     return [PositionView(q=p.q, r=p.r) for p in valid_pos]
 
 @api_router.get("/valid-moves", response_model=list[PositionView])
-def get_valid_moves(q: int = Query(...), r: int = Query(...)):
+def get_valid_moves(q: int = Query(...), r: int = Query(...),
+                    game_id: str = Query(DEFAULT_GAME_ID)):
     """Returns valid destination positions for a selected bug."""
+    game = sessions.get(game_id)
     from_pos = Position(q, r)
     bug = game.board.get_top_bug(from_pos)
 
     valid_moves = game.valid_moves.get(bug, [])
     return [PositionView(q=pos.q, r=pos.r) for pos in valid_moves]
 
+@api_router.get("/valid-actions", response_model=ValidActionsResponse)
+def get_valid_actions(game_id: str = Query(DEFAULT_GAME_ID)):
+    """Returns valid moves for every movable bug and placements for every reserve bug type."""
+    game = sessions.get(game_id)
+    if game.phase == Phase.GAME_OVER:
+        return ValidActionsResponse(moves=[], placements=[])
+    return ValidActionsResponse.from_game(game)
+
+@api_router.get("/history", response_model=HistoryResponse)
+def get_history(game_id: str = Query(DEFAULT_GAME_ID)):
+    """Returns the moves played so far in UHP notation."""
+    game = sessions.get(game_id)
+    return HistoryResponse(ply=len(game.move_log), moves=game.move_log)
+
+@api_router.get("/history/{ply}", response_model=GameStateResponse)
+def get_history_state(ply: int, game_id: str = Query(DEFAULT_GAME_ID)):
+    """Returns the game state after the first ply moves, for reviewing past positions."""
+    game = sessions.get(game_id)
+    if not 0 <= ply <= len(game.move_log):
+        raise HTTPException(status_code=404, detail=f"Ply {ply} is not in the game history")
+    return GameStateResponse.from_game(game.at_ply(ply))
+
+@api_router.get(PROFILES_PATH + "/{profile_id}")
+def get_profile(profile_id: str, token: str | None = Header(None, alias=PROFILE_HEADER)):
+    """Returns a stored request profile as collapsed stacks (admin only)."""
+    if not is_authorized(token):
+        raise HTTPException(status_code=403, detail="Profiling is restricted to admins")
+    collapsed = profiles.get(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail=f"Profile {profile_id} not found")
+    return Response(content=collapsed, media_type="text/plain")
+
 # POST endpoint sends data to the server to create or change state.
 
 @api_router.post("/newgame")
-def new_game():
+def new_game(game_id: str = Query(DEFAULT_GAME_ID)):
     """Resets the game to initial state."""
-    global game # allow modifying the shared game across endpoints
-    game = Game()
-    return GameStateResponse.from_game(game)
+    game = sessions.new_game(game_id)
+    return state_response(game)
 
 @api_router.post("/place")
-def place_bug(request: PlaceBugRequest):
+def place_bug(request: PlaceBugRequest, game_id: str = Query(DEFAULT_GAME_ID)):
     """Places a bug on the board."""
+    game = sessions.get(game_id)
     bug_type = BugType(request.bug_type)
     pos = Position(request.q, request.r)
-    game.place_bug(bug_type, pos)
-    return GameStateResponse.from_game(game)
+    if game.place_bug(bug_type, pos):
+        record_turn(game)
+        sessions.save(game_id, game)
+    return state_response(game)
 
 @api_router.post("/move")
-def move_bug(request: MoveBugRequest):
+def move_bug(request: MoveBugRequest, game_id: str = Query(DEFAULT_GAME_ID)):
     """Moves a bug from one position to another."""
+    game = sessions.get(game_id)
     from_pos = Position(request.from_q, request.from_r)
     to_pos = Position(request.to_q, request.to_r)
-    game.move_bug(from_pos, to_pos)
-    return GameStateResponse.from_game(game)
+    if game.move_bug(from_pos, to_pos):
+        record_turn(game)
+        sessions.save(game_id, game)
+    return state_response(game)
 
 @api_router.post("/pass")
-def pass_turn():
+def pass_turn(game_id: str = Query(DEFAULT_GAME_ID)):
     """Forces the current player to pass if no valid move/place."""
-    game.force_pass()
-    return GameStateResponse.from_game(game)
+    game = sessions.get(game_id)
+    if game.force_pass():
+        record_turn(game)
+        sessions.save(game_id, game)
+    return state_response(game)
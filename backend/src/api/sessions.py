@@ -0,0 +1,100 @@
+"""In-memory game sessions, optionally persisted to SQLite across restarts."""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from hive.game import Game
+from hive.storage import GameStore
+
+# Session used by clients that do not pass a game id
+DEFAULT_GAME_ID = "default"
+# Default maximum number of games held in memory; the least recently used is evicted first
+DEFAULT_MAX_GAMES = 10_000
+# Default seconds without a request after which a game is evicted from memory
+DEFAULT_IDLE_SECONDS = 60 * 60
+# Set HIVE_MAX_SESSIONS / HIVE_SESSION_IDLE_SECONDS to change the limits above
+MAX_GAMES_ENV = "HIVE_MAX_SESSIONS"
+IDLE_SECONDS_ENV = "HIVE_SESSION_IDLE_SECONDS"
+
+
+class SessionManager:
+    """
+    Keeps active games in memory by id, restoring them lazily from an optional store.
+
+    At most max_games games are held, and games idle for longer than idle_seconds
+    are dropped. Evicted games are saved to the store, so they are restored on
+    their next request; without a store they are lost.
+    """
+
+    def __init__(self, store: GameStore | None = None, max_games: int = DEFAULT_MAX_GAMES,
+                 idle_seconds: float = DEFAULT_IDLE_SECONDS):
+        self.store = store
+        self.max_games = max_games
+        self.idle_seconds = idle_seconds
+        self.evictions = 0
+        # Games with the time of their last request, least recently used first
+        self._games: OrderedDict[str, tuple[Game, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of games currently held in memory."""
+        return len(self._games)
+
+    def get(self, game_id: str) -> Game:
+        """Returns the game for an id, restoring it from the store or starting a new one."""
+        with self._lock:
+            entry = self._games.get(game_id)
+            if entry is not None:
+                self._touch(game_id, entry[0], time.monotonic())
+                return entry[0]
+
+        # Restoring replays the game, so it runs unlocked; if another request
+        # restored the same game meanwhile, its copy is kept
+        game = (self.store.load(game_id) if self.store else None) or Game()
+        with self._lock:
+            entry = self._games.get(game_id)
+            if entry is not None:
+                game = entry[0]
+            self._touch(game_id, game, time.monotonic())
+            return game
+
+    def new_game(self, game_id: str) -> Game:
+        """Replaces the game for an id with a new game."""
+        game = Game()
+        with self._lock:
+            self._touch(game_id, game, time.monotonic())
+        self.save(game_id, game)
+        return game
+
+    def save(self, game_id: str, game: Game) -> None:
+        """Queues the game for a write-behind save, if a store is configured."""
+        if self.store:
+            self.store.save(game_id, game)
+
+    def close(self) -> None:
+        """Flushes and closes the store, if one is configured."""
+        if self.store:
+            self.store.close()
+
+    def _touch(self, game_id: str, game: Game, now: float) -> None:
+        """Marks a game as just used, then evicts idle and excess games (lock held)."""
+        self._games[game_id] = (game, now)
+        self._games.move_to_end(game_id)
+        while self._games:
+            oldest_id, (oldest, last_used) = next(iter(self._games.items()))
+            if len(self._games) <= self.max_games and now - last_used <= self.idle_seconds:
+                break
+            del self._games[oldest_id]
+            self.evictions += 1
+            self.save(oldest_id, oldest)
+
+
+# Set HIVE_DB_PATH to persist games to a SQLite file, otherwise games live in memory only
+_db_path = os.environ.get("HIVE_DB_PATH")
+sessions = SessionManager(
+    GameStore(_db_path) if _db_path else None,
+    max_games=int(os.environ.get(MAX_GAMES_ENV, DEFAULT_MAX_GAMES)),
+    idle_seconds=float(os.environ.get(IDLE_SECONDS_ENV, DEFAULT_IDLE_SECONDS)),
+)
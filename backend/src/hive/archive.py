@@ -0,0 +1,128 @@
+"""Append-only, memory-mapped archive of recorded games with an offset index."""
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+
+from hive.game import Game
+
+# Data file layout: MAGIC, then one record per game: payload length (u32) + payload,
+# where the payload is the game's UHP move strings joined by MOVE_SEPARATOR (UTF-8).
+# Index file layout: one u64 offset per game, pointing at the start of its record.
+MAGIC = b"HIVEARC1"
+MOVE_SEPARATOR = b";"
+INDEX_SUFFIX = ".idx"
+_LENGTH = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+
+
+class ArchiveWriter:
+    """Appends games to an archive, creating its data and index files if needed."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data = open(path, "ab")
+        self._index = open(path + INDEX_SUFFIX, "ab")
+        if self._data.tell() == 0:
+            self._data.write(MAGIC)
+
+    def __enter__(self) -> "ArchiveWriter":
+        """Returns the writer for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Closes the writer when leaving the context."""
+        self.close()
+
+    def append(self, moves: Iterable[str]) -> None:
+        """Appends one game given as UHP move strings."""
+        payload = MOVE_SEPARATOR.join(move.encode() for move in moves)
+        offset = self._data.tell()
+        self._data.write(_LENGTH.pack(len(payload)))
+        self._data.write(payload)
+        self._index.write(_OFFSET.pack(offset))
+
+    def append_game(self, game: Game) -> None:
+        """Appends a game's move log."""
+        self.append(game.move_log)
+
+    def close(self) -> None:
+        """Flushes and closes the archive files."""
+        self._data.close()
+        self._index.close()
+
+
+class GameArchive:
+    """
+    Read-only, memory-mapped view of an archive.
+
+    Games are located through the offset index, so any game's moves can be read
+    without scanning or loading the archive; raw() returns a zero-copy view.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._data = self._map(path)
+        self._index = self._map(path + INDEX_SUFFIX)
+        if self._data is not None and self._data[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Not a Hive game archive: {path}")
+
+    @staticmethod
+    def _map(path: str) -> mmap.mmap | None:
+        """Memory-maps a file read-only, or returns None if it is empty."""
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return None
+        with open(path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> "GameArchive":
+        """Returns the archive for use as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Closes the archive when leaving the context."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Returns the number of games in the archive."""
+        return len(self._index) // _OFFSET.size if self._index is not None else 0
+
+    def __iter__(self) -> Iterator[list[str]]:
+        """Streams the move lists of all games in archive order."""
+        for i in range(len(self)):
+            yield self.moves(i)
+
+    def raw(self, i: int) -> memoryview:
+        """
+        Returns a zero-copy view of a game's encoded moves.
+
+        Release the view before closing the archive.
+
+        Raises:
+            IndexError: If there is no game at index i.
+        """
+        if not 0 <= i < len(self):
+            raise IndexError(f"Game index {i} out of range")
+
+        (offset,) = _OFFSET.unpack_from(self._index, i * _OFFSET.size)
+        (length,) = _LENGTH.unpack_from(self._data, offset)
+        start = offset + _LENGTH.size
+        return memoryview(self._data)[start:start + length]
+
+    def moves(self, i: int) -> list[str]:
+        """Returns a game's UHP move strings."""
+        with self.raw(i) as view:
+            payload = bytes(view)
+        return payload.decode().split(MOVE_SEPARATOR.decode()) if payload else []
+
+    def game(self, i: int) -> Game:
+        """Reconstructs a game's final position by replaying its moves."""
+        return Game.from_moves(self.moves(i))
+
+    def close(self) -> None:
+        """Unmaps the archive files."""
+        for mapped in (self._data, self._index):
+            if mapped is not None:
+                mapped.close()
+        self._data = self._index = None
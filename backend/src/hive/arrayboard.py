@@ -0,0 +1,123 @@
+"""
+Board backed by NumPy arrays of stack heights and top pieces, for vectorized queries.
+
+Requires the optional numpy dependency (``pip install hive[numpy]``).
+"""
+import numpy as np
+
+from hive.board import Board
+from hive.encoding import BUG_TYPES
+from hive.models.bug import Bug
+from hive.models.player import COLORS, Player
+from hive.models.position import Position, get_neighbors
+
+# Initial side length of the (q, r) window; it doubles while the hive spans over half of it
+INITIAL_WINDOW = 16
+# Empty cells kept between any bug and the window edge, so its neighbors (and theirs)
+# are always inside and candidate cells never sit on the edge
+EDGE_MARGIN = 2
+# Array value of an empty cell's top owner/type
+EMPTY = -1
+
+_BUG_INDEX = {bug_type: i for i, bug_type in enumerate(BUG_TYPES)}
+_COLOR_INDEX = {color: i for i, color in enumerate(COLORS)}
+
+
+class ArrayBoard(Board):
+    """
+    A Board that mirrors every stack into NumPy arrays over a re-centered window.
+
+    The Bug stacks and the scalar interface (get_stack, get_top_bug, is_occupied)
+    are inherited unchanged, so RuleEngine and the behaviors run as on a Board.
+    The arrays hold each cell's stack height and top owner/type, indexed
+    [q - origin.q, r - origin.r], and back whole-board queries such as
+    placeable_positions, which become a handful of array operations.
+    """
+
+    def __init__(self, window: int = INITIAL_WINDOW):
+        super().__init__()
+        self.origin = Position(-(window // 2), -(window // 2))
+        self._allocate(window)
+
+    @property
+    def window(self) -> int:
+        """Returns the side length of the array window."""
+        return self.heights.shape[0]
+
+    def to_index(self, pos: Position) -> tuple[int, int]:
+        """Returns the array indices of a board position."""
+        return pos.q - self.origin.q, pos.r - self.origin.r
+
+    def to_position(self, q: int, r: int) -> Position:
+        """Returns the board position at the given array indices."""
+        return Position(self.origin.q + int(q), self.origin.r + int(r))
+
+    def _drop_bug(self, bug: Bug, position: Position) -> None:
+        """Places a bug and records the new top of its stack in the arrays."""
+        super()._drop_bug(bug, position)
+        self._ensure_fits(position)
+        self._sync_cell(position)
+
+    def _remove_top_bug(self, position: Position) -> Bug | None:
+        """Removes the top bug and records the new top of its stack in the arrays."""
+        bug = super()._remove_top_bug(position)
+        if bug is not None:
+            self._sync_cell(position)
+        return bug
+
+    def _sync_cell(self, position: Position) -> None:
+        """Copies a stack's height and top piece into the arrays."""
+        q, r = self.to_index(position)
+        stack = self.get_stack(position)
+        self.heights[q, r] = len(stack)
+        if stack:
+            self.top_owner[q, r] = _COLOR_INDEX[stack[-1].owner.color]
+            self.top_type[q, r] = _BUG_INDEX[stack[-1].bug_type]
+        else:
+            self.top_owner[q, r] = self.top_type[q, r] = EMPTY
+
+    def _ensure_fits(self, position: Position) -> None:
+        """Re-centers (and if needed grows) the window when a position nears its edges."""
+        q, r = self.to_index(position)
+        low, high = EDGE_MARGIN, self.window - 1 - EDGE_MARGIN
+        if not (low <= q <= high and low <= r <= high):
+            self._recenter()
+
+    def _recenter(self) -> None:
+        """Centers the window on the occupied positions, doubling it until they fill half."""
+        occupied = list(self.occupied_positions())
+        min_q, max_q = min(p.q for p in occupied), max(p.q for p in occupied)
+        min_r, max_r = min(p.r for p in occupied), max(p.r for p in occupied)
+        span = max(max_q - min_q, max_r - min_r) + 1 + 2 * EDGE_MARGIN
+        window = self.window
+        while span > window // 2:
+            window *= 2
+
+        center_q, center_r = (min_q + max_q) // 2, (min_r + max_r) // 2
+        self.origin = Position(center_q - window // 2, center_r - window // 2)
+        self._allocate(window)
+        for pos in occupied:
+            self._sync_cell(pos)
+
+    def _allocate(self, window: int) -> None:
+        """Creates empty arrays for a window of the given size."""
+        self.heights = np.zeros((window, window), dtype=np.int8)
+        self.top_owner = np.full((window, window), EMPTY, dtype=np.int8)
+        self.top_type = np.full((window, window), EMPTY, dtype=np.int8)
+
+    def placeable_positions(self, player: Player) -> set[Position]:
+        """Returns the empty positions touching the player's stacks and no opponent's stacks."""
+        color = _COLOR_INDEX[player.color]
+        own = _touching(self.top_owner == color)
+        other = _touching(self.top_owner == 1 - color)
+        qs, rs = np.nonzero((self.heights[1:-1, 1:-1] == 0) & own & ~other)
+        return {self.to_position(q + 1, r + 1) for q, r in zip(qs, rs, strict=True)}
+
+
+def _touching(cells: np.ndarray) -> np.ndarray:
+    """Marks the interior cells (all but the edge) that neighbor a set cell, via offset slices."""
+    width = cells.shape[0]
+    touching = np.zeros((width - 2, width - 2), dtype=bool)
+    for nbor in get_neighbors(0, 0):
+        touching |= cells[1 + nbor.q:width - 1 + nbor.q, 1 + nbor.r:width - 1 + nbor.r]
+    return touching
@@ -1,7 +1,10 @@
+import weakref
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterator, KeysView
 
+from hive.bugcache import BugMoveCache
 from hive.models.bug import Bug
+from hive.models.player import Player
 from hive.models.position import Position
 from hive.rules import RuleEngine
 
@@ -17,19 +20,61 @@ class Board:
     def __init__(self):
         # Using defaultdict to automatically initialize empty lists for positions
         self._grid: dict[Position, list[Bug]] = defaultdict(list)
+        # Reference counts of occupied positions covering each visible position (itself or nbor)
+        self._visible: dict[Position, int] = {}
+        # Number of bug drops and removals made on this board
+        self.revision = 0
+        # Move caches notified of every changed position (see BugMoveCache)
+        self._watchers: weakref.WeakSet[BugMoveCache] = weakref.WeakSet()
+        # Per-bug valid moves, invalidated by the changes near each bug
+        self.move_cache = BugMoveCache(self)
+
+    def watch(self, cache: BugMoveCache) -> None:
+        """Registers a move cache to be told of every position changed from now on."""
+        self._watchers.add(cache)
+
+    def _changed(self, position: Position) -> None:
+        """Records a drop or removal at a position and tells the watching caches."""
+        self.revision += 1
+        for cache in self._watchers:
+            cache.mark_dirty(position)
 
     def _remove_top_bug(self, position: Position) -> Bug | None:
         """Removes and returns the top bug at a given position."""
         stack = self._grid.get(position)
         if stack:
-            return stack.pop()
+            bug = stack.pop()
+            self._changed(position)
+            if not stack:
+                self._release_visible(position)
+            return bug
         return None
 
     def _drop_bug(self, bug: Bug, position: Position) -> None:
         """Unconditionally places a bug on the stack at the given position."""
+        stack = self._grid[position]
+        if not stack:
+            self._claim_visible(position)
         bug.position = position
-        bug.height = len(self._grid[position])
-        self._grid[position].append(bug)
+        bug.height = len(stack)
+        stack.append(bug)
+        self._changed(position)
+
+    def _claim_visible(self, position: Position) -> None:
+        """Counts a newly occupied position towards itself and its neighbors."""
+        visible = self._visible
+        for pos in (position, *position.neighbors()):
+            visible[pos] = visible.get(pos, 0) + 1
+
+    def _release_visible(self, position: Position) -> None:
+        """Drops a vacated position's count from itself and its neighbors."""
+        visible = self._visible
+        for pos in (position, *position.neighbors()):
+            count = visible[pos] - 1
+            if count:
+                visible[pos] = count
+            else:
+                del visible[pos]
 
     def get_stack(self, position: Position) -> list[Bug]:
         """Returns the bug stack at a given position."""
@@ -48,6 +93,29 @@ class Board:
         """Returns all positions that have at least one bug."""
         return (pos for pos, stack in self._grid.items() if stack)
 
+    def visible_positions(self) -> KeysView[Position]:
+        """Returns all positions that are occupied or adjacent to an occupied position."""
+        return self._visible.keys()
+
+    def placeable_positions(self, player: Player) -> set[Position]:
+        """Returns the empty positions touching the player's stacks and no opponent's stacks."""
+        positions = set()
+        seen = set()
+        for bug in player.placed:
+            if not RuleEngine.is_on_top(self, bug):
+                continue
+
+            for pos in bug.position.neighbors():
+                if self.is_occupied(pos) or pos in seen:
+                    continue
+                seen.add(pos)
+                nbor_bugs = [self.get_top_bug(n) for n in pos.neighbors() if self.is_occupied(n)]
+
+                if nbor_bugs and all(b.owner == player for b in nbor_bugs if b is not None):
+                    positions.add(pos)
+
+        return positions
+
     def place_bug(self, bug: Bug, pos: Position,
                   valid_places: set[Position] | None = None) -> bool:
         """
@@ -0,0 +1,143 @@
+"""Per-bug valid move caches, invalidated only by board changes near each bug."""
+from concurrent.futures import Executor
+
+from hive.models.bug import Bug
+from hive.models.bugtype import BugType
+from hive.models.player import Player
+from hive.models.position import Position
+from hive.parallel import MIN_PARALLEL_BUGS, bug_moves
+from hive.rules import RuleEngine
+
+# Distance from a bug within which a changed position can alter its moves.
+# Queen/beetle destinations are adjacent and checked against their own neighbors (2);
+# spider paths reach 3 steps and each step checks its neighbors (4).
+# Ants slide anywhere, so their radius applies around every reachable position.
+# Grasshoppers are affected by changes anywhere on their 6 lines.
+DIRTY_RADIUS: dict[BugType, int] = {
+    BugType.QUEEN_BEE: 2,
+    BugType.BEETLE: 2,
+    BugType.SPIDER: 4,
+    BugType.ANT: 2,
+}
+
+
+def is_affected(bug: Bug, moves: list[Position], changed: Position) -> bool:
+    """Returns True if a change at the given position can alter the bug's cached moves."""
+    if bug.bug_type == BugType.GRASSHOPPER:
+        dq = changed.q - bug.position.q
+        dr = changed.r - bug.position.r
+        return dq == 0 or dr == 0 or dq == -dr
+
+    radius = DIRTY_RADIUS[bug.bug_type]
+    if bug.position.distance(changed) <= radius:
+        return True
+    # The ant's search expands from every destination it reaches
+    return bug.bug_type == BugType.ANT and any(d.distance(changed) <= radius for d in moves)
+
+
+class BugMoveCache:
+    """
+    Caches each bug's valid moves on a board between turns.
+
+    After every change to the board, only the bugs whose movement neighborhood
+    contains a changed position are recomputed. Whether a bug is pinned by the
+    one hive rule is global, so it is derived once per change from the hive's
+    articulation points rather than cached per bug.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[Bug, list[Position]] = {}
+        # Positions changed since the last sync; a board's existing bugs count as changed
+        self._dirty: set[Position] = set(board.occupied_positions())
+        self._connected = True
+        self._pinned: set[Position] = set()
+        board.watch(self)
+
+    def mark_dirty(self, position: Position) -> None:
+        """Records a position changed on the board, to be handled by the next sync."""
+        self._dirty.add(position)
+
+    def _sync(self) -> None:
+        """Drops the entries affected by board changes since the last sync."""
+        if not self._dirty:
+            return
+
+        changed, self._dirty = self._dirty, set()
+        self._entries = {
+            bug: moves for bug, moves in self._entries.items()
+            if not any(is_affected(bug, moves, pos) for pos in changed)
+        }
+        self._connected = RuleEngine.is_hive_connected(self.board)
+        self._pinned = RuleEngine.articulation_points(self.board) if self._connected else set()
+
+    def valid_moves(self, bug: Bug) -> list[Position]:
+        """Returns the valid moves of a placed bug on top of its stack."""
+        self._sync()
+        # A split hive (only reachable by editing the board directly) has no articulation
+        # structure to rely on, so fall back to the bug's own one hive check
+        if not self._connected:
+            return bug.get_valid_moves(self.board)
+
+        if self._is_pinned(bug):
+            return []
+
+        moves = self._entries.get(bug)
+        if moves is None:
+            self.misses += 1
+            moves = self._entries[bug] = bug.get_valid_moves(self.board)
+        else:
+            self.hits += 1
+        return list(moves)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics, as for a new cache on the board."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+        # Forget the hive structure too, so the next sync recomputes the pinned bugs
+        self._dirty = set(self.board.occupied_positions())
+        self._connected = True
+        self._pinned = set()
+
+    def _is_pinned(self, bug: Bug) -> bool:
+        """Returns True if moving the bug would split the hive."""
+        return bug.position in self._pinned and len(self.board.get_stack(bug.position)) == 1
+
+    def _fill(self, bugs: list[Bug], executor: Executor) -> dict[Bug, list[Position]]:
+        """Computes and caches the missing entries of the given bugs on the executor's threads."""
+        self._sync()
+        if not self._connected:
+            return {}
+
+        missing = [bug for bug in bugs if bug not in self._entries and not self._is_pinned(bug)]
+        if len(missing) < MIN_PARALLEL_BUGS:
+            return {}
+
+        self.misses += len(missing)
+        fresh = dict(zip(missing, bug_moves(missing, self.board, executor), strict=True))
+        self._entries.update(fresh)
+        return fresh
+
+    def get_valid_moves(self, player: Player,
+                        executor: Executor | None = None) -> dict[Bug, list[Position]]:
+        """
+        Returns the same result as RuleEngine.get_valid_moves, reusing cached moves.
+
+        If an executor is given and enough bugs need recomputing, they are
+        computed on its threads over a frozen copy of the board.
+        """
+        if not player.has_placed_queen:
+            return {}
+
+        bugs = [bug for bug in player.placed if RuleEngine.is_on_top(self.board, bug)]
+        fresh = self._fill(bugs, executor) if executor is not None else {}
+
+        moves = {}
+        for bug in bugs:
+            valid = list(fresh[bug]) if bug in fresh else self.valid_moves(bug)
+            if valid:
+                moves[bug] = valid
+
+        return moves
@@ -0,0 +1,153 @@
+"""
+Fixed-shape NumPy encodings of positions for batch evaluation and ML models.
+
+Requires the optional numpy dependency (``pip install hive[numpy]``).
+"""
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from hive.models.bugtype import BugType
+from hive.models.player import COLORS
+from hive.models.position import Position, get_neighbors
+from hive.rules import RuleEngine
+
+if TYPE_CHECKING:
+    from hive.game import Game
+
+# Side length of the square (q, r) window; fits a 22-bug line plus a ring of empty cells
+WINDOW_SIZE = 25
+# Bug types in plane/reserve order
+BUG_TYPES = tuple(BugType)
+
+# Plane layout: one-hot top piece per (owner, bug type), then the feature planes below
+TOP_PIECE_PLANES = 0
+HEIGHT_PLANE = TOP_PIECE_PLANES + len(COLORS) * len(BUG_TYPES)  # Number of bugs in the stack
+QUEEN_PLANES = HEIGHT_PLANE + 1  # One per owner, marking its queen anywhere in a stack
+PINNED_PLANE = QUEEN_PLANES + len(COLORS)  # Ground bugs the one hive rule keeps in place
+NUM_PLANES = PINNED_PLANE + 1
+
+_BUG_INDEX = {bug_type: i for i, bug_type in enumerate(BUG_TYPES)}
+_COLOR_INDEX = {color: i for i, color in enumerate(COLORS)}
+
+
+@dataclass(frozen=True)
+class EncodedBatch:
+    """
+    A batch of encoded positions.
+
+    Attributes:
+        planes: uint8 array (N, NUM_PLANES, WINDOW_SIZE, WINDOW_SIZE) indexed [.., q, r].
+        reserves: uint8 array (N, 2, 5) of unplaced bugs per owner and bug type.
+        to_move: uint8 array (N,) of the owner index of the player to move.
+        origins: int32 array (N, 2) of the board (q, r) at window index (0, 0).
+    """
+
+    planes: np.ndarray
+    reserves: np.ndarray
+    to_move: np.ndarray
+    origins: np.ndarray
+
+    def __len__(self) -> int:
+        """Returns the number of positions in the batch."""
+        return len(self.planes)
+
+    def to_board(self, i: int, q: int, r: int) -> Position:
+        """Maps window indices of position i back to a board position."""
+        origin_q, origin_r = self.origins[i]
+        return Position(int(origin_q) + q, int(origin_r) + r)
+
+
+def window_origin(positions: Sequence[Position]) -> tuple[int, int]:
+    """
+    Returns the board (q, r) placed at window index (0, 0) to center the positions.
+
+    Raises:
+        ValueError: If the positions do not fit in the window.
+    """
+    if not positions:
+        return -(WINDOW_SIZE // 2), -(WINDOW_SIZE // 2)
+
+    qs = [pos.q for pos in positions]
+    rs = [pos.r for pos in positions]
+    if max(qs) - min(qs) >= WINDOW_SIZE or max(rs) - min(rs) >= WINDOW_SIZE:
+        raise ValueError(f"Hive does not fit in a {WINDOW_SIZE}x{WINDOW_SIZE} window")
+
+    return ((min(qs) + max(qs)) // 2 - WINDOW_SIZE // 2,
+            (min(rs) + max(rs)) // 2 - WINDOW_SIZE // 2)
+
+
+def neighbor_counts(cells: np.ndarray) -> np.ndarray:
+    """Counts, for every (q, r) of a (..., W, W) array, the set cells among its 6 neighbors."""
+    width = cells.shape[-1]
+    padded = np.pad(cells.astype(np.int32), [(0, 0)] * (cells.ndim - 2) + [(1, 1), (1, 1)])
+    counts = np.zeros(cells.shape, dtype=np.int32)
+    for nbor in get_neighbors(0, 0):
+        counts += padded[..., 1 + nbor.q:1 + nbor.q + width, 1 + nbor.r:1 + nbor.r + width]
+    return counts
+
+
+def encode_batch(games: Sequence["Game"]) -> EncodedBatch:
+    """
+    Encodes many games at once.
+
+    Each board is walked once to collect (position, plane, q, r, value) indices,
+    which are then written into the batch arrays with one vectorized scatter.
+
+    Args:
+        games (Sequence[Game]): The positions to encode.
+
+    Returns:
+        EncodedBatch: The encoded positions, in input order.
+
+    Raises:
+        ValueError: If a hive does not fit in the window.
+    """
+    count = len(games)
+    planes = np.zeros((count, NUM_PLANES, WINDOW_SIZE, WINDOW_SIZE), dtype=np.uint8)
+    reserves = np.zeros((count, len(COLORS), len(BUG_TYPES)), dtype=np.uint8)
+    to_move = np.zeros(count, dtype=np.uint8)
+    origins = np.zeros((count, 2), dtype=np.int32)
+
+    index, plane, qs, rs, values = [], [], [], [], []
+    for i, game in enumerate(games):
+        board = game.board
+        occupied = list(board.occupied_positions())
+        origin_q, origin_r = origins[i] = window_origin(occupied)
+        pinned = RuleEngine.articulation_points(board)
+
+        for pos in occupied:
+            stack = board.get_stack(pos)
+            q, r = pos.q - origin_q, pos.r - origin_r
+            top = stack[-1]
+            cells = [
+                (TOP_PIECE_PLANES + _COLOR_INDEX[top.owner.color] * len(BUG_TYPES)
+                 + _BUG_INDEX[top.bug_type], 1),
+                (HEIGHT_PLANE, len(stack)),
+            ]
+            cells.extend((QUEEN_PLANES + _COLOR_INDEX[bug.owner.color], 1)
+                         for bug in stack if bug.bug_type == BugType.QUEEN_BEE)
+            if pos in pinned and len(stack) == 1:
+                cells.append((PINNED_PLANE, 1))
+
+            for cell_plane, value in cells:
+                index.append(i)
+                plane.append(cell_plane)
+                qs.append(q)
+                rs.append(r)
+                values.append(value)
+
+        for player in (game.player_white, game.player_black):
+            for bug_type in player.reserve:
+                reserves[i, _COLOR_INDEX[player.color], _BUG_INDEX[bug_type]] += 1
+        to_move[i] = _COLOR_INDEX[game.cur_player.color]
+
+    planes[index, plane, qs, rs] = values
+    return EncodedBatch(planes, reserves, to_move, origins)
+
+
+def encode_game(game: "Game") -> EncodedBatch:
+    """Encodes a single game as a batch of one."""
+    return encode_batch([game])
@@ -0,0 +1,129 @@
+"""
+Heuristic position evaluation, for single games and vectorized over encoded batches.
+
+evaluate() is the pure-Python reference; evaluate_batch() computes the same
+scores over an EncodedBatch and requires the optional numpy dependency.
+"""
+from typing import TYPE_CHECKING
+
+from hive.models.bugtype import BugType
+from hive.models.player import COLORS
+from hive.models.position import get_neighbors
+from hive.rules import RuleEngine
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only evaluate_batch needs it
+    np = None
+
+if TYPE_CHECKING:
+    from hive.encoding import EncodedBatch
+    from hive.game import Game
+
+# Weight of each feature, counted per owner and scored as own minus opponent's:
+# empty cells around the queen, top bugs free to move, ground bugs pinned by
+# the one hive rule, unplaced bugs, and own beetles on top of the enemy queen
+WEIGHTS: dict[str, float] = {
+    "queen_liberties": 3.0,
+    "mobile": 1.0,
+    "pinned": -1.0,
+    "reserve": 0.5,
+    "beetle_on_queen": 4.0,
+}
+FEATURES = tuple(WEIGHTS)
+
+
+def position_features(game: "Game") -> dict[str, tuple[int, int]]:
+    """Returns each feature's (white, black) values for a game."""
+    board = game.board
+    pinned = RuleEngine.articulation_points(board)
+    features = {name: [0, 0] for name in FEATURES}
+
+    for owner, player in enumerate((game.player_white, game.player_black)):
+        queen = player.queen_bug
+        if queen is not None:
+            features["queen_liberties"][owner] = sum(
+                not board.is_occupied(nbor) for nbor in queen.position.neighbors())
+        features["reserve"][owner] = len(player.reserve)
+
+    for pos in board.occupied_positions():
+        stack = board.get_stack(pos)
+        top = stack[-1]
+        owner = COLORS.index(top.owner.color)
+        if pos in pinned and len(stack) == 1:
+            features["pinned"][owner] += 1
+        else:
+            features["mobile"][owner] += 1
+        if top.bug_type == BugType.BEETLE and any(
+                bug.bug_type == BugType.QUEEN_BEE and bug.owner != top.owner for bug in stack):
+            features["beetle_on_queen"][owner] += 1
+
+    return {name: (white, black) for name, (white, black) in features.items()}
+
+
+def evaluate(game: "Game") -> float:
+    """
+    Scores a game from the point of view of the player to move.
+
+    Positive scores favor the player to move. This is a static heuristic:
+    finished games are scored like any other position.
+    """
+    me = COLORS.index(game.cur_player.color)
+    return sum(WEIGHTS[name] * (values[me] - values[1 - me])
+               for name, values in position_features(game).items())
+
+
+def batch_features(batch: "EncodedBatch") -> "np.ndarray":
+    """
+    Computes position_features for every position of a batch at once.
+
+    Returns:
+        np.ndarray: int32 array (N, len(FEATURES), 2) of (white, black) feature values.
+    """
+    # Imported here so evaluate() works without numpy installed
+    from hive.encoding import (
+        BUG_TYPES,
+        HEIGHT_PLANE,
+        PINNED_PLANE,
+        QUEEN_PLANES,
+        TOP_PIECE_PLANES,
+        neighbor_counts,
+    )
+
+    planes = batch.planes.astype(np.int32)
+    types = len(BUG_TYPES)
+    beetle = BUG_TYPES.index(BugType.BEETLE)
+    pinned = planes[:, PINNED_PLANE]
+    empty_nbors = len(get_neighbors(0, 0)) - neighbor_counts(planes[:, HEIGHT_PLANE] > 0)
+
+    values = np.zeros((len(batch), len(FEATURES), 2), dtype=np.int32)
+    for owner in range(len(COLORS)):
+        tops = planes[:, TOP_PIECE_PLANES + owner * types:TOP_PIECE_PLANES + (owner + 1) * types]
+        own_top = tops.sum(axis=1)
+        enemy_queen = planes[:, QUEEN_PLANES + 1 - owner]
+        per_position = {
+            "queen_liberties": planes[:, QUEEN_PLANES + owner] * empty_nbors,
+            "mobile": own_top * (1 - pinned),
+            "pinned": own_top * pinned,
+            "beetle_on_queen": tops[:, beetle] * enemy_queen,
+        }
+        for i, name in enumerate(FEATURES):
+            if name == "reserve":
+                values[:, i, owner] = batch.reserves[:, owner].sum(axis=1)
+            else:
+                values[:, i, owner] = per_position[name].sum(axis=(1, 2))
+    return values
+
+
+def evaluate_batch(batch: "EncodedBatch") -> "np.ndarray":
+    """
+    Scores every position of a batch, matching evaluate() on each game.
+
+    Returns:
+        np.ndarray: float64 array (N,) of scores for the player to move.
+    """
+    values = batch_features(batch)
+    me = batch.to_move.astype(np.intp)
+    rows = np.arange(len(batch))
+    diff = values[rows, :, me] - values[rows, :, 1 - me]
+    return diff @ np.array([WEIGHTS[name] for name in FEATURES])
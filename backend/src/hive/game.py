@@ -1,11 +1,27 @@
+import time
+from collections.abc import Iterable, KeysView
 from enum import Enum
 
 from hive.board import Board
+from hive.history import GameHistory
 from hive.models.bug import Bug
 from hive.models.bugtype import BugType
 from hive.models.player import Player
 from hive.models.position import Position
+from hive.movecache import move_cache
+from hive.notation import (
+    Move,
+    describe_move,
+    move_target,
+    next_piece_name,
+    parse_move,
+    piece_name,
+)
+from hive.openings import get_opening_book
+from hive.parallel import get_executor
 from hive.rules import RuleEngine
+from hive.snapshot import GameSnapshot, PlacedBug
+from hive.symmetry import canonicalize
 
 
 class Phase(Enum):
@@ -29,8 +45,11 @@ class Game:
     queen placement timing, and win condition detection.
     """
 
-    def __init__(self):
-        self.board = Board()
+    def __init__(self, board: Board | None = None, use_move_cache: bool = True):
+        self.board = board if board is not None else Board()  # Must be empty, e.g. an ArrayBoard
+        # False for internal games (e.g. building the opening book) that must not
+        # read or fill the shared move cache with positions no player reached
+        self.use_move_cache = use_move_cache
         self.player_white = Player("WHITE")
         self.player_black = Player("BLACK")
         self.cur_player = self.player_white
@@ -41,7 +60,125 @@ class Game:
         self.valid_moves = RuleEngine.get_valid_moves(self.board, self.cur_player)
         self.cur_player_passed = False
         self.prev_player_passed = False
-        self.all_bugs = set()
+        self.all_bugs: list[Bug] = []
+        self.version = 0  # Incremented on every state change, used to key serialization caches
+        self.history = GameHistory()  # UHP move log with periodic checkpoints
+        self._pieces: dict[str, Bug] = {}  # Placed bugs by UHP piece name (e.g. "wA1")
+        self.movegen_seconds = 0.0  # Time taken to compute the current valid actions
+
+    @classmethod
+    def from_moves(cls, moves: Iterable[str], board: Board | None = None) -> "Game":
+        """
+        Rebuilds a game by replaying a log of UHP move strings.
+
+        The moves are trusted to be legal (e.g. from a previous move_log), so the
+        valid moves/placements are only computed once, for the final position.
+        Use play() to validate each move instead.
+
+        Args:
+            moves (Iterable[str]): The UHP move strings to replay.
+            board (Board | None): An empty board to play on, e.g. an ArrayBoard.
+
+        Raises:
+            ValueError: If a move string is malformed or names an unplaced reference piece.
+        """
+        game = cls(board)
+        game.replay(moves)
+        return game
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot, board: Board | None = None,
+                      use_move_cache: bool = True) -> "Game":
+        """Rebuilds a game from a snapshot on an empty board, without any move history."""
+        game = cls._restore_snapshot(snapshot, board, use_move_cache)
+        game.likely_valid_positions, game.valid_moves = game._compute_valid_actions()
+        return game
+
+    @classmethod
+    def _restore_snapshot(cls, snapshot: GameSnapshot, board: Board | None,
+                          use_move_cache: bool) -> "Game":
+        """Sets up a snapshot's position, leaving its valid actions to the caller."""
+        game = cls(board, use_move_cache=use_move_cache)
+        colors = {game.player_white.color: game.player_white,
+                  game.player_black.color: game.player_black}
+
+        # Place bugs in each player's placement order, then stack them bottom-up
+        placed = []
+        for player, bugs in ((game.player_white, snapshot.white_placed),
+                             (game.player_black, snapshot.black_placed)):
+            for bug_type, q, r, height in bugs:
+                bug = Bug(bug_type, player)
+                bug.on_place()
+                game._register_bug(bug)
+                placed.append((height, Position(q, r), bug))
+        for _, pos, bug in sorted(placed, key=lambda entry: entry[0]):
+            game.board._drop_bug(bug, pos)
+
+        game.cur_player = colors[snapshot.cur_color]
+        game.phase = snapshot.phase
+        game.cur_player_passed = snapshot.cur_player_passed
+        game.prev_player_passed = snapshot.prev_player_passed
+        game.winner = colors.get(snapshot.winner_color)
+        game.draw = snapshot.draw
+        return game
+
+    @classmethod
+    def from_history(cls, history: GameHistory, board: Board | None = None,
+                     use_move_cache: bool = True) -> "Game":
+        """
+        Rebuilds a game from its history on an empty board, starting at the latest checkpoint.
+
+        Only the moves after that checkpoint are replayed (trusted, as in replay()),
+        and the valid actions are only computed for the final position.
+        """
+        start, snapshot = history.nearest_checkpoint(history.ply)
+        if snapshot is None:
+            game = cls(board, use_move_cache)
+        elif start < history.ply:
+            game = cls._restore_snapshot(snapshot, board, use_move_cache)
+        else:
+            game = cls.from_snapshot(snapshot, board, use_move_cache)
+        game.history = history.prefix(start)
+        game.replay(history.moves[start:])
+        return game
+
+    @property
+    def move_log(self) -> list[str]:
+        """Returns the append-only log of UHP move strings."""
+        return self.history.moves
+
+    def snapshot(self) -> GameSnapshot:
+        """Returns an immutable snapshot of the full game position."""
+        def placed(player: Player) -> tuple[PlacedBug, ...]:
+            return tuple((b.bug_type, b.position.q, b.position.r, b.height) for b in player.placed)
+
+        return GameSnapshot(
+            white_placed=placed(self.player_white),
+            black_placed=placed(self.player_black),
+            cur_color=self.cur_player.color,
+            phase=self.phase,
+            cur_player_passed=self.cur_player_passed,
+            prev_player_passed=self.prev_player_passed,
+            winner_color=self.winner.color if self.winner else None,
+            draw=self.draw,
+        )
+
+    def at_ply(self, ply: int) -> "Game":
+        """
+        Returns a new game at the position after the first ply moves of this game.
+
+        Starts from the nearest checkpoint, so at most one checkpoint interval is replayed.
+        The new game uses a board of the same type as this one (e.g. an ArrayBoard), and
+        stays out of the shared move cache since it only shows a past position.
+
+        Raises:
+            ValueError: If ply is outside the game's move history.
+        """
+        if not 0 <= ply <= self.history.ply:
+            raise ValueError(f"Ply {ply} is outside the game history (0-{self.history.ply})")
+
+        return Game.from_history(self.history.prefix(ply), type(self.board)(),
+                                 use_move_cache=False)
 
     @property
     def opponent_player(self) -> Player:
@@ -49,14 +186,9 @@ class Game:
         return self.player_black if self.cur_player == self.player_white else self.player_white
 
     @property
-    def visible_positions(self) -> set[Position]:
+    def visible_positions(self) -> KeysView[Position]:
         """Returns all board positions with bugs or adjacent to bugs."""
-        visible = set()
-        for bug in self.all_bugs:
-            pos = bug.position
-            visible.add(pos)
-            visible.update(pos.neighbors())
-        return visible
+        return self.board.visible_positions()
 
     def valid_positions(self, bug_type: BugType) -> set[Position]:
         """Valid placement positions, considering queen placement rules."""
@@ -113,6 +245,9 @@ class Game:
         if not self.board.place_bug(bug, pos, self.likely_valid_positions):
             return False
 
+        self._register_bug(bug)
+        self.move_log.append(str(describe_move(self.board, bug)))
+
         # Update game phase if both queens placed
         if bug_type == BugType.QUEEN_BEE:
             if self.opponent_player.has_placed_queen:
@@ -143,6 +278,7 @@ class Game:
         if not self.board.move_bug(bug, to_pos, self.valid_moves):
             return False
 
+        self.move_log.append(str(describe_move(self.board, bug)))
         self.switch_turn()
         return True
 
@@ -152,28 +288,152 @@ class Game:
             return False
 
         if self.cur_player_passed:
+            self.move_log.append(str(Move()))
             self.switch_turn()
             return True
         else:
             return False
 
+    def play(self, move_str: str) -> bool:
+        """
+        Plays a UHP move string (placement, movement, or pass) for the current player.
+
+        Returns:
+            bool: True on success, False on invalid move.
+
+        Raises:
+            ValueError: If the move string is malformed.
+        """
+        move = parse_move(move_str)
+        if move.is_pass:
+            return self.force_pass()
+
+        to_pos = self._move_target(move)
+        if move.color != self.cur_player.color or to_pos is None:
+            return False
+
+        # Already placed pieces move, otherwise it must be the next unplaced piece of its type
+        bug = self._pieces.get(move.piece)
+        if bug is not None:
+            if self.board.get_top_bug(bug.position) is not bug:
+                return False
+            return self.move_bug(bug.position, to_pos)
+
+        if move.piece != next_piece_name(self.cur_player, move.bug_type):
+            return False
+        return self.place_bug(move.bug_type, to_pos)
+
+    def replay(self, moves: Iterable[str]) -> None:
+        """
+        Applies trusted UHP move strings without validating or generating moves per turn.
+
+        Only the final position gets its valid moves/placements and end conditions computed.
+
+        Raises:
+            ValueError: If a move string is malformed or names an unplaced reference piece.
+        """
+        replayed = False
+        for move_str in moves:
+            move = parse_move(move_str)
+            replayed = True
+
+            # A player only passes when they have no other action, so the pass flags
+            # follow from the log and checkpoints stay exact without move generation
+            self.cur_player_passed = move.is_pass
+            self.history.checkpoint(self)
+
+            if not move.is_pass:
+                self._apply_trusted(move)
+            self.move_log.append(str(move))
+            self.prev_player_passed = move.is_pass
+            self.cur_player = self.opponent_player
+
+        if replayed:
+            self._update_turn_state()
+
+    def _move_target(self, move: Move) -> Position | None:
+        """Returns the destination of a move, or None if its reference piece is not placed."""
+        if move.reference is None:
+            return move_target(move, None)
+
+        reference = self._pieces.get(move.reference)
+        if reference is None:
+            return None
+        return move_target(move, reference.position)
+
+    def _apply_trusted(self, move: Move) -> None:
+        """Places or moves the piece named by a move without checking legality."""
+        to_pos = self._move_target(move)
+        if to_pos is None:
+            raise ValueError(f"unknown reference piece {move.reference}")
+
+        bug = self._pieces.get(move.piece)
+        if bug is not None:
+            self.board._remove_top_bug(bug.position)
+            self.board._drop_bug(bug, to_pos)
+            return
+
+        bug = Bug(move.bug_type, self.cur_player)
+        bug.on_place()
+        self.board._drop_bug(bug, to_pos)
+        self._register_bug(bug)
+
+        if move.bug_type == BugType.QUEEN_BEE and self.opponent_player.has_placed_queen:
+            self.phase = Phase.PLACE_MOVE
+
+    def _register_bug(self, bug: Bug) -> None:
+        """Tracks a newly placed bug, including by its piece name."""
+        self.all_bugs.append(bug)
+        self._pieces[piece_name(bug)] = bug
+
     def switch_turn(self) -> None:
         """Switches to the next player's turn and checks for game end conditions."""
         if self.phase == Phase.GAME_OVER:
             return
 
-        # Update the game state
         self.cur_player = self.opponent_player
-        self.likely_valid_positions = RuleEngine.get_all_valid_places(self.board, self.cur_player)
-        self.valid_moves = RuleEngine.get_valid_moves(self.board, self.cur_player)
+        self._update_turn_state()
+
+    def _update_turn_state(self) -> None:
+        """Recomputes the current player's valid actions, pass flags, and end conditions."""
+        self.version += 1
+        start = time.perf_counter()
+        self.likely_valid_positions, self.valid_moves = self._compute_valid_actions()
+        self.movegen_seconds = time.perf_counter() - start
         self.prev_player_passed = self.cur_player_passed
         self.cur_player_passed = self._can_player_pass()
-        self.all_bugs = self.get_all_bugs()
 
         # Check if the game has ended
         if self._check_game_end():
             self.phase = Phase.GAME_OVER
-            return
+
+        self.history.checkpoint(self)
+
+    def _compute_valid_actions(self) -> tuple[set[Position], dict[Bug, list[Position]]]:
+        """
+        Returns the current player's valid placements and moves.
+
+        Positions in the opening book or the shared move cache are looked up by
+        canonical form; others are computed by the rule engine and cached.
+        """
+        # Canonicalizing takes 12 symmetry transforms and a sort, so only do it
+        # when the book covers this ply or the shared cache is in use
+        book = get_opening_book()
+        use_shared = self.use_move_cache and move_cache.max_bytes > 0
+        form = None
+        if use_shared or len(self.all_bugs) <= book.max_plies:
+            form = canonicalize(self.board)
+            actions = book.lookup(self, form)
+            if actions is None and use_shared:
+                actions = move_cache.lookup(self, form)
+            if actions is not None:
+                return actions
+
+        actions = (RuleEngine.get_all_valid_places(self.board, self.cur_player),
+                   self.board.move_cache.get_valid_moves(self.cur_player, get_executor()))
+        if form is not None and use_shared:
+            move_cache.store(self, form, actions)
+        return actions
 
     def _can_player_pass(self) -> bool:
         """Checks if the current player has no valid move or placement."""
@@ -0,0 +1,57 @@
+"""Move history with periodic position checkpoints for fast access to any ply."""
+from typing import TYPE_CHECKING
+
+from hive.snapshot import GameSnapshot
+
+if TYPE_CHECKING:
+    from hive.game import Game
+
+# Number of plies between stored checkpoints
+CHECKPOINT_INTERVAL = 8
+
+
+class GameHistory:
+    """
+    Append-only UHP move log with a binary-encoded snapshot every few plies.
+
+    Restoring any ply replays at most CHECKPOINT_INTERVAL moves on top of
+    the nearest earlier checkpoint instead of the whole game.
+    """
+
+    def __init__(self, interval: int = CHECKPOINT_INTERVAL):
+        self.interval = interval
+        self.moves: list[str] = []
+        self.checkpoints: dict[int, bytes] = {}
+
+    @property
+    def ply(self) -> int:
+        """Returns the number of moves played so far."""
+        return len(self.moves)
+
+    def checkpoint(self, game: "Game") -> None:
+        """Stores a snapshot of the game if the current ply is a checkpoint ply."""
+        ply = self.ply
+        if ply and ply % self.interval == 0 and ply not in self.checkpoints:
+            self.checkpoints[ply] = game.snapshot().to_bytes()
+
+    def nearest_checkpoint(self, ply: int) -> tuple[int, GameSnapshot | None]:
+        """
+        Returns the latest checkpoint at or before the given ply.
+
+        Returns:
+            tuple[int, GameSnapshot | None]: The checkpoint ply and its snapshot,
+            or (0, None) when replay must start from a new game.
+        """
+        start = ply - ply % self.interval
+        while start > 0:
+            if start in self.checkpoints:
+                return start, GameSnapshot.from_bytes(self.checkpoints[start])
+            start -= self.interval
+        return 0, None
+
+    def prefix(self, ply: int) -> "GameHistory":
+        """Returns a copy of the history truncated to its first ply moves."""
+        history = GameHistory(self.interval)
+        history.moves = self.moves[:ply]
+        history.checkpoints = {p: s for p, s in self.checkpoints.items() if p <= ply}
+        return history
@@ -0,0 +1,164 @@
+"""Streaming bulk importer for recorded games in UHP move-list form."""
+import argparse
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+
+from hive.archive import ArchiveWriter
+from hive.game import Game
+
+# Number of games validated and written together
+BATCH_SIZE = 1000
+# Maximum number of rejected games kept for reporting
+MAX_REPORTED_ERRORS = 100
+
+# Receives each batch of accepted games as lists of UHP move strings
+GameSink = Callable[[list[list[str]]], None]
+
+
+@dataclass
+class ImportStats:
+    """Running totals of a bulk import."""
+
+    accepted: int = 0
+    rejected: int = 0
+    moves: int = 0
+    seconds: float = 0.0
+    errors: list[tuple[int, str]] = field(default_factory=list)  # (game number, reason)
+
+    @property
+    def games(self) -> int:
+        """Returns the number of games read."""
+        return self.accepted + self.rejected
+
+    @property
+    def games_per_second(self) -> float:
+        """Returns the import throughput in games per second."""
+        return self.games / self.seconds if self.seconds else 0.0
+
+
+def read_game_records(lines: Iterable[str]) -> Iterator[list[str]]:
+    """
+    Yields one game's move strings per non-empty line, skipping ``#`` comments.
+
+    Accepts UHP GameStrings (``Base;InProgress;White[3];wS1;bG1 -wS1``)
+    and bare move lists separated by ``;`` (``wS1;bG1 -wS1``).
+    """
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        fields = [f.strip() for f in line.split(";")]
+        # Drop the GameTypeString, GameStateString, and TurnString of a UHP GameString
+        if fields[0].startswith("Base"):
+            fields = fields[3:]
+        yield [f for f in fields if f]
+
+
+def validate_game(moves: list[str]) -> tuple[list[str] | None, str | None]:
+    """
+    Plays a game's moves through Game.play, which enforces every rule.
+
+    Returns:
+        tuple[list[str] | None, str | None]: The normalized move log and None if every
+        move was legal, otherwise None and the reason the game was rejected.
+    """
+    # Imported positions are not being played, so they stay out of the shared move cache
+    game = Game(use_move_cache=False)
+    for ply, move in enumerate(moves, start=1):
+        try:
+            legal = game.play(move)
+        except ValueError as err:
+            return None, f"ply {ply}: {err}"
+        if not legal:
+            return None, f"ply {ply}: illegal move {move!r}"
+    return game.move_log, None
+
+
+def validate_batch(batch: list[list[str]]) -> list[tuple[list[str] | None, str | None]]:
+    """Validates a batch of games; runs in worker processes when importing in parallel."""
+    return [validate_game(moves) for moves in batch]
+
+
+def import_games(records: Iterable[list[str]], sink: GameSink,
+                 batch_size: int = BATCH_SIZE, workers: int = 1) -> ImportStats:
+    """
+    Validates games and writes accepted ones to a sink in batches.
+
+    Records are consumed lazily and at most two batches per worker are in flight,
+    so memory stays bounded regardless of input size. Illegal games are counted
+    and reported without stopping the import.
+
+    Args:
+        records (Iterable[list[str]]): Games as lists of UHP move strings.
+        sink (GameSink): Receives each batch of accepted, normalized games in input order.
+        batch_size (int): Number of games per batch.
+        workers (int): Number of validating processes; 1 validates in-process.
+
+    Returns:
+        ImportStats: Totals and the first rejected games.
+    """
+    stats = ImportStats()
+    start = time.perf_counter()
+    records = iter(records)
+    batches = iter(lambda: list(islice(records, batch_size)), [])
+
+    def collect(results: list[tuple[list[str] | None, str | None]]) -> None:
+        accepted = []
+        for moves, error in results:
+            if error is None:
+                accepted.append(moves)
+                stats.moves += len(moves)
+                stats.accepted += 1
+            else:
+                stats.rejected += 1
+                if len(stats.errors) < MAX_REPORTED_ERRORS:
+                    stats.errors.append((stats.games, error))
+        if accepted:
+            sink(accepted)
+
+    if workers <= 1:
+        for batch in batches:
+            collect(validate_batch(batch))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            in_flight: deque[Future] = deque()
+            for batch in batches:
+                in_flight.append(executor.submit(validate_batch, batch))
+                if len(in_flight) >= 2 * workers:
+                    collect(in_flight.popleft().result())
+            while in_flight:
+                collect(in_flight.popleft().result())
+
+    stats.seconds = time.perf_counter() - start
+    return stats
+
+
+def main() -> None:
+    """Imports a file of recorded games into a game archive."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("source", help="file with one UHP game per line")
+    parser.add_argument("archive", help="archive file to append accepted games to")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    with open(args.source) as source, ArchiveWriter(args.archive) as writer:
+        def sink(games: list[list[str]]) -> None:
+            for moves in games:
+                writer.append(moves)
+
+        stats = import_games(read_game_records(source), sink, args.batch_size, args.workers)
+
+    print(f"Imported {stats.accepted}/{stats.games} games ({stats.moves} moves) "
+          f"in {stats.seconds:.1f}s, {stats.games_per_second:.0f} games/s")
+    for game_number, error in stats.errors:
+        print(f"Rejected game {game_number}: {error}")
+
+
+if __name__ == "__main__":
+    main()
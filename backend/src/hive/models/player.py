@@ -1,5 +1,8 @@
 from hive.models.bugtype import BugType
 
+# Player colors, in the order used to index per-player features and arrays
+COLORS = ("WHITE", "BLACK")
+
 
 class Player:
     """
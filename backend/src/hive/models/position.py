@@ -21,3 +21,9 @@ class Position:
     def neighbors(self) -> list["Position"]:
         """Get the 6 neighbor positions on the hex grid."""
         return get_neighbors(self.q, self.r)
+
+    def distance(self, other: "Position") -> int:
+        """Get the number of hex steps between this position and another."""
+        dq = self.q - other.q
+        dr = self.r - other.r
+        return (abs(dq) + abs(dr) + abs(dq + dr)) // 2
@@ -0,0 +1,125 @@
+"""Process-wide LRU cache of valid actions shared by every game in the process."""
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from hive.models.position import Position
+from hive.openings import (
+    CanonicalMoves,
+    ValidActions,
+    from_canonical_actions,
+    to_canonical_actions,
+)
+from hive.symmetry import CanonicalForm
+
+if TYPE_CHECKING:
+    from hive.game import Game
+
+# Default memory budget of the cached positions, in bytes
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+# Set HIVE_MOVE_CACHE_BYTES to change the memory budget (0 disables the cache)
+MAX_BYTES_ENV = "HIVE_MOVE_CACHE_BYTES"
+# Estimated size of one cached Position, measured with tracemalloc (small coordinates are shared)
+POSITION_BYTES = 96
+# Estimated per-entry overhead: the integer key and its node in the ordered dict
+ENTRY_OVERHEAD_BYTES = 100
+
+
+def entry_size(placements: frozenset[Position], moves: CanonicalMoves) -> int:
+    """Returns the estimated memory used by one cached position's actions, in bytes."""
+    size = ENTRY_OVERHEAD_BYTES + sys.getsizeof(placements) + sys.getsizeof(moves)
+    size += POSITION_BYTES * len(placements)
+    for move in moves:
+        size += sys.getsizeof(move) + sys.getsizeof(move[1]) + POSITION_BYTES * (1 + len(move[1]))
+    return size
+
+
+class MoveCache:
+    """
+    Thread-safe LRU cache from canonical position and side to move to valid actions.
+
+    Actions are stored in the canonical frame, so games reaching the same position
+    up to translation, rotation, or reflection share one entry. Memory is capped
+    by max_bytes, using an estimate of each entry's size; the least recently used
+    positions are evicted first.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.nbytes = 0  # Estimated size of the cached entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[int, tuple[frozenset[Position], CanonicalMoves, int]] = (
+            OrderedDict())
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Returns the number of cached positions."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, game: "Game", form: CanonicalForm) -> ValidActions | None:
+        """
+        Returns the cached valid placements and moves for the game's position.
+
+        Args:
+            game (Game): The position to look up.
+            form (CanonicalForm): The canonical form of the game's board.
+
+        Returns:
+            ValidActions | None: The actions mapped onto the game's board, or None on a miss.
+        """
+        if not form.key or self.max_bytes <= 0:
+            return None
+
+        key = form.side_hash(game.cur_player.color)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+        placements, moves, _ = cached
+        return from_canonical_actions(form, game.board, placements, moves)
+
+    def store(self, game: "Game", form: CanonicalForm, actions: ValidActions) -> None:
+        """Caches the valid placements and moves computed for the game's position."""
+        # The empty board is not translation invariant: the first bug goes at (0, 0)
+        if not form.key or self.max_bytes <= 0:
+            return
+
+        key = form.side_hash(game.cur_player.color)
+        placements, moves = to_canonical_actions(form, *actions)
+        size = entry_size(placements, moves)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            replaced = self._entries.pop(key, None)
+            if replaced is not None:
+                self.nbytes -= replaced[2]
+            self._entries[key] = (placements, moves, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.nbytes -= evicted
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = self.hits = self.misses = self.evictions = 0
+
+
+move_cache = MoveCache(int(os.environ.get(MAX_BYTES_ENV, DEFAULT_MAX_BYTES)))
@@ -0,0 +1,173 @@
+"""Standard Hive (UHP) notation for pieces and moves, such as ``wA1 -bQ``."""
+import re
+from dataclasses import dataclass
+
+from hive.models.bug import Bug
+from hive.models.bugtype import BugType
+from hive.models.player import Player
+from hive.models.position import Position
+
+PASS_MOVE = "pass"
+
+# Single letter used for each bug type in piece names
+BUG_LETTERS: dict[BugType, str] = {
+    BugType.QUEEN_BEE: "Q",
+    BugType.ANT: "A",
+    BugType.BEETLE: "B",
+    BugType.SPIDER: "S",
+    BugType.GRASSHOPPER: "G",
+}
+LETTER_BUGS: dict[str, BugType] = {letter: bug_type for bug_type, letter in BUG_LETTERS.items()}
+
+# Offset of a piece from its reference piece, written as a prefix or suffix on the reference.
+# e.g. "wA1 -bQ" is west of bQ, "wA1 bQ/" is north-east of bQ, "wB1 bQ" is on top of bQ.
+OFFSET_MARKS: dict[tuple[int, int], tuple[str, str]] = {
+    (1, 0): ("", "-"),     # east
+    (1, -1): ("", "/"),    # north-east
+    (0, 1): ("", "\\"),    # south-east
+    (-1, 0): ("-", ""),    # west
+    (-1, 1): ("/", ""),    # south-west
+    (0, -1): ("\\", ""),   # north-west
+}
+MARK_OFFSETS: dict[tuple[str, str], tuple[int, int]] = {
+    marks: offset for offset, marks in OFFSET_MARKS.items()
+}
+
+_PIECE = r"[wb](?:Q|[ABSG][1-9])"
+_MOVE_RE = re.compile(rf"^({_PIECE})(?:\s+([-/\\]?)({_PIECE})([-/\\]?))?$")
+
+
+@dataclass(frozen=True)
+class Move:
+    """
+    A single move in UHP notation.
+
+    A pass has no piece, the first placement has no reference,
+    and a move onto the top of the reference piece has no offset.
+    """
+
+    piece: str | None = None
+    reference: str | None = None
+    offset: tuple[int, int] | None = None
+
+    @property
+    def is_pass(self) -> bool:
+        """Returns True if this move is a pass."""
+        return self.piece is None
+
+    @property
+    def bug_type(self) -> BugType:
+        """Returns the bug type of the moving piece."""
+        return LETTER_BUGS[self.piece[1]]
+
+    @property
+    def color(self) -> str:
+        """Returns the color of the player owning the moving piece."""
+        return "WHITE" if self.piece[0] == "w" else "BLACK"
+
+    def __str__(self) -> str:
+        """Formats the move as a UHP move string."""
+        if self.is_pass:
+            return PASS_MOVE
+        if self.reference is None:
+            return self.piece
+        if self.offset is None:
+            return f"{self.piece} {self.reference}"
+
+        prefix, suffix = OFFSET_MARKS[self.offset]
+        return f"{self.piece} {prefix}{self.reference}{suffix}"
+
+
+def piece_name(bug: Bug) -> str:
+    """
+    Returns the UHP name of a placed bug, e.g. ``wQ`` or ``bA2``.
+
+    Pieces are numbered per color and type in the order they were placed.
+    """
+    placed_before = bug.owner.placed[:bug.owner.placed.index(bug)]
+    number = 1 + sum(1 for b in placed_before if b.bug_type == bug.bug_type)
+    return _format_piece(bug.owner, bug.bug_type, number)
+
+
+def next_piece_name(player: Player, bug_type: BugType) -> str:
+    """Returns the UHP name the player's next placed bug of the given type would get."""
+    number = 1 + sum(1 for b in player.placed if b.bug_type == bug_type)
+    return _format_piece(player, bug_type, number)
+
+
+def _format_piece(player: Player, bug_type: BugType, number: int) -> str:
+    """Formats a piece name from its owner, type, and per-type number (omitted for queens)."""
+    color = player.color[0].lower()
+    letter = BUG_LETTERS[bug_type]
+    if bug_type == BugType.QUEEN_BEE:
+        return f"{color}{letter}"
+    return f"{color}{letter}{number}"
+
+
+def parse_move(text: str) -> Move:
+    """
+    Parses a UHP move string such as ``wS1``, ``bG1 -wS1``, ``wB1 bQ`` or ``pass``.
+
+    Raises:
+        ValueError: If the move string is malformed.
+    """
+    text = text.strip()
+    if text == PASS_MOVE:
+        return Move()
+
+    match = _MOVE_RE.match(text)
+    if not match:
+        raise ValueError(f"Malformed move string: {text!r}")
+
+    piece, prefix, reference, suffix = match.groups()
+    if reference is None:
+        return Move(piece=piece)
+    if not prefix and not suffix:
+        return Move(piece=piece, reference=reference)
+
+    offset = MARK_OFFSETS.get((prefix, suffix))
+    if offset is None:
+        raise ValueError(f"Malformed move string: {text!r}")
+
+    return Move(piece=piece, reference=reference, offset=offset)
+
+
+def describe_move(board, bug: Bug) -> Move:
+    """
+    Describes where a bug now sits relative to the rest of the board.
+
+    Call after the bug was placed or moved. The reference is the bug directly
+    beneath it when stacked, otherwise the top bug of its first occupied neighbor.
+
+    Args:
+        board: The board the bug was placed or moved on.
+        bug (Bug): The bug that was placed or moved.
+
+    Returns:
+        Move: The move that brought the bug to its current position.
+    """
+    name = piece_name(bug)
+    pos = bug.position
+
+    stack = board.get_stack(pos)
+    if len(stack) > 1:
+        return Move(piece=name, reference=piece_name(stack[-2]))
+
+    for nbor in pos.neighbors():
+        ref_bug = board.get_top_bug(nbor)
+        if ref_bug is not None:
+            offset = (pos.q - nbor.q, pos.r - nbor.r)
+            return Move(piece=name, reference=piece_name(ref_bug), offset=offset)
+
+    return Move(piece=name)
+
+
+def move_target(move: Move, reference_pos: Position | None) -> Position:
+    """Returns the destination of a move given the current position of its reference piece."""
+    if reference_pos is None:
+        return Position(0, 0)
+    if move.offset is None:
+        return reference_pos
+
+    dq, dr = move.offset
+    return Position(reference_pos.q + dq, reference_pos.r + dr)
@@ -0,0 +1,227 @@
+"""Opening book of precomputed valid actions for early-game positions."""
+import argparse
+import json
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from hive import evaluation
+from hive.models.position import Position
+from hive.symmetry import CanonicalForm, canonicalize
+
+if TYPE_CHECKING:
+    from hive.game import Game
+    from hive.models.bug import Bug
+
+# Number of plies covered by the default book; each ply multiplies the positions
+DEFAULT_BOOK_PLIES = 3
+# Set HIVE_OPENING_BOOK to a book file written by OpeningBook.save to load it instead
+BOOK_PATH_ENV = "HIVE_OPENING_BOOK"
+
+# Scores a position from the point of view of the player to move
+Evaluator = Callable[["Game"], float]
+# Valid placements and moves, as in Game.likely_valid_positions and Game.valid_moves
+ValidActions = tuple[set[Position], dict["Bug", list[Position]]]
+# Valid moves in a canonical frame: (from, destinations) per movable bug
+CanonicalMoves = tuple[tuple[Position, tuple[Position, ...]], ...]
+
+
+@dataclass(frozen=True)
+class BookEntry:
+    """Valid actions of a position, stored in its canonical frame."""
+
+    placements: frozenset[Position]
+    moves: CanonicalMoves
+    evaluation: float | None = None
+
+
+def to_canonical_actions(
+    form: CanonicalForm, placements: set[Position], moves: dict["Bug", list[Position]],
+) -> tuple[frozenset[Position], CanonicalMoves]:
+    """Maps a board's valid placements and moves into its canonical frame."""
+    to_frame = form.to_canonical
+    return (
+        frozenset(to_frame(p) for p in placements),
+        tuple((to_frame(bug.position), tuple(to_frame(d) for d in dests))
+              for bug, dests in moves.items()),
+    )
+
+
+def from_canonical_actions(form: CanonicalForm, board, placements: frozenset[Position],
+                           moves: CanonicalMoves) -> ValidActions:
+    """Maps canonical valid placements and moves back onto a board with that canonical form."""
+    to_board = form.from_canonical
+    return (
+        {to_board(p) for p in placements},
+        {board.get_top_bug(to_board(src)): [to_board(d) for d in dests] for src, dests in moves},
+    )
+
+
+class OpeningBook:
+    """
+    Valid placements, moves, and optional evaluations keyed by canonical position.
+
+    Positions equal up to symmetry share one entry; lookups map the stored
+    canonical actions back onto the queried board.
+    """
+
+    def __init__(self, max_plies: int = 0):
+        self.max_plies = max_plies
+        self.entries: dict[int, BookEntry] = {}
+
+    def __len__(self) -> int:
+        """Returns the number of distinct positions in the book."""
+        return len(self.entries)
+
+    @classmethod
+    def build(cls, max_plies: int = DEFAULT_BOOK_PLIES,
+              evaluate: Evaluator | None = evaluation.evaluate) -> "OpeningBook":
+        """
+        Enumerates every position reachable within max_plies and records its valid actions.
+
+        Args:
+            max_plies (int): Number of plies from the start to cover.
+            evaluate (Evaluator | None): Scorer stored with each entry, or None to skip.
+
+        Returns:
+            OpeningBook: The populated book.
+        """
+        # Lazy import to break circular dependency
+        from hive.game import Game
+
+        book = cls(max_plies)
+        frontier = [Game(use_move_cache=False)]
+        for ply in range(max_plies + 1):
+            children = []
+            for game in frontier:
+                if not book._add(game, evaluate) or ply == max_plies:
+                    continue
+                children.extend(_successors(game))
+            frontier = children
+        return book
+
+    def _add(self, game: "Game", evaluate: Evaluator | None) -> bool:
+        """Adds a position's valid actions; returns False if it was already in the book."""
+        form = canonicalize(game.board)
+        key = form.side_hash(game.cur_player.color)
+        if key in self.entries:
+            return False
+
+        self.entries[key] = BookEntry(
+            *to_canonical_actions(form, game.likely_valid_positions, game.valid_moves),
+            evaluation=evaluate(game) if evaluate else None,
+        )
+        return True
+
+    def lookup(self, game: "Game", form: CanonicalForm | None = None) -> ValidActions | None:
+        """
+        Returns the valid placements and moves for the game's position, if in the book.
+
+        Args:
+            game (Game): The position to look up.
+            form (CanonicalForm | None): The board's canonical form, if already computed.
+
+        Returns:
+            ValidActions | None: Values matching RuleEngine.get_all_valid_places and
+            RuleEngine.get_valid_moves, or None.
+        """
+        # The empty board is not translation invariant: the first bug goes at (0, 0)
+        if len(game.all_bugs) > self.max_plies or not game.all_bugs:
+            return None
+
+        form = form or canonicalize(game.board)
+        entry = self.entries.get(form.side_hash(game.cur_player.color))
+        if entry is None:
+            return None
+        return from_canonical_actions(form, game.board, entry.placements, entry.moves)
+
+    def evaluation(self, game: "Game") -> float | None:
+        """Returns the stored evaluation of the game's position, if any."""
+        form = canonicalize(game.board)
+        entry = self.entries.get(form.side_hash(game.cur_player.color))
+        return entry.evaluation if entry else None
+
+    def save(self, path: str) -> None:
+        """Writes the book to a JSON file."""
+        def pos_list(positions) -> list[list[int]]:
+            return [[p.q, p.r] for p in positions]
+
+        entries = {
+            str(key): {
+                "placements": pos_list(sorted(entry.placements, key=lambda p: (p.q, p.r))),
+                "moves": [[[src.q, src.r], pos_list(dests)] for src, dests in entry.moves],
+                "evaluation": entry.evaluation,
+            }
+            for key, entry in self.entries.items()
+        }
+        with open(path, "w") as file:
+            json.dump({"max_plies": self.max_plies, "entries": entries}, file)
+
+    @classmethod
+    def load(cls, path: str) -> "OpeningBook":
+        """Reads a book written by save()."""
+        with open(path) as file:
+            data = json.load(file)
+
+        book = cls(data["max_plies"])
+        for key, entry in data["entries"].items():
+            book.entries[int(key)] = BookEntry(
+                placements=frozenset(Position(q, r) for q, r in entry["placements"]),
+                moves=tuple(
+                    (Position(*src), tuple(Position(q, r) for q, r in dests))
+                    for src, dests in entry["moves"]
+                ),
+                evaluation=entry["evaluation"],
+            )
+        return book
+
+
+def _successors(game: "Game") -> list["Game"]:
+    """Returns the games reached by every valid placement and move of the player to move."""
+    # Lazy import to break circular dependency
+    from hive.game import Game
+
+    snapshot = game.snapshot()
+    children = []
+    for bug_type in dict.fromkeys(game.cur_player.reserve):
+        for pos in game.valid_positions(bug_type):
+            child = Game.from_snapshot(snapshot, use_move_cache=False)
+            if child.place_bug(bug_type, pos):
+                children.append(child)
+    for bug, dests in game.valid_moves.items():
+        for dest in dests:
+            child = Game.from_snapshot(snapshot, use_move_cache=False)
+            if child.move_bug(bug.position, dest):
+                children.append(child)
+    return children
+
+
+_book: OpeningBook | None = None
+
+
+def get_opening_book() -> OpeningBook:
+    """Returns the process-wide book, loading or building it on first use."""
+    global _book
+    if _book is None:
+        # Games played while building must not consult the book being built
+        _book = OpeningBook()
+        path = os.environ.get(BOOK_PATH_ENV)
+        _book = OpeningBook.load(path) if path else OpeningBook.build()
+    return _book
+
+
+def main() -> None:
+    """Builds an opening book and writes it to a file for HIVE_OPENING_BOOK."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("path", help="book file to write")
+    parser.add_argument("--plies", type=int, default=DEFAULT_BOOK_PLIES)
+    args = parser.parse_args()
+
+    book = OpeningBook.build(args.plies)
+    book.save(args.path)
+    print(f"Wrote {len(book)} positions covering {args.plies} plies to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,511 @@
+"""
+Differential oracle checking the accelerated move generators against the rule engine.
+
+The reference is RuleEngine.get_all_valid_places and RuleEngine.get_valid_moves
+on a plain Board. Each backend produces the same valid actions another way:
+the actions a Game serves (opening book or per-bug cache), each of those paths
+and the shared move cache on its own, a rotated and translated copy of the position,
+and an ArrayBoard when numpy is installed. Positions come from random self-play,
+optionally fuzzed with bug relocations that ignore the movement rules, and
+every mismatch is shrunk to a short move list that still reproduces it.
+
+enable() also checks every turn of every Game in the process, raising
+OracleMismatchError on the first difference (HIVE_ORACLE does this for the API).
+"""
+import argparse
+import functools
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from hive.game import Game, Phase
+from hive.models.bug import Bug
+from hive.models.bugtype import BugType
+from hive.models.position import Position
+from hive.movecache import MoveCache, ValidActions
+from hive.notation import Move, next_piece_name, parse_move, piece_name
+from hive.openings import get_opening_book
+from hive.rules import RuleEngine
+from hive.snapshot import GameSnapshot
+from hive.symmetry import SYMMETRIES, Symmetry, canonicalize
+
+try:
+    from hive.arrayboard import ArrayBoard
+except ImportError:  # numpy is optional; only the array_board backend needs it
+    ArrayBoard = None
+
+# Set HIVE_ORACLE to a non-empty value to check every turn when the API starts
+ORACLE_ENV = "HIVE_ORACLE"
+
+# Valid actions compared by position: (placements, destinations by bug position)
+Normalized = tuple[frozenset[Position], dict[Position, frozenset[Position]]]
+# Computes a game's valid actions another way, or returns None where it does not apply
+Backend = Callable[[Game], ValidActions | None]
+
+
+def reference_actions(game: Game) -> ValidActions:
+    """Returns the current player's valid placements and moves from the rule engine."""
+    return (RuleEngine.get_all_valid_places(game.board, game.cur_player),
+            RuleEngine.get_valid_moves(game.board, game.cur_player))
+
+
+def normalize(actions: ValidActions) -> Normalized:
+    """Returns actions in a form that compares equal across boards and list orders."""
+    placements, moves = actions
+    return (frozenset(placements),
+            {bug.position: frozenset(dests) for bug, dests in moves.items() if dests})
+
+
+@dataclass
+class Mismatch:
+    """A position where a backend disagrees with (or failed unlike) the reference."""
+
+    backend: str
+    moves: list[str]  # UHP moves reaching the position, replayable with replay_moves
+    expected: Normalized
+    actual: Normalized | None  # None if the backend raised
+    error: str | None = None
+
+    def describe(self) -> str:
+        """Returns a readable report of the differences."""
+        def positions(cells) -> str:
+            return " ".join(f"({p.q},{p.r})" for p in sorted(cells, key=lambda p: (p.q, p.r)))
+
+        lines = [f"{self.backend} differs after {len(self.moves)} moves: {';'.join(self.moves)}"]
+        if self.actual is None:
+            lines.append(f"  raised {self.error}")
+            return "\n".join(lines)
+
+        (expected_places, expected_moves), (actual_places, actual_moves) = (
+            self.expected, self.actual)
+        if expected_places != actual_places:
+            lines.append(f"  placements missing: {positions(expected_places - actual_places)}"
+                         f" extra: {positions(actual_places - expected_places)}")
+        for pos in sorted(expected_moves.keys() | actual_moves.keys(), key=lambda p: (p.q, p.r)):
+            expected = expected_moves.get(pos, frozenset())
+            actual = actual_moves.get(pos, frozenset())
+            if expected != actual:
+                lines.append(f"  moves from ({pos.q},{pos.r}) missing: "
+                             f"{positions(expected - actual)} "
+                             f"extra: {positions(actual - expected)}")
+        return "\n".join(lines)
+
+
+class OracleMismatchError(AssertionError):
+    """Raised by checked games when a backend disagrees with the reference."""
+
+    def __init__(self, mismatch: Mismatch):
+        super().__init__(mismatch.describe())
+        self.mismatch = mismatch
+
+
+# Transformed copy of each game, with the symmetry and offset used, by game version
+_transformed: WeakKeyDictionary[Game, tuple[int, Game, Symmetry, Position]] = WeakKeyDictionary()
+# ArrayBoard game replaying the same moves as each game
+_mirrors: WeakKeyDictionary[Game, Game] = WeakKeyDictionary()
+
+
+def transformed(game: Game) -> tuple[Game, Symmetry, Position]:
+    """
+    Returns a copy of the game rotated/reflected and translated, with the transform used.
+
+    The transform is picked from the number of moves so that checks are repeatable.
+    A position p of the game is at symmetry.apply(p) + offset in the copy.
+    """
+    cached = _transformed.get(game)
+    if cached and cached[0] == game.version:
+        return cached[1:]
+
+    ply = len(game.move_log)
+    symmetry = SYMMETRIES[ply % len(SYMMETRIES)]
+    offset = Position(ply % 5 - 2, 3 - ply % 7)
+
+    def moved(bugs):
+        placed = []
+        for bug_type, q, r, height in bugs:
+            pos = _shift(symmetry.apply(Position(q, r)), offset)
+            placed.append((bug_type, pos.q, pos.r, height))
+        return tuple(placed)
+
+    snapshot = game.snapshot()
+    copy = Game.from_snapshot(GameSnapshot(
+        moved(snapshot.white_placed), moved(snapshot.black_placed), snapshot.cur_color,
+        snapshot.phase, snapshot.cur_player_passed, snapshot.prev_player_passed,
+        snapshot.winner_color, snapshot.draw), use_move_cache=False)
+    _transformed[game] = (game.version, copy, symmetry, offset)
+    return copy, symmetry, offset
+
+
+def _shift(pos: Position, offset: Position) -> Position:
+    """Returns a position translated by an offset."""
+    return Position(pos.q + offset.q, pos.r + offset.r)
+
+
+def _map_actions(actions: ValidActions, board, mapping: Callable[[Position], Position]
+                 ) -> ValidActions:
+    """Maps actions computed on another board onto a board, position by position."""
+    placements, moves = actions
+    return ({mapping(pos) for pos in placements},
+            {board.get_top_bug(mapping(bug.position)): [mapping(d) for d in dests]
+             for bug, dests in moves.items()})
+
+
+def _game_actions(game: Game) -> ValidActions:
+    """Returns the actions the game serves, whichever cache or book they came from."""
+    return game.likely_valid_positions, game.valid_moves
+
+
+def _book_actions(game: Game) -> ValidActions | None:
+    """Returns the opening book's actions, for positions in the book."""
+    return get_opening_book().lookup(game)
+
+
+def _bug_cache_actions(game: Game) -> ValidActions:
+    """Returns the rule engine's placements with the board's per-bug cached moves."""
+    return (RuleEngine.get_all_valid_places(game.board, game.cur_player),
+            game.board.move_cache.get_valid_moves(game.cur_player))
+
+
+def _symmetry_actions(game: Game) -> ValidActions | None:
+    """Returns the rule engine's actions on a transformed copy, mapped back."""
+    if not game.all_bugs:
+        return None  # The first bug goes at (0, 0) whatever the transform
+    copy, symmetry, offset = transformed(game)
+    inverse = symmetry.inverse()
+    return _map_actions(reference_actions(copy), game.board,
+                        lambda pos: inverse.apply(_shift(pos, Position(-offset.q, -offset.r))))
+
+
+def _move_cache_actions(game: Game) -> ValidActions | None:
+    """
+    Returns the actions a move cache serves after caching a transformed copy.
+
+    Raises:
+        LookupError: If the game's position misses the entry of its transformed copy.
+    """
+    if not game.all_bugs:
+        return None
+    copy, _, _ = transformed(game)
+    cache = MoveCache()
+    cache.store(copy, canonicalize(copy.board), reference_actions(copy))
+    actions = cache.lookup(game, canonicalize(game.board))
+    if actions is None:
+        raise LookupError("missed the cached transformed position")
+    return actions
+
+
+def _array_board_actions(game: Game) -> ValidActions:
+    """Returns the rule engine's actions on an ArrayBoard replaying the same moves."""
+    mirror = _mirrors.get(game)
+    if mirror is None or len(mirror.move_log) > len(game.move_log):
+        mirror = _mirrors[game] = Game(ArrayBoard(), use_move_cache=False)
+    mirror.replay(game.move_log[len(mirror.move_log):])
+    return _map_actions(reference_actions(mirror), game.board, lambda pos: pos)
+
+
+# Backends checked by default, by name
+BACKENDS: dict[str, Backend] = {
+    "game": _game_actions,
+    "opening_book": _book_actions,
+    "bug_cache": _bug_cache_actions,
+    "symmetry": _symmetry_actions,
+    "move_cache": _move_cache_actions,
+}
+if ArrayBoard is not None:
+    BACKENDS["array_board"] = _array_board_actions
+
+
+def check(game: Game, backends: dict[str, Backend] | None = None) -> list[Mismatch]:
+    """Returns the backends whose actions differ from the reference on a game's position."""
+    expected = normalize(reference_actions(game))
+    mismatches = []
+    for name, backend in (backends or BACKENDS).items():
+        try:
+            actions = backend(game)
+        except Exception as error:  # noqa: BLE001 - a crashing backend is a mismatch too
+            mismatches.append(Mismatch(name, list(game.move_log), expected, None,
+                                       f"{type(error).__name__}: {error}"))
+            continue
+        if actions is not None and normalize(actions) != expected:
+            mismatches.append(Mismatch(name, list(game.move_log), expected, normalize(actions)))
+    return mismatches
+
+
+def _checked(func: Callable) -> Callable:
+    """Wraps Game._compute_valid_actions to compare its result with the reference."""
+    @functools.wraps(func)
+    def wrapper(game: Game):
+        actions = func(game)
+        expected = normalize(reference_actions(game))
+        if normalize(actions) != expected:
+            raise OracleMismatchError(
+                Mismatch("game", list(game.move_log), expected, normalize(actions)))
+        return actions
+
+    return wrapper
+
+
+_original: Callable | None = None
+
+
+def enable() -> None:
+    """Checks the valid actions of every turn against the reference; does nothing if enabled."""
+    global _original
+    if _original is None:
+        _original = Game._compute_valid_actions
+        Game._compute_valid_actions = _checked(_original)
+
+
+def disable() -> None:
+    """Stops checking turns."""
+    global _original
+    if _original is not None:
+        Game._compute_valid_actions = _original
+        _original = None
+
+
+def is_enabled() -> bool:
+    """Returns True if turns are being checked."""
+    return _original is not None
+
+
+def _sorted_positions(positions) -> list[Position]:
+    """Returns positions in a fixed order, so random choices are repeatable."""
+    return sorted(positions, key=lambda pos: (pos.q, pos.r))
+
+
+def play_random(game: Game, rng: random.Random) -> None:
+    """Plays a random legal action for the current player, or passes if there is none."""
+    actions = [(bug_type, pos) for bug_type in sorted(set(game.cur_player.reserve), key=str)
+               for pos in _sorted_positions(game.valid_positions(bug_type))]
+    actions += [(bug.position, dest) for bug, dests in game.valid_moves.items()
+                for dest in _sorted_positions(dests)]
+    if not actions:
+        game.force_pass()
+        return
+
+    source, dest = rng.choice(actions)
+    if isinstance(source, BugType):
+        game.place_bug(source, dest)
+    else:
+        game.move_bug(source, dest)
+
+
+def random_relocation(game: Game, rng: random.Random) -> str | None:
+    """
+    Returns a move taking a random bug of the current player anywhere, ignoring its movement.
+
+    The hive stays in one piece and only beetles land on other bugs, so the
+    position is well-formed but usually unreachable in play. Returns None if
+    no bug can leave its place.
+    """
+    board = game.board
+    pinned = RuleEngine.articulation_points(board)
+    bugs = [bug for bug in game.cur_player.placed
+            if RuleEngine.is_on_top(board, bug)
+            and not (bug.position in pinned and len(board.get_stack(bug.position)) == 1)]
+    if not bugs:
+        return None
+
+    bug = rng.choice(sorted(bugs, key=piece_name))
+    origin = bug.position
+    occupied = {pos for pos in board.occupied_positions()
+                if pos != origin or len(board.get_stack(pos)) > 1}
+    targets = {nbor for pos in occupied for nbor in pos.neighbors()
+               if nbor not in occupied and nbor != origin}
+    if bug.bug_type == BugType.BEETLE:
+        targets |= occupied - {origin}
+    if not targets:
+        return None
+
+    target = rng.choice(_sorted_positions(targets))
+    return str(_describe_relocation(board, bug, target))
+
+
+def _describe_relocation(board, bug: Bug, target: Position) -> Move:
+    """Returns the UHP move taking a bug to a target, named from the board without the bug."""
+    def top_without_bug(pos: Position) -> Bug | None:
+        stack = board.get_stack(pos)
+        if stack and stack[-1] is bug:
+            return stack[-2] if len(stack) > 1 else None
+        return stack[-1] if stack else None
+
+    below = top_without_bug(target)
+    if below is not None:
+        return Move(piece=piece_name(bug), reference=piece_name(below))
+
+    for nbor in target.neighbors():
+        ref_bug = top_without_bug(nbor)
+        if ref_bug is not None:
+            return Move(piece=piece_name(bug), reference=piece_name(ref_bug),
+                        offset=(target.q - nbor.q, target.r - nbor.r))
+    raise ValueError(f"Relocation target {target} does not touch the hive")
+
+
+def _is_well_formed(game: Game, move: Move) -> bool:
+    """Returns True if a move names the right pieces for the game's position."""
+    if move.is_pass:
+        return True
+
+    names = {piece_name(bug) for bug in game.all_bugs}
+    if move.color != game.cur_player.color:
+        return False
+    if move.piece not in names and move.piece != next_piece_name(game.cur_player, move.bug_type):
+        return False
+    # Only the first piece has no reference
+    if move.reference is None:
+        return not game.all_bugs
+    return move.reference in names
+
+
+def replay_moves(moves: list[str], after_move: Callable[[Game], object] | None = None
+                 ) -> Game | None:
+    """
+    Replays moves one at a time without checking their legality.
+
+    Args:
+        moves (list[str]): The UHP moves to replay.
+        after_move (Callable[[Game], object] | None): Called after every move, e.g. to
+            query a stateful backend at each position as run() does.
+
+    Returns:
+        Game | None: The game after the moves, or None if they do not form a
+        well-formed position: unknown or out of order pieces, a split hive,
+        non-beetles above ground, or moves after the game ended.
+    """
+    game = Game(use_move_cache=False)
+    for move_str in moves:
+        try:
+            move = parse_move(move_str)
+        except ValueError:
+            return None
+        if game.phase == Phase.GAME_OVER or not _is_well_formed(game, move):
+            return None
+
+        game.replay([move_str])
+        if not RuleEngine.is_hive_connected(game.board) or any(
+                bug.height > 0 and bug.bug_type != BugType.BEETLE for bug in game.all_bugs):
+            return None
+        if after_move is not None:
+            after_move(game)
+    return game
+
+
+def shrink(moves: list[str], fails: Callable[[list[str]], bool]) -> list[str]:
+    """
+    Returns a shorter move list that still fails, by removing ever smaller chunks (ddmin).
+
+    Args:
+        moves (list[str]): A move list for which fails() is True.
+        fails (Callable[[list[str]], bool]): Whether a move list reproduces the failure.
+
+    Returns:
+        list[str]: A move list for which fails() is True and no single move can be removed.
+    """
+    chunk = len(moves) // 2
+    while chunk >= 1:
+        start = 0
+        while start < len(moves):
+            candidate = moves[:start] + moves[start + chunk:]
+            if candidate and fails(candidate):
+                moves = candidate
+            else:
+                start += chunk
+        chunk //= 2
+    return moves
+
+
+def shrink_mismatch(mismatch: Mismatch, backends: dict[str, Backend] | None = None
+                    ) -> Mismatch:
+    """
+    Returns the mismatch at the shortest move list found that still reproduces it.
+
+    The backend is queried after every replayed move, as during run(), so that
+    stateful backends such as the per-bug cache see the same history. A mismatch
+    that replaying its moves does not reproduce is returned unchanged.
+    """
+    backend = {mismatch.backend: (backends or BACKENDS)[mismatch.backend]}
+
+    def replay_checked(moves: list[str]) -> list[Mismatch]:
+        positions = []
+        game = replay_moves(moves, lambda game: positions.append(check(game, backend)))
+        return positions[-1] if game is not None else []
+
+    if not replay_checked(mismatch.moves):
+        return mismatch
+    moves = shrink(mismatch.moves, lambda moves: bool(replay_checked(moves)))
+    return replay_checked(moves)[0]
+
+
+@dataclass
+class OracleReport:
+    """The outcome of a run of the oracle."""
+
+    games: int = 0
+    positions: int = 0
+    mismatches: list[Mismatch] | None = None
+
+
+def run(games: int, plies: int, seed: int = 0, fuzz: float = 0.0,
+        backends: dict[str, Backend] | None = None) -> OracleReport:
+    """
+    Checks the backends over random self-play games, shrinking any mismatch found.
+
+    Args:
+        games (int): Number of games to play.
+        plies (int): Maximum number of moves per game.
+        seed (int): Seed of the random moves.
+        fuzz (float): Chance of each move being a random relocation instead of a legal move.
+        backends (dict[str, Backend] | None): Backends to check, by default BACKENDS.
+
+    Returns:
+        OracleReport: The positions checked and the shrunk mismatches, at most one
+        per backend and game.
+    """
+    rng = random.Random(seed)
+    report = OracleReport(mismatches=[])
+    for _ in range(games):
+        report.games += 1
+        game = Game(use_move_cache=False)
+        failed: set[str] = set()
+        for _ in range(plies):
+            if game.phase == Phase.GAME_OVER:
+                break
+            relocation = random_relocation(game, rng) if rng.random() < fuzz else None
+            if relocation is not None:
+                game.replay([relocation])
+            else:
+                play_random(game, rng)
+
+            report.positions += 1
+            for mismatch in check(game, backends):
+                if mismatch.backend not in failed:
+                    failed.add(mismatch.backend)
+                    report.mismatches.append(shrink_mismatch(mismatch, backends))
+    return report
+
+
+def main() -> None:
+    """Checks the accelerated move generators against the rule engine over random games."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--plies", type=int, default=60, help="maximum moves per game")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fuzz", type=float, default=0.2,
+                        help="chance of each move being a random relocation")
+    parser.add_argument("--backends", nargs="+", choices=list(BACKENDS), default=list(BACKENDS))
+    args = parser.parse_args()
+
+    backends = {name: BACKENDS[name] for name in args.backends}
+    report = run(args.games, args.plies, args.seed, args.fuzz, backends)
+    print(f"Checked {report.positions} positions of {report.games} games against "
+          f"{', '.join(backends)}: {len(report.mismatches)} mismatches")
+    for mismatch in report.mismatches:
+        print(mismatch.describe())
+    if report.mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Optional multi-threaded move generation over immutable board snapshots.
+
+Each bug's moves only read the board, so they can be computed on several
+threads at once. Free-threaded Python builds run those threads on separate
+cores; with the GIL they only add overhead, so threads are off unless
+HIVE_MOVEGEN_THREADS asks for them.
+"""
+import contextvars
+import logging
+import os
+import sys
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from hive.models.bug import Bug
+from hive.models.position import Position
+
+logger = logging.getLogger(__name__)
+
+# Set HIVE_MOVEGEN_THREADS to a thread count, or "auto" for one per CPU on free-threaded builds
+THREADS_ENV = "HIVE_MOVEGEN_THREADS"
+# Fewest bugs to compute before fanning out; below it the hand-off costs more than it saves
+MIN_PARALLEL_BUGS = 4
+
+_executor: Executor | None = None
+_configured = False
+_lock = threading.Lock()
+
+
+def is_free_threaded() -> bool:
+    """Returns True if this Python build runs without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def thread_count() -> int:
+    """
+    Returns the number of move generation threads configured, 0 to stay sequential.
+
+    Raises:
+        ValueError: If HIVE_MOVEGEN_THREADS is not a non-negative count or "auto".
+    """
+    value = os.environ.get(THREADS_ENV, "").strip().lower()
+    if value == "auto":
+        return (os.cpu_count() or 1) if is_free_threaded() else 0
+    if not value:
+        return 0
+    if not value.isdigit():
+        raise ValueError(f"{THREADS_ENV} must be a thread count or 'auto', got {value!r}")
+    return int(value)
+
+
+def get_executor() -> Executor | None:
+    """
+    Returns the shared move generation thread pool, or None if threads are off.
+
+    The configuration is read once; an invalid HIVE_MOVEGEN_THREADS is logged
+    and leaves move generation sequential.
+    """
+    global _executor, _configured
+    if not _configured:
+        with _lock:
+            if not _configured:
+                try:
+                    threads = thread_count()
+                except ValueError as error:
+                    logger.warning("Ignoring invalid configuration: %s", error)
+                    threads = 0
+                if threads > 1:
+                    _executor = ThreadPoolExecutor(threads, thread_name_prefix="hive-movegen")
+                _configured = True
+    return _executor
+
+
+class FrozenBoard:
+    """
+    A read-only copy of a board's stacks, safe to share between threads.
+
+    Provides the read methods used by the behaviors and RuleEngine, so moves
+    computed on it match those computed on the board it was taken from.
+    """
+
+    def __init__(self, board):
+        self._grid: dict[Position, tuple[Bug, ...]] = {
+            pos: tuple(board.get_stack(pos)) for pos in board.occupied_positions()}
+
+    def get_stack(self, position: Position) -> tuple[Bug, ...]:
+        """Returns the bug stack at a given position."""
+        return self._grid.get(position, ())
+
+    def get_top_bug(self, position: Position) -> Bug | None:
+        """Returns the top bug at a position, or None if empty."""
+        stack = self._grid.get(position)
+        return stack[-1] if stack else None
+
+    def is_occupied(self, position: Position) -> bool:
+        """Returns True if there is at least one bug at the position."""
+        return position in self._grid
+
+    def occupied_positions(self) -> Iterator[Position]:
+        """Returns all positions that have at least one bug."""
+        return iter(self._grid)
+
+
+def map_in_threads(executor: Executor, func: Callable, items: Iterable) -> list:
+    """
+    Applies a function to items on an executor, returning the results in order.
+
+    Each call runs in a copy of the caller's context, so context variables
+    (such as the game profiling attributes calls to) carry over to the threads.
+    """
+    futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+    return [future.result() for future in futures]
+
+
+def bug_moves(bugs: list[Bug], board, executor: Executor) -> list[list[Position]]:
+    """Computes the valid moves of placed bugs in parallel, on a snapshot of the board."""
+    frozen = FrozenBoard(board)
+    return map_in_threads(executor, lambda bug: bug.get_valid_moves(frozen), bugs)
@@ -0,0 +1,262 @@
+"""
+Opt-in call counting and timing for the rule engine, bug behaviors, and turns.
+
+Profiling works by swapping the instrumented functions for timed wrappers, so
+when it is disabled the original functions run with no overhead at all.
+StackProfiler separately records full call stacks of one thread for flamegraphs.
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+
+from hive.behaviors.ant import AntBehavior
+from hive.behaviors.beetle import BeetleBehavior
+from hive.behaviors.grasshopper import GrasshopperBehavior
+from hive.behaviors.queen import QueenBehavior
+from hive.behaviors.spider import SpiderBehavior
+from hive.game import Game
+from hive.rules import RuleEngine
+
+# Set HIVE_PROFILE to a non-empty value to enable profiling when the API starts
+PROFILE_ENV = "HIVE_PROFILE"
+
+# (owner, attribute) of each instrumented function
+INSTRUMENTED: tuple[tuple[type, str], ...] = (
+    (RuleEngine, "is_one_hive_move"),
+    (RuleEngine, "can_slide_to"),
+    (RuleEngine, "can_climb_to"),
+    (RuleEngine, "dest_is_connected"),
+    (AntBehavior, "get_valid_moves"),
+    (BeetleBehavior, "get_valid_moves"),
+    (GrasshopperBehavior, "get_valid_moves"),
+    (QueenBehavior, "get_valid_moves"),
+    (SpiderBehavior, "get_valid_moves"),
+    (Game, "switch_turn"),
+)
+
+
+@dataclass
+class CallStats:
+    """Call count and inclusive wall time of one instrumented function."""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Returns the average time per call."""
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def add(self, seconds: float) -> None:
+        """Records one call."""
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+
+# Stats keyed by label (e.g. "RuleEngine.can_slide_to")
+Stats = dict[str, CallStats]
+
+_originals: dict[tuple[type, str], object] = {}
+_process_stats: Stats = {}
+_game_stats: WeakKeyDictionary[Game, Stats] = WeakKeyDictionary()
+_lock = threading.Lock()
+# Stats of the game whose turn is being computed in this thread/task, if any
+_current_game: ContextVar[Stats | None] = ContextVar("current_game_stats", default=None)
+
+
+def _record(label: str, seconds: float) -> None:
+    """Adds a call to the process-wide stats and the current game's stats."""
+    game_stats = _current_game.get()
+    with _lock:
+        _process_stats.setdefault(label, CallStats()).add(seconds)
+        if game_stats is not None:
+            game_stats.setdefault(label, CallStats()).add(seconds)
+
+
+def _timed(label: str, func: Callable) -> Callable:
+    """Wraps a function to record its calls under a label."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(label, time.perf_counter() - start)
+
+    return wrapper
+
+
+def _game_scoped(func: Callable) -> Callable:
+    """Wraps a Game method so nested calls are also recorded in that game's stats."""
+    @functools.wraps(func)
+    def wrapper(game: Game, *args, **kwargs):
+        with game_scope(game):
+            return func(game, *args, **kwargs)
+
+    return wrapper
+
+
+def enable() -> None:
+    """Starts counting and timing the instrumented functions; does nothing if enabled."""
+    if _originals:
+        return
+
+    for owner, name in INSTRUMENTED:
+        original = owner.__dict__[name]
+        _originals[owner, name] = original
+        label = f"{owner.__name__}.{name}"
+        if isinstance(original, staticmethod):
+            setattr(owner, name, staticmethod(_timed(label, original.__func__)))
+        elif owner is Game:
+            setattr(owner, name, _game_scoped(_timed(label, original)))
+        else:
+            setattr(owner, name, _timed(label, original))
+
+
+def disable() -> None:
+    """Restores the original functions; collected stats are kept."""
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+    _originals.clear()
+
+
+def is_enabled() -> bool:
+    """Returns True if profiling is enabled."""
+    return bool(_originals)
+
+
+@contextmanager
+def profiled() -> Iterator[None]:
+    """Enables profiling for the duration of a with block."""
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+@contextmanager
+def game_scope(game: Game) -> Iterator[None]:
+    """Attributes the calls made in a with block to a game (switch_turn does this itself)."""
+    with _lock:
+        stats = _game_stats.setdefault(game, {})
+    token = _current_game.set(stats)
+    try:
+        yield
+    finally:
+        _current_game.reset(token)
+
+
+def _copy(stats: Stats) -> Stats:
+    """Returns a snapshot of stats that later calls will not modify."""
+    with _lock:
+        return {label: CallStats(s.count, s.total_seconds, s.max_seconds)
+                for label, s in stats.items()}
+
+
+def process_stats() -> Stats:
+    """Returns the stats of all calls in this process."""
+    return _copy(_process_stats)
+
+
+def game_stats(game: Game) -> Stats:
+    """Returns the stats of the calls attributed to a game."""
+    return _copy(_game_stats.get(game, {}))
+
+
+def reset() -> None:
+    """Clears all collected stats."""
+    with _lock:
+        _process_stats.clear()
+        _game_stats.clear()
+
+
+def format_stats(stats: Stats) -> str:
+    """Formats stats as a table, slowest total time first."""
+    lines = [f"{'function':<36} {'calls':>9} {'total ms':>10} {'mean us':>9} {'max us':>9}"]
+    for label, s in sorted(stats.items(), key=lambda item: -item[1].total_seconds):
+        lines.append(f"{label:<36} {s.count:>9} {s.total_seconds * 1e3:>10.2f} "
+                     f"{s.mean_seconds * 1e6:>9.1f} {s.max_seconds * 1e6:>9.1f}")
+    return "\n".join(lines)
+
+
+class StackProfiler:
+    """
+    Deterministic profiler of the calling thread, recording self time per call stack.
+
+    Use as a context manager around the code to profile; collapsed() returns the
+    stacks in the collapsed format read by flamegraph tools (``a;b;c <weight>``).
+    Tracing every call slows the profiled code severalfold, so use it sparingly.
+    """
+
+    def __init__(self):
+        self.stacks: dict[tuple[str, ...], float] = {}
+        self._stack: list[str] = []
+        self._last = 0.0
+        self._previous = None
+        self._thread: int | None = None  # Thread being traced
+        self._depth = 0  # Nesting of with blocks; only the outermost one traces
+
+    def __enter__(self) -> "StackProfiler":
+        """Starts tracing calls in the current thread."""
+        self._depth += 1
+        if self._depth == 1:
+            self._thread = threading.get_ident()
+            self._previous = sys.getprofile()
+            self._last = time.perf_counter()
+            sys.setprofile(self._trace)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Stops tracing and restores any previous profiler."""
+        self._depth -= 1
+        if self._depth == 0:
+            sys.setprofile(self._previous)
+            # Only this call and setprofile remain; the time charged to them is the profiler's own
+            self.stacks.pop(tuple(self._stack[:-1]), None)
+            self._stack.clear()
+            self._thread = None
+
+    def _trace(self, frame, event: str, arg) -> None:
+        """Handles a profiler event by charging elapsed time to the current stack."""
+        if threading.get_ident() != self._thread:
+            return
+        if event == "call":
+            self._charge(time.perf_counter())
+            code = frame.f_code
+            self._stack.append(f"{os.path.basename(code.co_filename)}:{code.co_qualname}")
+        elif event == "c_call":
+            self._charge(time.perf_counter())
+            self._stack.append(getattr(arg, "__qualname__", repr(arg)))
+        elif event in ("return", "c_return", "c_exception"):
+            self._charge(time.perf_counter())
+            # Frames entered before tracing started return without a matching call
+            if self._stack:
+                self._stack.pop()
+
+    def _charge(self, now: float) -> None:
+        """Adds the time since the last event to the current stack."""
+        if self._stack:
+            key = tuple(self._stack)
+            self.stacks[key] = self.stacks.get(key, 0.0) + now - self._last
+        self._last = now
+
+    def collapsed(self) -> str:
+        """Returns the stacks in collapsed format, weighted by self time in microseconds."""
+        lines = []
+        for stack, seconds in sorted(self.stacks.items()):
+            micros = round(seconds * 1e6)
+            if micros:
+                lines.append(f"{';'.join(stack)} {micros}")
+        return "\n".join(lines) + "\n" if lines else ""
@@ -1,6 +1,9 @@
+from concurrent.futures import Executor
+
 from hive.models.bug import Bug
 from hive.models.player import Player
 from hive.models.position import Position
+from hive.parallel import bug_moves
 
 NUM_BLOCKERS_FOM = 2  # The number of blocking neighbors to restrict sliding
 
@@ -34,22 +37,7 @@ class RuleEngine:
                 return set(only_pos.neighbors())
 
         # Normal case: Must touch own bug(s) only
-        positions = set()
-        seen = set()
-        for bug in player.placed:
-            if not RuleEngine.is_on_top(board, bug):
-                continue
-
-            for pos in bug.position.neighbors():
-                if board.is_occupied(pos) or pos in seen:
-                    continue
-                seen.add(pos)
-                nbor_bugs = [board.get_top_bug(n) for n in pos.neighbors() if board.is_occupied(n)]
-
-                if nbor_bugs and all(b.owner == player for b in nbor_bugs if b is not None):
-                    positions.add(pos)
-
-        return positions
+        return board.placeable_positions(player)
 
     @staticmethod
     def is_on_top(board, bug: Bug) -> bool:
@@ -120,17 +108,14 @@ class RuleEngine:
         if to_pos and not RuleEngine.dest_is_connected(board, from_pos, to_pos):
             return False
 
-        # Temporarily remove top bug
-        # If from_pos still occupied, the hive remains connected
-        removed_bug = board._remove_top_bug(from_pos)
-        if board.is_occupied(from_pos):
-            board._drop_bug(removed_bug, from_pos)
+        # If from_pos stays occupied after lifting its top bug, the hive remains connected
+        if len(board.get_stack(from_pos)) > 1:
             return True
 
         # Otherwise, check if remaining occupied positions are connected
         remaining = set(board.occupied_positions())
+        remaining.discard(from_pos)
         if not remaining:
-            board._drop_bug(removed_bug, from_pos)
             return True
 
         # Start DFS from any remaining position
@@ -145,12 +130,81 @@ class RuleEngine:
                 if nbor in remaining:
                     stack.append(nbor)
 
-        # Restore the removed bug
-        board._drop_bug(removed_bug, from_pos)
-
         # Check if all remaining positions were visited
         return visited == remaining
 
+    @staticmethod
+    def articulation_points(board) -> set[Position]:
+        """
+        Returns the occupied positions whose removal would split the hive.
+
+        A ground bug alone on one of these positions is pinned by the one hive rule.
+        Uses an iterative Tarjan DFS, so all positions are found in one linear pass.
+
+        Args:
+            board: The current board state.
+
+        Returns:
+            set[Position]: The articulation points of the occupied positions.
+        """
+        occupied = set(board.occupied_positions())
+        discovered: dict[Position, int] = {}
+        low: dict[Position, int] = {}
+        points = set()
+
+        for root in occupied:
+            if root in discovered:
+                continue
+            discovered[root] = low[root] = len(discovered)
+            root_children = 0
+            stack = [(root, None, iter(root.neighbors()))]
+
+            while stack:
+                pos, parent, nbors = stack[-1]
+                for nbor in nbors:
+                    if nbor not in occupied or nbor == parent:
+                        continue
+                    if nbor in discovered:
+                        low[pos] = min(low[pos], discovered[nbor])
+                    else:
+                        discovered[nbor] = low[nbor] = len(discovered)
+                        stack.append((nbor, pos, iter(nbor.neighbors())))
+                        break
+                else:
+                    # All neighbors explored: propagate the lowest reachable discovery time
+                    stack.pop()
+                    if parent is None:
+                        continue
+                    low[parent] = min(low[parent], low[pos])
+                    if parent == root:
+                        root_children += 1
+                    elif low[pos] >= discovered[parent]:
+                        points.add(parent)
+
+            # The root splits the hive only if the DFS left it more than once
+            if root_children > 1:
+                points.add(root)
+
+        return points
+
+    @staticmethod
+    def is_hive_connected(board) -> bool:
+        """Returns True if all occupied positions form a single connected hive."""
+        occupied = set(board.occupied_positions())
+        if not occupied:
+            return True
+
+        visited = set()
+        stack = [next(iter(occupied))]
+        while stack:
+            cur_pos = stack.pop()
+            if cur_pos in visited:
+                continue
+            visited.add(cur_pos)
+            stack.extend(nbor for nbor in cur_pos.neighbors() if nbor in occupied)
+
+        return visited == occupied
+
     @staticmethod
     def dest_is_connected(board, from_pos: Position, to_pos: Position) -> bool:
         """Checks if the destination will remain connected to the hive after moving."""
@@ -229,13 +283,16 @@ class RuleEngine:
         return taller_blockers < NUM_BLOCKERS_FOM
 
     @staticmethod
-    def get_valid_moves(board, player: Player) -> dict[Bug, list[Position]]:
+    def get_valid_moves(board, player: Player,
+                        executor: Executor | None = None) -> dict[Bug, list[Position]]:
         """
         Returns a dictionary of player's movable bugs and their legal destination positions.
 
         Args:
             board: The current board state.
             player (Player): The current player.
+            executor (Executor | None): If given, bugs are computed on its threads
+                over a frozen copy of the board (see hive.parallel).
 
         Returns:
             dict[Bug, list[Position]]: Map from bug to valid move positions.
@@ -243,12 +300,14 @@ class RuleEngine:
         if not player.has_placed_queen:
             return {}
 
-        moves = {}
-        for bug in player.placed:
-            if not RuleEngine.is_on_top(board, bug):
-                continue
+        bugs = [bug for bug in player.placed if RuleEngine.is_on_top(board, bug)]
+        if executor is not None:
+            all_valid = bug_moves(bugs, board, executor)
+        else:
+            all_valid = [bug.get_valid_moves(board) for bug in bugs]
 
-            valid = bug.get_valid_moves(board)
+        moves = {}
+        for bug, valid in zip(bugs, all_valid, strict=True):
             if valid:
                 moves[bug] = valid
 
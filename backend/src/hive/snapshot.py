@@ -0,0 +1,139 @@
+"""Game snapshots and their compact binary encoding."""
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from hive.models.bugtype import BugType
+
+if TYPE_CHECKING:
+    from hive.game import Game, Phase
+
+# A placed bug as (bug_type, q, r, height)
+PlacedBug = tuple[BugType, int, int, int]
+
+# Binary layout (little-endian, no padding):
+#   header: format version (u8), flags (u8), white placed count (u8), black placed count (u8)
+#   then one record per placed bug, white then black, each in placement order:
+#   q (i8), r (i8), bug type index (low 3 bits) | stack height << 3 (u8)
+# Reserves are not stored: they are the starting reserve minus the placed bugs.
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<BBBB")
+_BUG = struct.Struct("<bbB")
+
+_BUG_TYPES = list(BugType)
+_PHASE_VALUES = ["Start", "PlaceOrMove", "GameOver"]
+_WINNER_COLORS = [None, "WHITE", "BLACK"]
+
+# Bit layout of the flags byte
+_BLACK_TO_MOVE = 1 << 0
+_CUR_PASSED = 1 << 1
+_PREV_PASSED = 1 << 2
+_DRAW = 1 << 3
+_WINNER_SHIFT = 4  # 2 bits: index into _WINNER_COLORS
+_PHASE_SHIFT = 6  # 2 bits: index into _PHASE_VALUES
+_TYPE_BITS = 3
+
+
+def _decode_index(values: list, index: int, field: str):
+    """
+    Returns values[index] for an index read from encoded data.
+
+    Raises:
+        ValueError: If the index is out of range.
+    """
+    if index >= len(values):
+        raise ValueError(f"Snapshot data has an invalid {field} index: {index}")
+    return values[index]
+
+
+@dataclass(frozen=True)
+class GameSnapshot:
+    """
+    Immutable record of a full game position.
+
+    Placed bugs are kept per player in placement order, which preserves
+    piece numbering (e.g. wA1 vs wA2) when restored.
+    """
+
+    white_placed: tuple[PlacedBug, ...]
+    black_placed: tuple[PlacedBug, ...]
+    cur_color: str
+    phase: "Phase"
+    cur_player_passed: bool
+    prev_player_passed: bool
+    winner_color: str | None
+    draw: bool
+
+    def to_bytes(self) -> bytes:
+        """
+        Encodes the snapshot into its compact binary layout.
+
+        Raises:
+            ValueError: If a coordinate or stack height does not fit the layout.
+        """
+        flags = (
+            (_BLACK_TO_MOVE if self.cur_color == "BLACK" else 0)
+            | (_CUR_PASSED if self.cur_player_passed else 0)
+            | (_PREV_PASSED if self.prev_player_passed else 0)
+            | (_DRAW if self.draw else 0)
+            | _WINNER_COLORS.index(self.winner_color) << _WINNER_SHIFT
+            | _PHASE_VALUES.index(self.phase.value) << _PHASE_SHIFT
+        )
+        parts = [_HEADER.pack(FORMAT_VERSION, flags,
+                              len(self.white_placed), len(self.black_placed))]
+        try:
+            for bug_type, q, r, height in self.white_placed + self.black_placed:
+                parts.append(_BUG.pack(q, r, _BUG_TYPES.index(bug_type) | height << _TYPE_BITS))
+        except struct.error as err:
+            raise ValueError(f"Snapshot does not fit the binary layout: {err}") from err
+
+        return b"".join(parts)
+
+    @staticmethod
+    def from_bytes(data: bytes) -> "GameSnapshot":
+        """
+        Decodes a snapshot from its compact binary layout.
+
+        Raises:
+            ValueError: If the data is not a valid encoded snapshot.
+        """
+        # Lazy import to break circular dependency
+        from hive.game import Phase
+
+        if len(data) < _HEADER.size:
+            raise ValueError("Snapshot data is truncated")
+
+        version, flags, num_white, num_black = _HEADER.unpack_from(data)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version: {version}")
+        if len(data) != _HEADER.size + (num_white + num_black) * _BUG.size:
+            raise ValueError("Snapshot data length does not match its bug counts")
+
+        bugs = []
+        for q, r, packed in _BUG.iter_unpack(data[_HEADER.size:]):
+            bug_type = _decode_index(_BUG_TYPES, packed & ((1 << _TYPE_BITS) - 1), "bug type")
+            bugs.append((bug_type, q, r, packed >> _TYPE_BITS))
+
+        return GameSnapshot(
+            white_placed=tuple(bugs[:num_white]),
+            black_placed=tuple(bugs[num_white:]),
+            cur_color="BLACK" if flags & _BLACK_TO_MOVE else "WHITE",
+            phase=Phase(_decode_index(_PHASE_VALUES, flags >> _PHASE_SHIFT & 0b11, "phase")),
+            cur_player_passed=bool(flags & _CUR_PASSED),
+            prev_player_passed=bool(flags & _PREV_PASSED),
+            winner_color=_decode_index(_WINNER_COLORS, flags >> _WINNER_SHIFT & 0b11, "winner"),
+            draw=bool(flags & _DRAW),
+        )
+
+
+def encode_game(game: "Game") -> bytes:
+    """Encodes the full position of a game into compact bytes."""
+    return game.snapshot().to_bytes()
+
+
+def decode_game(data: bytes) -> "Game":
+    """Decodes a game position from bytes produced by encode_game."""
+    # Lazy import to break circular dependency
+    from hive.game import Game
+
+    return Game.from_snapshot(GameSnapshot.from_bytes(data))
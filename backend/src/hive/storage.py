@@ -0,0 +1,156 @@
+"""SQLite persistence for games with write-behind batching."""
+import logging
+import sqlite3
+import threading
+import time
+
+from hive.game import Game
+from hive.history import GameHistory
+
+logger = logging.getLogger(__name__)
+
+# Separator between UHP move strings in a stored move log (as in UHP game strings)
+MOVE_SEPARATOR = ";"
+
+# Seconds between background flushes of pending writes
+FLUSH_INTERVAL = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    moves TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    game_id TEXT NOT NULL,
+    ply INTEGER NOT NULL,
+    snapshot BLOB NOT NULL,
+    PRIMARY KEY (game_id, ply)
+);
+"""
+
+# A pending write: (move log, checkpoints by ply, time saved)
+PendingGame = tuple[list[str], dict[int, bytes], float]
+
+
+class GameStore:
+    """
+    Persists games to a local SQLite file as move logs plus their checkpoints.
+
+    save() only records the game's latest state in memory; a background thread
+    writes pending games in batched transactions every flush_interval seconds,
+    so callers never wait on disk I/O. load() sees pending writes immediately.
+    """
+
+    def __init__(self, path: str, flush_interval: float = FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._db_lock = threading.Lock()  # Serializes use of the shared connection
+        self._pending: dict[str, PendingGame] = {}
+        self._in_flight: dict[str, PendingGame] = {}  # Batch currently being written
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # Keeps batches written in the order they were taken
+        self._stop = threading.Event()
+        self._writer = threading.Thread(target=self._write_behind, name="game-store", daemon=True)
+        self._writer.start()
+
+    def save(self, game_id: str, game: Game) -> None:
+        """Queues the game's current move log and checkpoints to be written."""
+        history = game.history
+        pending = (list(history.moves), dict(history.checkpoints), time.time())
+        with self._pending_lock:
+            self._pending[game_id] = pending
+
+    def load(self, game_id: str) -> Game | None:
+        """
+        Restores a game from its latest checkpoint plus the moves after it.
+
+        Returns:
+            Game | None: The restored game, or None if the game was never saved.
+        """
+        with self._pending_lock:
+            pending = self._pending.get(game_id) or self._in_flight.get(game_id)
+
+        if pending is not None:
+            moves, checkpoints, _ = pending
+        else:
+            with self._db_lock:
+                row = self._conn.execute(
+                    "SELECT moves FROM games WHERE game_id = ?", (game_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+                checkpoints = dict(self._conn.execute(
+                    "SELECT ply, snapshot FROM checkpoints WHERE game_id = ?", (game_id,)
+                ).fetchall())
+            moves = row[0].split(MOVE_SEPARATOR) if row[0] else []
+
+        history = GameHistory()
+        history.moves = moves
+        history.checkpoints = checkpoints
+        return Game.from_history(history)
+
+    def flush(self) -> int:
+        """
+        Writes all pending games in a single transaction.
+
+        Returns:
+            int: The number of games written.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+                self._in_flight = batch
+            try:
+                if batch:
+                    self._write_batch(batch)
+            finally:
+                with self._pending_lock:
+                    self._in_flight = {}
+            return len(batch)
+
+    def close(self) -> None:
+        """Stops the background writer, flushes pending games, and closes the database."""
+        self._stop.set()
+        self._writer.join()
+        self.flush()
+        self._conn.close()
+
+    def _write_batch(self, batch: dict[str, PendingGame]) -> None:
+        """Writes a batch of pending games, requeueing them if the write fails."""
+        games = [(game_id, MOVE_SEPARATOR.join(moves), saved_at)
+                 for game_id, (moves, _, saved_at) in batch.items()]
+        checkpoints = [(game_id, ply, snapshot)
+                       for game_id, (_, game_checkpoints, _) in batch.items()
+                       for ply, snapshot in game_checkpoints.items()]
+        # Checkpoints past the current ply belong to an earlier game under the same id
+        stale = [(game_id, len(moves)) for game_id, (moves, _, _) in batch.items()]
+        try:
+            with self._db_lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO games (game_id, moves, updated_at) VALUES (?, ?, ?)",
+                    games,
+                )
+                self._conn.executemany(
+                    "DELETE FROM checkpoints WHERE game_id = ? AND ply > ?", stale
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO checkpoints (game_id, ply, snapshot) VALUES (?, ?, ?)",
+                    checkpoints,
+                )
+        except sqlite3.Error:
+            # Requeue the batch unless a newer save superseded it
+            with self._pending_lock:
+                for game_id, pending in batch.items():
+                    self._pending.setdefault(game_id, pending)
+            raise
+
+    def _write_behind(self) -> None:
+        """Background loop flushing pending games until the store is closed."""
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except sqlite3.Error:
+                logger.exception("Failed to write games to %s", self.path)
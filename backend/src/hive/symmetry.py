@@ -0,0 +1,136 @@
+"""Canonical forms of board positions under translation, rotation, and reflection."""
+import hashlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from hive.models.position import Position
+from hive.notation import BUG_LETTERS
+
+if TYPE_CHECKING:
+    from hive.game import Game
+
+# A board cell in canonical form: (q, r, stack of pieces bottom-up such as ("wQ", "bB"))
+CanonicalCell = tuple[int, int, tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class Symmetry:
+    """
+    A rotation and/or reflection of the hex grid about the origin.
+
+    Stored as the integer matrix mapping axial (q, r) to (a*q + b*r, c*q + d*r).
+    """
+
+    a: int
+    b: int
+    c: int
+    d: int
+
+    def apply(self, pos: Position) -> Position:
+        """Maps a position through this symmetry."""
+        return Position(self.a * pos.q + self.b * pos.r, self.c * pos.q + self.d * pos.r)
+
+    def compose(self, other: "Symmetry") -> "Symmetry":
+        """Returns the symmetry applying other first, then this one."""
+        return Symmetry(
+            self.a * other.a + self.b * other.c, self.a * other.b + self.b * other.d,
+            self.c * other.a + self.d * other.c, self.c * other.b + self.d * other.d,
+        )
+
+    def inverse(self) -> "Symmetry":
+        """Returns the symmetry undoing this one (the matrices have determinant +-1)."""
+        det = self.a * self.d - self.b * self.c
+        return Symmetry(self.d * det, -self.b * det, -self.c * det, self.a * det)
+
+
+IDENTITY = Symmetry(1, 0, 0, 1)
+ROTATE_60 = Symmetry(0, -1, 1, 1)  # (q, r) -> (-r, q + r), e.g. east -> south-east
+REFLECT = Symmetry(1, 0, -1, -1)  # (q, r) -> (q, -q - r), a mirror image swapping east/north-east
+
+
+def _all_symmetries() -> tuple[Symmetry, ...]:
+    """Returns the 6 rotations and 6 reflections of the hex grid."""
+    rotations = [IDENTITY]
+    for _ in range(5):
+        rotations.append(ROTATE_60.compose(rotations[-1]))
+    return tuple(rotations + [rotation.compose(REFLECT) for rotation in rotations])
+
+
+SYMMETRIES = _all_symmetries()
+
+
+@dataclass(frozen=True)
+class CanonicalForm:
+    """
+    A board position mapped into its canonical frame.
+
+    Boards equal up to translation, rotation, and reflection share the same key.
+    Positions map into the frame by applying the symmetry, then subtracting the offset.
+    """
+
+    key: tuple[CanonicalCell, ...]
+    symmetry: Symmetry
+    offset: Position
+
+    @property
+    def hash(self) -> int:
+        """Returns a 64-bit hash of the key that is stable across processes."""
+        return stable_hash(self.key)
+
+    def side_hash(self, color: str) -> int:
+        """Returns a hash of the key combined with the color of the player to move."""
+        return stable_hash((self.key, color))
+
+    def to_canonical(self, pos: Position) -> Position:
+        """Maps a board position into the canonical frame."""
+        mapped = self.symmetry.apply(pos)
+        return Position(mapped.q - self.offset.q, mapped.r - self.offset.r)
+
+    def from_canonical(self, pos: Position) -> Position:
+        """Maps a canonical frame position back onto the board."""
+        shifted = Position(pos.q + self.offset.q, pos.r + self.offset.r)
+        return self.symmetry.inverse().apply(shifted)
+
+
+def stable_hash(value: object) -> int:
+    """Returns a 64-bit hash of a value's repr, identical in every process."""
+    digest = hashlib.blake2b(repr(value).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def canonicalize(board) -> CanonicalForm:
+    """
+    Returns the canonical form of a board over all 12 symmetries and translations.
+
+    Each symmetry's image is translated so its smallest (q, r) cell sits at the origin,
+    and the lexicographically smallest resulting cell tuple is the canonical key.
+    """
+    stacks = []
+    for pos in board.occupied_positions():
+        pieces = tuple(bug.owner.color[0].lower() + BUG_LETTERS[bug.bug_type]
+                       for bug in board.get_stack(pos))
+        stacks.append((pos, pieces))
+
+    if not stacks:
+        return CanonicalForm((), IDENTITY, Position(0, 0))
+
+    best = None
+    for symmetry in SYMMETRIES:
+        cells = sorted((mapped.q, mapped.r, pieces)
+                       for mapped, pieces in ((symmetry.apply(p), s) for p, s in stacks))
+        min_q, min_r, _ = cells[0]
+        key = tuple((q - min_q, r - min_r, pieces) for q, r, pieces in cells)
+        if best is None or key < best.key:
+            best = CanonicalForm(key, symmetry, Position(min_q, min_r))
+
+    return best
+
+
+def canonical_hash(board) -> int:
+    """Returns a hash shared by all boards equal up to translation, rotation, and reflection."""
+    return canonicalize(board).hash
+
+
+def position_hash(game: "Game") -> int:
+    """Returns the canonical board hash combined with the player to move."""
+    return canonicalize(game.board).side_hash(game.cur_player.color)
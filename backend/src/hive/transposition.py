@@ -0,0 +1,139 @@
+"""Fixed-capacity transposition table for game-tree searches over Game positions."""
+from dataclasses import dataclass
+from enum import Enum
+
+# Default number of entries; memory use is bounded by this regardless of search length
+DEFAULT_CAPACITY = 1 << 20
+# Entries per bucket: one depth-preferred slot, then one always-replace slot
+BUCKET_SIZE = 2
+
+
+class Bound(Enum):
+    """How a stored score relates to the position's true minimax value."""
+
+    # The score is the exact value of the position
+    EXACT = "Exact"
+    # The search failed high: the true value is at least the score
+    LOWER = "Lower"
+    # The search failed low: the true value is at most the score
+    UPPER = "Upper"
+
+
+@dataclass(frozen=True, slots=True)
+class TTEntry:
+    """The result of searching one position to a given depth."""
+
+    key: int
+    depth: int
+    bound: Bound
+    best_move: str | None  # UHP move string, or None if no move was searched
+    score: float
+    age: int  # Search generation that stored the entry
+
+    def cutoff_score(self, depth: int, alpha: float, beta: float) -> float | None:
+        """
+        Returns the stored score if it settles a search of the given depth and window.
+
+        Args:
+            depth (int): Remaining depth of the search probing the entry.
+            alpha (float): Lower bound of the search window.
+            beta (float): Upper bound of the search window.
+
+        Returns:
+            float | None: The score to return without searching, or None to search.
+        """
+        if self.depth < depth:
+            return None
+        if (self.bound == Bound.EXACT or
+            (self.bound == Bound.LOWER and self.score >= beta) or
+            (self.bound == Bound.UPPER and self.score <= alpha)):
+            return self.score
+        return None
+
+
+class TranspositionTable:
+    """
+    Bounded cache of search results keyed by 64-bit position hashes.
+
+    Keys are typically symmetry.position_hash(game), so positions reached through
+    different move orders (or equal up to symmetry) share an entry. Best moves are
+    hints: verify them against the position's valid actions before playing, since
+    symmetric positions name moves differently and distinct keys may collide.
+
+    Each key maps to a bucket of two slots. The first keeps the deepest result,
+    unless it is from an older search; the second always takes the newest result,
+    so shallow entries near the leaves still get cached.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < BUCKET_SIZE:
+            raise ValueError(f"Capacity must be at least {BUCKET_SIZE}, got {capacity}")
+
+        self._buckets = capacity // BUCKET_SIZE
+        self._slots: list[TTEntry | None] = [None] * (self._buckets * BUCKET_SIZE)
+        self.age = 0
+        self.probes = 0
+        self.hits = 0
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of entries held."""
+        return len(self._slots)
+
+    def __len__(self) -> int:
+        """Returns the number of filled slots."""
+        return sum(entry is not None for entry in self._slots)
+
+    def new_search(self) -> None:
+        """Starts a new search generation, making existing entries replaceable."""
+        self.age += 1
+
+    def clear(self) -> None:
+        """Removes all entries and resets the statistics."""
+        self._slots = [None] * len(self._slots)
+        self.age = self.probes = self.hits = 0
+
+    def probe(self, key: int) -> TTEntry | None:
+        """Returns the stored entry for a position hash, if any."""
+        self.probes += 1
+        start = (key % self._buckets) * BUCKET_SIZE
+        for entry in self._slots[start:start + BUCKET_SIZE]:
+            if entry is not None and entry.key == key:
+                self.hits += 1
+                return entry
+        return None
+
+    def store(self, key: int, depth: int, bound: Bound,
+              best_move: str | None, score: float) -> None:
+        """
+        Records a search result, replacing the least valuable entry in its bucket.
+
+        Args:
+            key (int): Position hash.
+            depth (int): Remaining depth the position was searched to.
+            bound (Bound): How score relates to the true value.
+            best_move (str | None): Best (or refuting) move found, as a UHP move string.
+            score (float): Score from the point of view of the player to move.
+        """
+        start = (key % self._buckets) * BUCKET_SIZE
+        preferred = self._slots[start]
+        # Keep the previous best move when re-searching a position that found none
+        for entry in self._slots[start:start + BUCKET_SIZE]:
+            if best_move is None and entry is not None and entry.key == key:
+                best_move = entry.best_move
+
+        entry = TTEntry(key, depth, bound, best_move, score, self.age)
+        if (preferred is None or
+            preferred.key == key or
+            preferred.age != self.age or
+            depth >= preferred.depth):
+            self._slots[start] = entry
+            second = self._slots[start + 1]
+            if preferred is not None and preferred.key != key:
+                # Demote the displaced entry rather than losing it
+                self._slots[start + 1] = preferred
+            elif second is not None and second.key == key:
+                # Drop a stale copy of this key from the always-replace slot
+                self._slots[start + 1] = None
+        else:
+            self._slots[start + 1] = entry
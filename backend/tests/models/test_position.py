@@ -39,3 +39,13 @@ def test_neighbors_are_cached():
     pos1 = Position(2, 2)
     pos2 = Position(2, 2)
     assert pos1.neighbors() is pos2.neighbors()
+
+
+def test_distance():
+    """Distance counts hex steps, symmetric and zero for the same position."""
+    origin = Position(0, 0)
+    assert origin.distance(origin) == 0
+    assert all(origin.distance(n) == 1 for n in origin.neighbors())
+    assert origin.distance(Position(2, -1)) == 2
+    assert Position(-3, 1).distance(Position(1, -2)) == 4
+    assert Position(1, -2).distance(Position(-3, 1)) == 4
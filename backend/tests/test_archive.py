@@ -0,0 +1,72 @@
+import pytest  # type: ignore
+
+from hive.archive import ArchiveWriter, GameArchive
+from hive.game import Game
+
+GAMES = [
+    ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wA1 /wQ"],
+    [],
+    ["wS1", "bG1 -wS1", "wQ wS1/", "bQ /bG1"],
+]
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = str(tmp_path / "games.hga")
+    with ArchiveWriter(path) as writer:
+        for moves in GAMES:
+            writer.append(moves)
+    return path
+
+
+def test_random_access_to_moves(path):
+    with GameArchive(path) as archive:
+        assert len(archive) == len(GAMES)
+        assert archive.moves(2) == GAMES[2]
+        assert archive.moves(1) == []
+        assert archive.moves(0) == GAMES[0]
+
+
+def test_raw_is_zero_copy_view(path):
+    with GameArchive(path) as archive:
+        view = archive.raw(2)
+        assert isinstance(view, memoryview)
+        assert bytes(view) == b"wS1;bG1 -wS1;wQ wS1/;bQ /bG1"
+        view.release()
+
+
+def test_iterates_all_games_in_order(path):
+    with GameArchive(path) as archive:
+        assert list(archive) == GAMES
+
+
+def test_reopening_writer_appends(path):
+    with ArchiveWriter(path) as writer:
+        writer.append_game(Game.from_moves(GAMES[0][:2]))
+
+    with GameArchive(path) as archive:
+        assert len(archive) == len(GAMES) + 1
+        assert archive.moves(len(GAMES)) == GAMES[0][:2]
+
+
+def test_game_reconstructs_position(path):
+    with GameArchive(path) as archive:
+        game = archive.game(0)
+    assert game.move_log == GAMES[0]
+    assert game.cur_player.color == "BLACK"
+
+
+def test_out_of_range_index(path):
+    with GameArchive(path) as archive, pytest.raises(IndexError):
+        archive.moves(len(GAMES))
+
+
+def test_empty_and_invalid_archives(tmp_path):
+    with GameArchive(str(tmp_path / "missing.hga")) as archive:
+        assert len(archive) == 0
+        assert list(archive) == []
+
+    bad = tmp_path / "bad.hga"
+    bad.write_bytes(b"not an archive")
+    with pytest.raises(ValueError):
+        GameArchive(str(bad))
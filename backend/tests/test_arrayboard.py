@@ -0,0 +1,106 @@
+import random
+
+import pytest  # type: ignore
+
+pytest.importorskip("numpy")
+
+from hive.arrayboard import EMPTY, INITIAL_WINDOW, ArrayBoard  # noqa: E402
+from hive.board import Board  # noqa: E402
+from hive.game import Game, Phase  # noqa: E402
+from hive.models.bug import Bug, BugType  # noqa: E402
+from hive.models.player import Player  # noqa: E402
+from hive.models.position import Position  # noqa: E402
+
+
+@pytest.fixture
+def players():
+    return Player("WHITE"), Player("BLACK")
+
+
+def drop(board, bug_type, owner, q, r):
+    bug = Bug(bug_type, owner)
+    bug.on_place()
+    board._drop_bug(bug, Position(q, r))
+    return bug
+
+
+def test_arrays_track_stacks(players):
+    white, black = players
+    board = ArrayBoard()
+    drop(board, BugType.QUEEN_BEE, white, 0, 0)
+    drop(board, BugType.BEETLE, black, 0, 0)
+    q, r = board.to_index(Position(0, 0))
+
+    assert board.heights[q, r] == 2
+    assert board.top_owner[q, r] == 1
+
+    board._remove_top_bug(Position(0, 0))
+    board._remove_top_bug(Position(0, 0))
+    assert board.heights[q, r] == 0
+    assert board.top_type[q, r] == EMPTY
+
+
+def test_window_grows_and_recenters(players):
+    white, _ = players
+    board = ArrayBoard()
+    for q in range(INITIAL_WINDOW + 4):
+        drop(board, BugType.ANT, white, q, 0)
+
+    assert board.window > INITIAL_WINDOW
+    assert all(board.heights[board.to_index(pos)] == 1 for pos in board.occupied_positions())
+    assert int(board.heights.sum()) == INITIAL_WINDOW + 4
+
+
+def test_placeable_positions_match_board():
+    layout = [(BugType.QUEEN_BEE, 0, 0, 0), (BugType.QUEEN_BEE, 1, 1, 0),
+              (BugType.ANT, 0, -1, 0), (BugType.BEETLE, 1, 2, -1),
+              (BugType.BEETLE, 0, 1, 0)]  # White beetle on the black queen
+    # Placing takes bugs from the owner's reserve, so each board gets its own players
+    boards = Board(), ArrayBoard()
+    players = [(Player("WHITE"), Player("BLACK")) for _ in boards]
+    for board, board_players in zip(boards, players, strict=True):
+        for bug_type, owner, q, r in layout:
+            drop(board, bug_type, board_players[owner], q, r)
+
+    for player, array_player in zip(*players, strict=True):
+        expected = Board.placeable_positions(boards[0], player)
+        assert boards[1].placeable_positions(array_player) == expected
+
+
+def test_rebuilt_games_keep_board_type():
+    moves = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-"]
+    game = Game.from_moves(moves, ArrayBoard())
+
+    assert isinstance(game.board, ArrayBoard)
+    assert isinstance(Game.from_snapshot(game.snapshot(), ArrayBoard()).board, ArrayBoard)
+    past = game.at_ply(2)
+    assert isinstance(past.board, ArrayBoard)
+    assert past.snapshot() == Game.from_moves(moves[:2]).snapshot()
+
+
+def test_games_play_identically():
+    for seed in range(3):
+        traces = []
+        for board in (Board(), ArrayBoard()):
+            rng = random.Random(seed)
+            game = Game(board)
+            trace = []
+            for _ in range(60):
+                if game.phase == Phase.GAME_OVER:
+                    break
+                actions = sorted(
+                    [(bt, pos) for bt in set(game.cur_player.reserve)
+                     for pos in game.valid_positions(bt)] +
+                    [(bug.position, dest) for bug, dests in game.valid_moves.items()
+                     for dest in dests], key=str)
+                trace.append(actions)
+                if not actions:
+                    game.force_pass()
+                    continue
+                src, dest = rng.choice(actions)
+                if isinstance(src, BugType):
+                    game.place_bug(src, dest)
+                else:
+                    game.move_bug(src, dest)
+            traces.append(trace)
+        assert traces[0] == traces[1]
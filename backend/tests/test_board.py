@@ -103,3 +103,28 @@ def test_multiple_stacks_independent(board, players):
 def test_remove_from_empty_returns_none(board):
     pos = Position(5, 5)
     assert board._remove_top_bug(pos) is None
+
+def test_visible_positions_track_occupancy(board, players):
+    white, black = players
+    center = Position(0, 0)
+    east = Position(1, 0)
+
+    queen = Bug(BugType.QUEEN_BEE, white)
+    beetle = Bug(BugType.BEETLE, black)
+    board._drop_bug(queen, center)
+    board._drop_bug(beetle, east)
+
+    expected = {center, east, *center.neighbors(), *east.neighbors()}
+    assert set(board.visible_positions()) == expected
+
+    # Climbing onto the queen vacates east, leaving only center's neighborhood
+    board._remove_top_bug(east)
+    board._drop_bug(beetle, center)
+    assert set(board.visible_positions()) == {center, *center.neighbors()}
+
+    # Lifting the beetle off keeps center occupied by the queen
+    board._remove_top_bug(center)
+    assert set(board.visible_positions()) == {center, *center.neighbors()}
+
+    board._remove_top_bug(center)
+    assert not board.visible_positions()
@@ -0,0 +1,158 @@
+import random
+
+import pytest  # type: ignore
+
+from hive.board import Board
+from hive.bugcache import BugMoveCache, is_affected
+from hive.game import Game, Phase
+from hive.models.bug import Bug, BugType
+from hive.models.player import Player
+from hive.models.position import Position
+from hive.rules import RuleEngine
+
+
+@pytest.fixture
+def players():
+    return Player("WHITE"), Player("BLACK")
+
+
+def drop(board, bug_type, owner, q, r):
+    bug = Bug(bug_type, owner)
+    bug.on_place()
+    board._drop_bug(bug, Position(q, r))
+    return bug
+
+
+@pytest.fixture
+def line_board(players):
+    """A long line of black ants, with a white queen at one end and a white beetle at the other."""
+    white, black = players
+    board = Board()
+    queen = drop(board, BugType.QUEEN_BEE, white, 0, 0)
+    for q in range(1, 8):
+        drop(board, BugType.ANT, black, q, 0)
+    beetle = drop(board, BugType.BEETLE, white, 8, 0)
+    return board, queen, beetle
+
+
+def test_board_records_changes(players):
+    white, _ = players
+    board = Board()
+    bug = drop(board, BugType.ANT, white, 0, 0)
+    board._remove_top_bug(bug.position)
+
+    assert board.revision == 2
+    assert board.move_cache._dirty == {Position(0, 0)}
+
+
+def test_sync_forgets_handled_changes(line_board):
+    board, queen, _ = line_board
+    cache = board.move_cache
+    cache.valid_moves(queen)
+    assert not cache._dirty
+
+    # Only positions changed since the last sync are kept, however long the game
+    for _ in range(50):
+        drop(board, BugType.BEETLE, queen.owner, 8, 0)
+        board._remove_top_bug(Position(8, 0))
+    assert cache._dirty == {Position(8, 0)}
+
+
+def test_new_cache_on_existing_board_finds_pinned_bugs(line_board):
+    board, queen, _ = line_board
+    cache = BugMoveCache(board)
+    assert cache.valid_moves(queen) == queen.get_valid_moves(board)
+    assert Position(4, 0) in cache._pinned
+
+
+def test_far_change_keeps_cached_moves(line_board):
+    board, queen, beetle = line_board
+    cache = board.move_cache
+    cache.valid_moves(queen)
+    cache.valid_moves(beetle)
+
+    # Far from the queen, next to the beetle
+    drop(board, BugType.ANT, queen.owner, 8, -1)
+    assert set(cache.valid_moves(queen)) == set(queen.get_valid_moves(board))
+    assert set(cache.valid_moves(beetle)) == set(beetle.get_valid_moves(board))
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_clear_recomputes_moves(line_board):
+    board, queen, _ = line_board
+    cache = board.move_cache
+    cache.valid_moves(queen)
+    cache.clear()
+
+    assert set(cache.valid_moves(queen)) == set(queen.get_valid_moves(board))
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_clear_recomputes_pinned_bugs(line_board, monkeypatch):
+    board, queen, _ = line_board
+    cache = board.move_cache
+    cache.valid_moves(queen)
+    cache.clear()
+    assert cache._dirty == set(board.occupied_positions())
+
+    calls = []
+    articulation_points = RuleEngine.articulation_points
+    monkeypatch.setattr(RuleEngine, "articulation_points",
+                        lambda board: calls.append(board) or articulation_points(board))
+    cache.valid_moves(queen)
+    assert calls == [board]
+    assert Position(4, 0) in cache._pinned
+
+
+def test_pinned_bug_has_no_moves(line_board, players):
+    board, _, _ = line_board
+    ant = board.get_top_bug(Position(4, 0))
+    assert board.move_cache.valid_moves(ant) == []
+    assert board.move_cache.misses == 0
+
+
+@pytest.mark.parametrize("bug_type, changed, affected", [
+    (BugType.QUEEN_BEE, Position(2, 0), True),
+    (BugType.QUEEN_BEE, Position(3, 0), False),
+    (BugType.SPIDER, Position(4, -1), True),
+    (BugType.SPIDER, Position(5, 0), False),
+    (BugType.GRASSHOPPER, Position(-6, 6), True),
+    (BugType.GRASSHOPPER, Position(2, 1), False),
+    (BugType.ANT, Position(6, 1), True),  # within reach of a destination
+    (BugType.ANT, Position(9, 0), False),
+])
+def test_is_affected(players, bug_type, changed, affected):
+    bug = Bug(bug_type, players[0], Position(0, 0))
+    assert is_affected(bug, [Position(5, 0)], changed) == affected
+
+
+def test_disconnected_hive_falls_back_to_rules(players):
+    white, _ = players
+    board = Board()
+    drop(board, BugType.QUEEN_BEE, white, 0, 0)
+    ant = drop(board, BugType.ANT, white, 3, 0)
+    assert board.move_cache.valid_moves(ant) == ant.get_valid_moves(board)
+
+
+def test_random_games_match_rule_engine():
+    rng = random.Random(3)
+    for _ in range(5):
+        game = Game()
+        for _ in range(40):
+            if game.phase == Phase.GAME_OVER:
+                break
+            actions = [(bt, pos) for bt in set(game.cur_player.reserve)
+                       for pos in game.valid_positions(bt)]
+            actions += [(bug.position, dest) for bug, dests in game.valid_moves.items()
+                        for dest in dests]
+            if not actions:
+                game.force_pass()
+                continue
+
+            src, dest = rng.choice(sorted(actions, key=str))
+            assert (game.place_bug(src, dest) if isinstance(src, BugType)
+                    else game.move_bug(src, dest))
+            cached = game.board.move_cache.get_valid_moves(game.cur_player)
+            expected = RuleEngine.get_valid_moves(game.board, game.cur_player)
+            assert {b: set(d) for b, d in cached.items()} == {
+                b: set(d) for b, d in expected.items()}
@@ -0,0 +1,72 @@
+import pytest  # type: ignore
+
+np = pytest.importorskip("numpy")
+
+from hive.encoding import (  # noqa: E402
+    BUG_TYPES,
+    HEIGHT_PLANE,
+    NUM_PLANES,
+    PINNED_PLANE,
+    QUEEN_PLANES,
+    TOP_PIECE_PLANES,
+    WINDOW_SIZE,
+    encode_batch,
+    encode_game,
+    window_origin,
+)
+from hive.game import Game  # noqa: E402
+from hive.models.bugtype import BugType  # noqa: E402
+from hive.models.position import Position  # noqa: E402
+
+MOVES = ["wQ", "bQ wQ-", "wA1 -wQ", "bB1 bQ-", "wA1 /wQ", "bB1 bQ"]
+
+
+@pytest.fixture
+def game():
+    return Game.from_moves(MOVES)
+
+
+def cell(batch, i, pos):
+    origin_q, origin_r = batch.origins[i]
+    return batch.planes[i, :, pos.q - origin_q, pos.r - origin_r]
+
+
+def test_shapes(game):
+    batch = encode_batch([game, Game()])
+    assert len(batch) == 2
+    assert batch.planes.shape == (2, NUM_PLANES, WINDOW_SIZE, WINDOW_SIZE)
+    assert batch.reserves.shape == (2, 2, len(BUG_TYPES))
+    assert batch.planes[1].sum() == 0
+
+
+def test_stacked_beetle_on_queen(game):
+    batch = encode_game(game)
+    black_queen = cell(batch, 0, Position(1, 0))
+    black_beetle = TOP_PIECE_PLANES + len(BUG_TYPES) + BUG_TYPES.index(BugType.BEETLE)
+
+    assert black_queen[black_beetle] == 1
+    assert black_queen[HEIGHT_PLANE] == 2
+    assert black_queen[QUEEN_PLANES + 1] == 1
+    assert black_queen[QUEEN_PLANES] == 0
+
+
+def test_pinned_plane(game):
+    batch = encode_game(game)
+    pinned = {batch.to_board(0, q, r) for q, r in zip(*np.nonzero(batch.planes[0, PINNED_PLANE]))}
+    assert pinned == {Position(0, 0)}  # The white queen joins the ant to the black stack
+
+
+def test_reserves_and_side_to_move(game):
+    batch = encode_game(game)
+    ant = BUG_TYPES.index(BugType.ANT)
+    assert batch.reserves[0, 0, ant] == 2
+    assert batch.reserves[0, 1, ant] == 3
+    assert batch.to_move[0] == 0
+
+
+def test_window_is_centered():
+    origin = window_origin([Position(-10, 4), Position(11, -3)])
+    assert origin == (0 - WINDOW_SIZE // 2, 0 - WINDOW_SIZE // 2)
+
+    with pytest.raises(ValueError):
+        window_origin([Position(0, 0), Position(WINDOW_SIZE, 0)])
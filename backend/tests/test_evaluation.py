@@ -0,0 +1,76 @@
+import random
+
+import pytest  # type: ignore
+
+from hive.evaluation import evaluate, position_features
+from hive.game import Game, Phase
+from hive.models.bugtype import BugType
+from hive.openings import OpeningBook
+
+MOVES = ["wQ", "bQ wQ-", "wA1 -wQ", "bB1 bQ-", "wA1 /wQ", "bB1 bQ"]
+
+
+@pytest.fixture
+def game():
+    return Game.from_moves(MOVES)
+
+
+def random_games(count, seed):
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        game = Game()
+        for _ in range(rng.randint(0, 40)):
+            if game.phase == Phase.GAME_OVER:
+                break
+            actions = [(bt, pos) for bt in set(game.cur_player.reserve)
+                       for pos in game.valid_positions(bt)]
+            actions += [(bug.position, dest) for bug, dests in game.valid_moves.items()
+                        for dest in dests]
+            if not actions:
+                game.force_pass()
+                continue
+            src, dest = rng.choice(sorted(actions, key=str))
+            if isinstance(src, BugType):
+                game.place_bug(src, dest)
+            else:
+                game.move_bug(src, dest)
+        games.append(game)
+    return games
+
+
+def test_position_features(game):
+    features = position_features(game)
+    assert features["queen_liberties"] == (4, 5)
+    assert features["mobile"] == (1, 1)
+    assert features["pinned"] == (1, 0)  # The white queen links the ant to the black stack
+    assert features["reserve"] == (9, 9)
+    assert features["beetle_on_queen"] == (0, 0)  # Black's beetle is on its own queen
+
+
+def test_beetle_on_enemy_queen():
+    game = Game.from_moves(["wQ", "bB1 wQ-", "wA1 -wQ", "bB1 wQ"])
+    assert position_features(game)["beetle_on_queen"] == (0, 1)
+
+
+def test_evaluate_is_antisymmetric(game):
+    score = evaluate(game)
+    game.cur_player = game.opponent_player
+    assert evaluate(game) == -score
+    assert score == -4.0  # One liberty and one pinned piece behind
+
+
+def test_opening_book_stores_evaluations():
+    book = OpeningBook.build(max_plies=1)
+    game = Game.from_moves(["wQ"])
+    assert book.evaluation(game) == evaluate(game)
+
+
+def test_batch_matches_scalar_reference():
+    np = pytest.importorskip("numpy")
+    from hive.encoding import encode_batch
+    from hive.evaluation import evaluate_batch
+
+    games = random_games(10, seed=4)
+    expected = np.array([evaluate(game) for game in games])
+    assert np.array_equal(evaluate_batch(encode_batch(games)), expected)
@@ -1,3 +1,5 @@
+import pytest  # type: ignore
+
 from hive.game import Game, Phase
 from hive.models.bugtype import BugType
 from hive.models.position import Position
@@ -164,3 +166,67 @@ def test_visible_positions_includes_neighbors():
     assert center in visible
     for n in neighbors:
         assert n in visible
+
+
+def test_version_increments_on_state_change():
+    game = Game()
+    assert game.version == 0
+
+    assert game.place_bug(BugType.QUEEN_BEE, Position(0, 0))
+    assert game.version == 1
+
+    # Rejected actions leave the state (and version) untouched
+    assert not game.place_bug(BugType.QUEEN_BEE, Position(5, 5))
+    assert game.version == 1
+
+
+def test_move_log_records_uhp_moves():
+    game = Game()
+
+    assert game.place_bug(BugType.QUEEN_BEE, Position(0, 0))
+    assert game.place_bug(BugType.QUEEN_BEE, Position(1, 0))
+    assert game.place_bug(BugType.ANT, Position(-1, 0))
+    assert game.place_bug(BugType.ANT, Position(2, 0))
+    assert game.move_bug(Position(-1, 0), Position(-1, 1))
+
+    assert game.move_log == ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wA1 /wQ"]
+
+
+def test_play_validates_uhp_moves():
+    game = Game()
+
+    assert game.play("wQ")
+    assert not game.play("wA1 wQ-")  # Not white's turn
+    assert not game.play("bA2 wQ-")  # Must place bA1 first
+    assert not game.play("bA1 wS1-")  # Reference piece not placed
+    assert game.play("bA1 wQ-")
+    assert game.play("wS1 -wQ")
+    assert not game.play("bA1 bA1-")  # Illegal destination
+    assert game.cur_player.color == "BLACK"
+
+
+def test_from_moves_matches_validated_play():
+    moves = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wA1 /wQ", "bB1 bQ\\", "wB1 \\wQ", "bB1 bQ"]
+    played = Game()
+    for move in moves:
+        assert played.play(move)
+
+    replayed = Game.from_moves(played.move_log)
+
+    assert replayed.move_log == played.move_log
+    assert replayed.cur_player.color == played.cur_player.color
+    assert replayed.phase == played.phase
+    assert replayed.likely_valid_positions == played.likely_valid_positions
+    assert {(b.position, tuple(d)) for b, d in replayed.valid_moves.items()} == {
+        (b.position, tuple(d)) for b, d in played.valid_moves.items()
+    }
+    for bug in played.all_bugs:
+        stack = replayed.board.get_stack(bug.position)
+        assert [(b.bug_type, b.owner.color) for b in stack] == [
+            (b.bug_type, b.owner.color) for b in played.board.get_stack(bug.position)
+        ]
+
+
+def test_from_moves_rejects_unplaced_reference_piece():
+    with pytest.raises(ValueError, match="unknown reference piece wA1"):
+        Game.from_moves(["wQ", "bQ wA1-"])
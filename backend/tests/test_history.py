@@ -0,0 +1,74 @@
+import pytest  # type: ignore
+
+from hive.game import Game
+from hive.history import GameHistory
+
+MOVES = [
+    "wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wA1 /wQ", "bB1 /bA1",
+    "wB1 \\wQ", "bB1 bQ", "wG1 -wB1", "bA2 bB1/", "wS1 wG1/",
+]
+
+
+@pytest.fixture
+def game():
+    game = Game()
+    game.history.interval = 4
+    for move in MOVES:
+        assert game.play(move)
+    return game
+
+
+def test_checkpoints_stored_every_interval(game):
+    assert sorted(game.history.checkpoints) == [4, 8]
+    assert game.history.nearest_checkpoint(3) == (0, None)
+    assert game.history.nearest_checkpoint(7)[0] == 4
+    assert game.history.nearest_checkpoint(11)[0] == 8
+
+
+def test_snapshot_round_trip(game):
+    restored = Game.from_snapshot(game.snapshot())
+
+    assert restored.snapshot() == game.snapshot()
+    assert restored.likely_valid_positions == game.likely_valid_positions
+    assert restored.board.get_top_bug(game.all_bugs[-1].position).bug_type == (
+        game.all_bugs[-1].bug_type
+    )
+
+
+@pytest.mark.parametrize("ply", range(len(MOVES) + 1))
+def test_at_ply_matches_replay_from_start(game, ply):
+    expected = Game.from_moves(MOVES[:ply])
+    actual = game.at_ply(ply)
+
+    assert actual.move_log == MOVES[:ply]
+    assert actual.cur_player.color == expected.cur_player.color
+    assert actual.phase == expected.phase
+    assert actual.likely_valid_positions == expected.likely_valid_positions
+    assert sorted(map(str, actual.snapshot().white_placed)) == sorted(
+        map(str, expected.snapshot().white_placed)
+    )
+
+
+def test_at_ply_rejects_out_of_range(game):
+    with pytest.raises(ValueError):
+        game.at_ply(len(MOVES) + 1)
+
+
+def test_prefix_truncates_moves_and_checkpoints(game):
+    prefix = game.history.prefix(6)
+
+    assert isinstance(prefix, GameHistory)
+    assert prefix.moves == MOVES[:6]
+    assert sorted(prefix.checkpoints) == [4]
+
+
+@pytest.mark.parametrize("ply", [6, 8])
+def test_at_ply_computes_valid_actions_once(game, ply, monkeypatch):
+    calls = []
+    compute = Game._compute_valid_actions
+    monkeypatch.setattr(Game, "_compute_valid_actions",
+                        lambda self: calls.append(self) or compute(self))
+
+    restored = game.at_ply(ply)
+    assert calls == [restored]
+    assert restored.likely_valid_positions == Game.from_moves(MOVES[:ply]).likely_valid_positions
@@ -0,0 +1,49 @@
+from hive.importer import import_games, read_game_records, validate_game
+
+LEGAL = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wA1 /wQ"]
+
+
+def test_read_game_records_accepts_uhp_and_bare_lists():
+    lines = [
+        "# comment",
+        "Base;InProgress;White[3];wQ;bQ wQ-;wA1 -wQ",
+        "",
+        "wS1; bG1 -wS1 ",
+    ]
+    assert list(read_game_records(lines)) == [["wQ", "bQ wQ-", "wA1 -wQ"], ["wS1", "bG1 -wS1"]]
+
+
+def test_validate_game_reports_first_bad_move():
+    assert validate_game(LEGAL) == (LEGAL, None)
+
+    moves, error = validate_game(["wQ", "bQ wQ-", "wA1 wQ-"])
+    assert moves is None
+    assert error == "ply 3: illegal move 'wA1 wQ-'"
+
+    moves, error = validate_game(["wQ", "nonsense"])
+    assert moves is None
+    assert error.startswith("ply 2:")
+
+
+def test_import_games_batches_and_skips_illegal_games():
+    records = [LEGAL, ["wQ", "wA1 wQ-"], LEGAL[:2], LEGAL[:3]]
+    batches = []
+
+    stats = import_games(records, batches.append, batch_size=2)
+
+    assert batches == [[LEGAL], [LEGAL[:2], LEGAL[:3]]]
+    assert stats.accepted == 3
+    assert stats.rejected == 1
+    assert stats.moves == len(LEGAL) + 2 + 3
+    assert stats.errors == [(2, "ply 2: illegal move 'wA1 wQ-'")]
+
+
+def test_import_games_in_parallel_preserves_order():
+    records = [LEGAL[:n] for n in range(1, len(LEGAL) + 1)] * 3
+    batches = []
+
+    stats = import_games(iter(records), batches.append, batch_size=4, workers=2)
+
+    assert [moves for batch in batches for moves in batch] == records
+    assert stats.accepted == len(records)
+    assert stats.games_per_second > 0
@@ -0,0 +1,47 @@
+from api import metrics
+from api.metrics import Histogram
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("test_seconds", "Test latency.", (0.1, 1.0), ("route",))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, "/state")
+
+    assert histogram.render() == [
+        "# HELP test_seconds Test latency.",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{route="/state",le="0.1"} 1',
+        'test_seconds_bucket{route="/state",le="1.0"} 3',
+        'test_seconds_bucket{route="/state",le="+Inf"} 4',
+        'test_seconds_sum{route="/state"} 4.05',
+        'test_seconds_count{route="/state"} 4',
+    ]
+
+
+def test_histogram_bound_is_inclusive():
+    histogram = Histogram("test_pieces", "Pieces.", (2, 4))
+    histogram.observe(2)
+    histogram.observe(4)
+
+    lines = histogram.render()
+    assert 'test_pieces_bucket{le="2"} 1' in lines
+    assert 'test_pieces_bucket{le="4"} 2' in lines
+    assert "test_pieces_count 2" in lines
+
+
+def test_counter_renders_labels_and_values():
+    labels = metrics._format_labels(("function",), ('Rule "a"\\b\nc',))
+    assert metrics._sample("test_total", "counter", "Calls.", [(labels, 3), ("", 0.5)]) == [
+        "# HELP test_total Calls.",
+        "# TYPE test_total counter",
+        'test_total{function="Rule \\"a\\"\\\\b\\nc"} 3',
+        "test_total 0.5",
+    ]
+
+
+def test_render_includes_every_family():
+    text = metrics.render()
+    assert text.endswith("\n")
+    for name in ("hive_request_duration_seconds", "hive_movegen_duration_seconds",
+                 "hive_board_pieces", "hive_active_sessions", "hive_move_cache_hits_total"):
+        assert f"# TYPE {name} " in text
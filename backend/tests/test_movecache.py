@@ -0,0 +1,143 @@
+import pytest  # type: ignore
+
+from hive import game as game_module
+from hive import openings
+from hive.game import Game
+from hive.importer import validate_game
+from hive.movecache import MoveCache, move_cache
+from hive.openings import OpeningBook
+from hive.oracle import replay_moves
+from hive.rules import RuleEngine
+from hive.symmetry import canonicalize
+
+MOVES = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wS1 /wQ", "bG1 bQ/"]
+# The same position, rotated and shifted (the first bug still goes at the origin)
+ROTATED = ["wQ", "bQ wQ\\", "wA1 \\wQ", "bA1 bQ\\", "wS1 -wQ", "bG1 bQ-"]
+
+
+@pytest.fixture
+def cache():
+    return MoveCache()
+
+
+def direct_actions(game):
+    return (RuleEngine.get_all_valid_places(game.board, game.cur_player),
+            RuleEngine.get_valid_moves(game.board, game.cur_player))
+
+
+def as_sets(actions):
+    placements, moves = actions
+    return placements, {bug: set(dests) for bug, dests in moves.items()}
+
+
+def test_lookup_maps_actions_onto_symmetric_board(cache):
+    game, rotated = Game.from_moves(MOVES), Game.from_moves(ROTATED)
+    cache.store(game, canonicalize(game.board), direct_actions(game))
+
+    actions = cache.lookup(rotated, canonicalize(rotated.board))
+    assert as_sets(actions) == as_sets(direct_actions(rotated))
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_side_to_move_is_part_of_key(cache):
+    game = Game.from_moves(MOVES)
+    form = canonicalize(game.board)
+    cache.store(game, form, direct_actions(game))
+    game.cur_player = game.opponent_player
+
+    assert cache.lookup(game, form) is None
+    assert cache.misses == 1
+
+
+def stored_size(game):
+    """Returns the estimated size of a game's cache entry."""
+    cache = MoveCache()
+    cache.store(game, canonicalize(game.board), direct_actions(game))
+    return cache.nbytes
+
+
+def test_least_recently_used_evicted():
+    games = [Game.from_moves(MOVES[:n]) for n in (3, 4, 5)]
+    forms = [canonicalize(game.board) for game in games]
+    # Room for the first and last positions, but not all three
+    cache = MoveCache(max_bytes=stored_size(games[0]) + stored_size(games[2]))
+    cache.store(games[0], forms[0], direct_actions(games[0]))
+    cache.store(games[1], forms[1], direct_actions(games[1]))
+    cache.lookup(games[0], forms[0])
+    cache.store(games[2], forms[2], direct_actions(games[2]))
+
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+    assert cache.lookup(games[1], forms[1]) is None
+    assert cache.lookup(games[0], forms[0]) is not None
+
+
+def test_replaced_entry_size_not_counted_twice(cache):
+    game = Game.from_moves(MOVES)
+    form = canonicalize(game.board)
+    cache.store(game, form, direct_actions(game))
+    cache.store(game, form, direct_actions(game))
+    assert cache.nbytes == stored_size(game)
+
+
+def test_entry_larger_than_budget_not_cached():
+    game = Game.from_moves(MOVES)
+    cache = MoveCache(max_bytes=stored_size(game) - 1)
+    cache.store(game, canonicalize(game.board), direct_actions(game))
+    assert len(cache) == 0
+    assert cache.nbytes == 0
+
+
+def test_empty_board_not_cached(cache):
+    game = Game()
+    form = canonicalize(game.board)
+    cache.store(game, form, direct_actions(game))
+    assert len(cache) == 0
+
+
+def test_disabled_cache():
+    cache = MoveCache(max_bytes=0)
+    game = Game.from_moves(MOVES)
+    form = canonicalize(game.board)
+    cache.store(game, form, direct_actions(game))
+    assert cache.lookup(game, form) is None
+
+
+def test_games_share_process_cache():
+    Game.from_moves(MOVES)
+    hits = move_cache.hits
+    rotated = Game.from_moves(ROTATED)
+
+    assert move_cache.hits == hits + 1
+    assert as_sets((rotated.likely_valid_positions, rotated.valid_moves)) == as_sets(
+        direct_actions(rotated))
+
+
+def test_building_opening_book_leaves_process_cache_untouched(monkeypatch):
+    # As while the process-wide book is being built: no position is in the book yet
+    monkeypatch.setattr(openings, "_book", OpeningBook())
+    move_cache.clear()
+    OpeningBook.build(max_plies=2, evaluate=None)
+    assert (move_cache.hits, move_cache.misses, len(move_cache)) == (0, 0, 0)
+
+
+def test_canonical_form_skipped_when_no_lookup_applies(monkeypatch):
+    calls = []
+    monkeypatch.setattr(game_module, "canonicalize", lambda board: calls.append(board))
+    game = Game(use_move_cache=False)
+    game.replay(MOVES)
+    assert calls == []
+
+    monkeypatch.setattr(move_cache, "max_bytes", 0)
+    Game.from_moves(MOVES)
+    assert calls == []
+
+
+def test_offline_replays_leave_process_cache_untouched():
+    game = Game.from_moves(MOVES)
+    move_cache.clear()
+    assert validate_game(MOVES) == (MOVES, None)
+    assert replay_moves(ROTATED) is not None
+    game.at_ply(5)
+    assert (move_cache.hits, move_cache.misses, len(move_cache)) == (0, 0, 0)
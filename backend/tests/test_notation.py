@@ -0,0 +1,70 @@
+import pytest  # type: ignore
+
+from hive.board import Board
+from hive.models.bug import Bug
+from hive.models.bugtype import BugType
+from hive.models.player import Player
+from hive.models.position import Position
+from hive.notation import Move, describe_move, move_target, next_piece_name, parse_move, piece_name
+
+
+@pytest.fixture
+def players():
+    return Player("WHITE"), Player("BLACK")
+
+
+def test_parse_and_format_round_trip():
+    for text in ["wS1", "bG1 -wS1", "wA1 wS1/", "bQ \\wS1", "bS2 /wQ", "wQ bA3\\", "wB1 bQ", "pass"]:
+        assert str(parse_move(text)) == text
+
+
+def test_parse_move_fields():
+    move = parse_move("bG1 -wS1")
+    assert move.piece == "bG1"
+    assert move.reference == "wS1"
+    assert move.offset == (-1, 0)
+    assert move.bug_type == BugType.GRASSHOPPER
+    assert move.color == "BLACK"
+
+    assert parse_move("pass").is_pass
+    assert parse_move("wB1 bQ").offset is None
+
+
+@pytest.mark.parametrize("text", ["", "wX1", "wA", "wQ1", "wA1 bQ-/", "wA1 -bQ-", "wA1 bQ extra"])
+def test_parse_move_rejects_malformed(text):
+    with pytest.raises(ValueError):
+        parse_move(text)
+
+
+def test_piece_names_follow_placement_order(players):
+    white, black = players
+    bugs = [Bug(BugType.ANT, white), Bug(BugType.QUEEN_BEE, white), Bug(BugType.ANT, white)]
+    for bug in bugs:
+        white.add_to_placed(bug)
+
+    assert [piece_name(b) for b in bugs] == ["wA1", "wQ", "wA2"]
+    assert next_piece_name(white, BugType.ANT) == "wA3"
+    assert next_piece_name(black, BugType.SPIDER) == "bS1"
+
+
+def test_describe_move_relative_to_neighbor_and_stack(players):
+    white, black = players
+    board = Board()
+    queen = Bug(BugType.QUEEN_BEE, white)
+    beetle = Bug(BugType.BEETLE, black)
+
+    assert board.place_bug(queen, Position(0, 0))
+    assert str(describe_move(board, queen)) == "wQ"
+
+    assert board.place_bug(beetle, Position(-1, 1))
+    assert str(describe_move(board, beetle)) == "bB1 /wQ"
+
+    assert board.move_bug(beetle, Position(0, 0))
+    assert str(describe_move(board, beetle)) == "bB1 wQ"
+
+
+def test_move_target_applies_offset():
+    ref = Position(2, -1)
+    assert move_target(parse_move("bA1 wQ/"), ref) == Position(3, -2)
+    assert move_target(parse_move("bB1 wQ"), ref) == ref
+    assert move_target(Move(piece="wQ"), None) == Position(0, 0)
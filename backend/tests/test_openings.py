@@ -0,0 +1,64 @@
+import random
+
+import pytest  # type: ignore
+
+from hive.game import Game
+from hive.openings import OpeningBook, _successors
+from hive.rules import RuleEngine
+
+
+@pytest.fixture(scope="module")
+def book():
+    return OpeningBook.build(max_plies=2, evaluate=lambda game: float(len(game.valid_moves)))
+
+
+def as_sets(actions):
+    placements, moves = actions
+    return placements, {bug: set(dests) for bug, dests in moves.items()}
+
+
+def direct_actions(game):
+    return as_sets((RuleEngine.get_all_valid_places(game.board, game.cur_player),
+                    RuleEngine.get_valid_moves(game.board, game.cur_player)))
+
+
+def test_build_dedupes_symmetric_positions(book):
+    # Empty board, 5 first bugs, then 5 x 5 replies: the 6 reply spots are all symmetric
+    assert len(book) == 1 + 5 + 5 * 5
+
+
+def test_empty_board_not_in_book(book):
+    assert book.lookup(Game()) is None
+
+
+def test_lookup_matches_rule_engine(book):
+    rng = random.Random(7)
+    for _ in range(20):
+        game = Game()
+        for _ in range(2):
+            game = rng.choice(_successors(game))
+        assert as_sets(book.lookup(game)) == direct_actions(game)
+
+
+def test_lookup_beyond_book_depth(book):
+    game = Game.from_moves(["wA1", "bA1 wA1-", "wQ -wA1"])
+    assert book.lookup(game) is None
+
+
+def test_game_uses_book_actions():
+    game = Game.from_moves(["wS1", "bG1 -wS1"])
+    assert as_sets((game.likely_valid_positions, game.valid_moves)) == direct_actions(game)
+
+
+def test_evaluation(book):
+    game = Game.from_moves(["wS1"])
+    assert book.evaluation(game) == float(len(game.valid_moves))
+
+
+def test_save_load_round_trip(book, tmp_path):
+    path = str(tmp_path / "book.json")
+    book.save(path)
+    loaded = OpeningBook.load(path)
+
+    assert loaded.max_plies == book.max_plies
+    assert loaded.entries == book.entries
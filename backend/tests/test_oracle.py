@@ -0,0 +1,96 @@
+import random
+
+import pytest  # type: ignore
+
+from hive import oracle
+from hive.game import Game
+from hive.movecache import move_cache
+from hive.notation import PASS_MOVE
+
+MOVES = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wG1 wQ/"]
+reference_actions = oracle.reference_actions
+
+
+@pytest.fixture(autouse=True)
+def clean_oracle():
+    move_cache.clear()
+    yield
+    oracle.disable()
+    move_cache.clear()
+
+
+def drop_a_destination(game):
+    """A faulty backend missing one destination of the first movable bug."""
+    placements, moves = reference_actions(game)
+    if not moves:
+        return placements, moves
+    bug = next(iter(moves))
+    return placements, {**moves, bug: moves[bug][1:]}
+
+
+def test_backends_match_reference_over_fuzzed_games():
+    report = oracle.run(games=4, plies=40, seed=5, fuzz=0.3)
+
+    assert report.positions > 100
+    assert report.mismatches == []
+
+
+def test_check_reports_differences():
+    game = Game.from_moves(MOVES)
+    [mismatch] = oracle.check(game, {"faulty": drop_a_destination})
+
+    assert mismatch.moves == MOVES
+    assert "moves from" in mismatch.describe()
+
+
+def test_check_reports_crashing_backend():
+    def crash(game):
+        raise RuntimeError("boom")
+
+    [mismatch] = oracle.check(Game.from_moves(MOVES), {"crash": crash})
+    assert mismatch.actual is None
+    assert "RuntimeError: boom" in mismatch.describe()
+
+
+def test_shrink_finds_minimal_failing_list():
+    # Fails whenever both "b" and "d" remain
+    moves = list("abcdefgh")
+    assert oracle.shrink(moves, lambda m: "b" in m and "d" in m) == ["b", "d"]
+
+
+def test_shrink_mismatch_removes_unneeded_moves():
+    # Grasshoppers make the faulty backend fail; moves after the first one are not needed
+    faulty = {"grasshopper": lambda game: drop_a_destination(game) if any(
+        bug.bug_type.value == "Grasshopper" for bug in game.all_bugs) else None}
+    moves = MOVES + ["bA2 bA1-", "wS1 -wA1"]
+    [mismatch] = oracle.check(oracle.replay_moves(moves), faulty)
+
+    shrunk = oracle.shrink_mismatch(mismatch, faulty)
+    assert shrunk.moves == MOVES
+
+
+def test_replay_moves_rejects_malformed_positions():
+    assert oracle.replay_moves(MOVES) is not None
+    assert oracle.replay_moves(["wQ", "bQ wQ-", "wA2 -wQ"]) is None  # Skips wA1
+    assert oracle.replay_moves(["wQ", "bQ wQ-", "wA1 wQ"]) is None  # Ant on top of a bug
+    assert oracle.replay_moves(["wQ", "bQ wQ-", "wA1 -wQ", "wQ -wA1"]) is None  # Wrong turn
+
+
+def test_random_relocation_keeps_hive_well_formed():
+    rng = random.Random(2)
+    game = Game.from_moves(MOVES)
+    for _ in range(20):
+        move = oracle.random_relocation(game, rng) or PASS_MOVE
+        assert oracle.replay_moves(game.move_log + [move]) is not None
+        game.replay([move])
+
+
+def test_enabled_games_raise_on_mismatch(monkeypatch):
+    oracle.enable()
+    game = Game.from_moves(MOVES)  # Checked and consistent
+    assert oracle.is_enabled()
+
+    # The game's (correct) actions now differ from the reference
+    monkeypatch.setattr(oracle, "reference_actions", drop_a_destination)
+    with pytest.raises(oracle.OracleMismatchError):
+        game.play("bA2 bA1-")
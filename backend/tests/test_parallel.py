@@ -0,0 +1,83 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest  # type: ignore
+
+from hive import parallel
+from hive.bugcache import BugMoveCache
+from hive.game import Game
+from hive.oracle import play_random
+from hive.parallel import FrozenBoard
+from hive.rules import RuleEngine
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ThreadPoolExecutor(4) as pool:
+        yield pool
+
+
+def random_games(count, plies, seed):
+    """Yields games at every ply of some random games."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        game = Game()
+        for _ in range(plies):
+            play_random(game, rng)
+            yield game
+
+
+def test_frozen_board_matches_board():
+    game = Game.from_moves(["wQ", "bQ wQ-", "wB1 -wQ", "bA1 bQ-", "wB1 wQ"])
+    frozen = FrozenBoard(game.board)
+
+    assert set(frozen.occupied_positions()) == set(game.board.occupied_positions())
+    for pos in game.board.occupied_positions():
+        assert list(frozen.get_stack(pos)) == list(game.board.get_stack(pos))
+        assert frozen.get_top_bug(pos) is game.board.get_top_bug(pos)
+        assert frozen.is_occupied(pos)
+
+
+def test_parallel_moves_match_sequential(executor):
+    for game in random_games(count=3, plies=40, seed=1):
+        player = game.cur_player
+        expected = RuleEngine.get_valid_moves(game.board, player)
+
+        assert RuleEngine.get_valid_moves(game.board, player, executor) == expected
+        cache = BugMoveCache(game.board)
+        assert cache.get_valid_moves(player, executor) == expected
+        assert cache.get_valid_moves(player, executor) == expected
+
+
+def test_parallel_fill_counts_misses_once(executor):
+    game = next(game for game in random_games(count=5, plies=40, seed=3)
+                if len(RuleEngine.get_valid_moves(game.board, game.cur_player)) >= 6)
+    cache = BugMoveCache(game.board)
+    cache.get_valid_moves(game.cur_player, executor)
+    misses = cache.misses
+    assert misses >= parallel.MIN_PARALLEL_BUGS
+
+    cache.get_valid_moves(game.cur_player, executor)
+    assert cache.hits == misses
+    assert cache.misses == misses
+
+
+def test_thread_count_from_environment(monkeypatch):
+    monkeypatch.setenv(parallel.THREADS_ENV, "3")
+    assert parallel.thread_count() == 3
+    monkeypatch.setenv(parallel.THREADS_ENV, "auto")
+    assert (parallel.thread_count() > 0) == parallel.is_free_threaded()
+    monkeypatch.delenv(parallel.THREADS_ENV)
+    assert parallel.thread_count() == 0
+
+
+def test_invalid_thread_count_falls_back_to_sequential(monkeypatch, caplog):
+    monkeypatch.setenv(parallel.THREADS_ENV, "abc")
+    with pytest.raises(ValueError, match=parallel.THREADS_ENV):
+        parallel.thread_count()
+
+    monkeypatch.setattr(parallel, "_configured", False)
+    monkeypatch.setattr(parallel, "_executor", None)
+    assert parallel.get_executor() is None
+    assert parallel.THREADS_ENV in caplog.text
+    assert Game().play("wQ")
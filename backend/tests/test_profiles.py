@@ -0,0 +1,86 @@
+import sys
+import threading
+
+import pytest  # type: ignore
+from fastapi.testclient import TestClient  # type: ignore
+
+from api import profiles
+from api.main import app
+from api.profiles import PROFILE_HEADER, PROFILE_ID_HEADER, ProfileStore, is_authorized
+from hive.openings import get_opening_book
+from hive.profiling import StackProfiler
+
+TOKEN = "secret"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv(profiles.TOKEN_ENV, TOKEN)
+    get_opening_book()  # Built on first use, which would otherwise be traced slowly
+    return TestClient(app)
+
+
+def place_queen(client, headers):
+    return client.post("/place", params={"game_id": "profiled"}, headers=headers,
+                       json={"bug_type": "QueenBee", "q": 0, "r": 0})
+
+
+def test_is_authorized(monkeypatch):
+    monkeypatch.delenv(profiles.TOKEN_ENV, raising=False)
+    assert not is_authorized(TOKEN)
+
+    monkeypatch.setenv(profiles.TOKEN_ENV, TOKEN)
+    assert is_authorized(TOKEN)
+    assert not is_authorized("wrong")
+    assert not is_authorized(None)
+
+
+def test_store_keeps_most_recent_profiles(tmp_path, monkeypatch):
+    monkeypatch.setenv(profiles.DIR_ENV, str(tmp_path))
+    store = ProfileStore(capacity=2)
+    ids = [store.save(f"a;b {n}\n") for n in range(3)]
+
+    assert store.get(ids[0]) is None
+    assert [store.get(i) for i in ids[1:]] == ["a;b 1\n", "a;b 2\n"]
+    assert (tmp_path / f"{ids[0]}.collapsed").read_text() == "a;b 0\n"
+
+
+def test_profile_header_returns_profile_id(client):
+    client.post("/newgame", params={"game_id": "profiled"})
+    response = place_queen(client, {PROFILE_HEADER: TOKEN})
+    profile_id = response.headers[PROFILE_ID_HEADER]
+
+    fetched = client.get(f"/profiles/{profile_id}", headers={PROFILE_HEADER: TOKEN})
+    assert fetched.status_code == 200
+    assert PROFILE_ID_HEADER not in fetched.headers  # Fetching a profile is not profiled
+    roots = {line.rsplit(" ", 1)[0].split(";")[0] for line in fetched.text.splitlines()}
+    assert roots == {"router.py:place_bug"}
+
+
+def test_unauthorized_requests_not_profiled(client):
+    client.post("/newgame", params={"game_id": "profiled"})
+    response = place_queen(client, {PROFILE_HEADER: "wrong"})
+    assert PROFILE_ID_HEADER not in response.headers
+    assert client.get("/profiles/unknown", headers={PROFILE_HEADER: "wrong"}).status_code == 403
+    assert client.get("/profiles/unknown", headers={PROFILE_HEADER: TOKEN}).status_code == 404
+
+
+def test_stack_profiler_traces_only_its_thread():
+    def work():
+        return sum(range(100))
+
+    def after_nested():
+        return work()
+
+    with StackProfiler() as profiler:
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        with profiler:  # Nested use keeps tracing until the outermost block exits
+            work()
+        after_nested()
+
+    assert sys.getprofile() is None
+    # Frames of the other thread would run under Thread.run
+    assert not any("threading.py:Thread.run" in stack for stack in profiler.stacks)
+    assert any(stack[-1].endswith("after_nested") for stack in profiler.stacks)
@@ -0,0 +1,76 @@
+import pytest  # type: ignore
+
+from hive import profiling
+from hive.game import Game
+from hive.models.bugtype import BugType
+from hive.models.position import Position
+from hive.movecache import move_cache
+from hive.rules import RuleEngine
+
+MOVES = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-"]
+
+
+@pytest.fixture(autouse=True)
+def clean_profiling():
+    move_cache.clear()  # Cached positions would skip the behaviors being counted
+    profiling.reset()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_disabled_leaves_functions_untouched():
+    original = RuleEngine.__dict__["can_slide_to"]
+    with profiling.profiled():
+        assert RuleEngine.__dict__["can_slide_to"] is not original
+    assert RuleEngine.__dict__["can_slide_to"] is original
+
+    Game.from_moves(MOVES).place_bug(BugType.ANT, Position(-2, 1))
+    assert profiling.process_stats() == {}
+
+
+def test_counts_calls_per_game_and_process():
+    first, second = Game.from_moves(MOVES), Game.from_moves(MOVES)
+    with profiling.profiled():
+        assert first.place_bug(BugType.SPIDER, Position(-1, 1))
+        assert second.place_bug(BugType.SPIDER, Position(-1, 1))
+        RuleEngine.can_slide_to(first.board, Position(0, 0), Position(0, 1))
+
+    totals = profiling.process_stats()
+    per_game = profiling.game_stats(first)
+    assert totals["Game.switch_turn"].count == 2
+    assert per_game["Game.switch_turn"].count == 1
+    assert per_game["AntBehavior.get_valid_moves"].count >= 1
+    # Only the call made during first's turn is attributed to it
+    assert totals["RuleEngine.can_slide_to"].count > per_game["RuleEngine.can_slide_to"].count
+    assert per_game["Game.switch_turn"].total_seconds >= per_game[
+        "AntBehavior.get_valid_moves"].mean_seconds
+
+
+def test_game_scope_attributes_calls():
+    game = Game.from_moves(MOVES)
+    with profiling.profiled(), profiling.game_scope(game):
+        RuleEngine.is_one_hive_move(game.board, Position(0, 0))
+
+    assert profiling.game_stats(game)["RuleEngine.is_one_hive_move"].count == 1
+
+
+def test_format_stats():
+    with profiling.profiled():
+        RuleEngine.can_climb_to(Game().board, Position(0, 0), Position(1, 0))
+
+    table = profiling.format_stats(profiling.process_stats())
+    assert "RuleEngine.can_climb_to" in table.splitlines()[1]
+
+
+def test_stack_profiler_collapses_call_stacks():
+    game = Game.from_moves(MOVES)
+    with profiling.StackProfiler() as profiler:
+        game.place_bug(BugType.ANT, Position(-2, 1))
+
+    lines = profiler.collapsed().splitlines()
+    assert lines
+    assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines)
+    stacks = [line.rsplit(" ", 1)[0].split(";") for line in lines]
+    assert any(stack[:2] == ["game.py:Game.place_bug", "game.py:Game.switch_turn"]
+               for stack in stacks)
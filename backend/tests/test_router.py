@@ -0,0 +1,73 @@
+import pytest  # type: ignore
+from fastapi.testclient import TestClient  # type: ignore
+
+from api.main import app
+from api.sessions import sessions
+from hive.game import Phase
+
+MOVES = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wS1 /wQ", "bG1 bQ/"]
+# Three bugs each without a queen: both players must place their queen next
+NO_QUEENS = ["wA1", "bA1 wA1-", "wA2 -wA1", "bA2 bA1-", "wA3 -wA2", "bA3 bA2-"]
+# The white queen surrounded on all six sides
+SURROUNDED = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 wQ/", "wA2 /wQ", "bA2 wQ\\", "wA3 \\wQ"]
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def start_game(client, game_id, moves):
+    """Starts a new session game and replays trusted moves on it."""
+    client.post("/newgame", params={"game_id": game_id})
+    sessions.get(game_id).replay(moves)
+
+
+def positions(views):
+    return {(view["q"], view["r"]) for view in views}
+
+
+def test_valid_actions_match_single_endpoints(client):
+    start_game(client, "actions", MOVES)
+    actions = client.get("/valid-actions", params={"game_id": "actions"}).json()
+
+    assert actions["moves"]
+    for bug in actions["moves"]:
+        moves = client.get("/valid-moves",
+                           params={"q": bug["q"], "r": bug["r"], "game_id": "actions"}).json()
+        assert positions(bug["destinations"]) == positions(moves)
+
+    reserve = dict.fromkeys(bt.value for bt in sessions.get("actions").cur_player.reserve)
+    assert [entry["bug_type"] for entry in actions["placements"]] == list(reserve)
+    for entry in actions["placements"]:
+        placements = client.get("/valid-placements",
+                                params={"bug_type": entry["bug_type"], "game_id": "actions"}).json()
+        assert positions(entry["positions"]) == positions(placements)
+
+
+def test_only_queen_placeable_at_deadline(client):
+    start_game(client, "deadline", NO_QUEENS)
+    actions = client.get("/valid-actions", params={"game_id": "deadline"}).json()
+
+    placeable = {entry["bug_type"] for entry in actions["placements"] if entry["positions"]}
+    assert placeable == {"QueenBee"}
+    assert actions["moves"] == []
+
+
+def test_game_over_has_no_actions(client):
+    start_game(client, "over", SURROUNDED)
+    assert sessions.get("over").phase == Phase.GAME_OVER
+
+    actions = client.get("/valid-actions", params={"game_id": "over"}).json()
+    assert actions == {"moves": [], "placements": []}
+
+
+def test_valid_actions_routed_by_game_id(client):
+    start_game(client, "played", MOVES)
+    client.post("/newgame", params={"game_id": "fresh"})
+
+    played = client.get("/valid-actions", params={"game_id": "played"}).json()
+    fresh = client.get("/valid-actions", params={"game_id": "fresh"}).json()
+    assert played["moves"]
+    assert fresh["moves"] == []
+    assert all(positions(entry["positions"]) == {(0, 0)} for entry in fresh["placements"])
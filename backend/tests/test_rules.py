@@ -234,3 +234,24 @@ def test_is_on_top_returns_false_if_covered(board, players):
     board._drop_bug(ant, Position(0, 0))  # Cover the queen
     assert not RuleEngine.is_on_top(board, queen)
     assert RuleEngine.is_on_top(board, ant)
+
+def test_articulation_points_match_one_hive_rule(board, players):
+    white, black = players
+    # A line with a closed ring at one end: only the line's inner cells split the hive
+    layout = [(0, 0), (1, 0), (2, 0), (3, 0), (3, -1), (4, -1), (4, 0), (2, 1)]
+    for i, (q, r) in enumerate(layout):
+        board._drop_bug(Bug(BugType.ANT, (white, black)[i % 2]), Position(q, r))
+
+    points = RuleEngine.articulation_points(board)
+    assert points == {Position(1, 0), Position(2, 0)}
+    for pos in board.occupied_positions():
+        assert (pos in points) != RuleEngine.is_one_hive_move(board, pos)
+
+def test_is_hive_connected(board, players):
+    white, _ = players
+    board._drop_bug(Bug(BugType.ANT, white), Position(0, 0))
+    board._drop_bug(Bug(BugType.ANT, white), Position(1, 0))
+    assert RuleEngine.is_hive_connected(board)
+
+    board._drop_bug(Bug(BugType.ANT, white), Position(3, 0))
+    assert not RuleEngine.is_hive_connected(board)
@@ -0,0 +1,113 @@
+import threading
+
+import pytest  # type: ignore
+
+from api import sessions as sessions_module
+from api.sessions import SessionManager
+from hive.storage import GameStore
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A controllable monotonic clock for idle expiry."""
+    now = [0.0]
+    monkeypatch.setattr(sessions_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_least_recently_used_game_evicted():
+    manager = SessionManager(max_games=2)
+    first = manager.get("a")
+    manager.get("b")
+    manager.get("a")
+    manager.get("c")
+
+    assert len(manager) == 2
+    assert manager.evictions == 1
+    assert manager.get("a") is first
+
+
+def test_idle_games_evicted(clock):
+    manager = SessionManager(idle_seconds=10)
+    manager.get("idle")
+    clock[0] = 5.0
+    active = manager.get("active")
+    clock[0] = 12.0
+    manager.get("active")
+
+    assert len(manager) == 1
+    assert manager.get("active") is active
+
+
+def test_evicted_games_restored_from_store(tmp_path):
+    store = GameStore(str(tmp_path / "games.db"))
+    manager = SessionManager(store, max_games=1)
+    manager.get("a").play("wQ")
+    manager.get("b")
+
+    assert manager.get("a").move_log == ["wQ"]
+    manager.close()
+
+
+def test_new_game_replaces_held_game():
+    manager = SessionManager()
+    old = manager.get("a")
+    new = manager.new_game("a")
+
+    assert new is not old
+    assert manager.get("a") is new
+    assert len(manager) == 1
+
+
+class SlowStore:
+    """A store whose loads of one game block until released, to hold a restore in progress."""
+
+    def __init__(self, slow_id):
+        self.slow_id = slow_id
+        self.loading = threading.Event()
+        self.release = threading.Event()
+
+    def load(self, game_id):
+        if game_id == self.slow_id:
+            self.loading.set()
+            self.release.wait(timeout=5)
+        return None
+
+    def save(self, game_id, game):
+        pass
+
+
+def test_restore_does_not_block_other_games():
+    store = SlowStore("cold")
+    manager = SessionManager(store)
+    held = manager.get("held")
+    restoring = threading.Thread(target=manager.get, args=("cold",))
+    restoring.start()
+    store.loading.wait(timeout=5)
+
+    # The lock is free while "cold" is loading
+    reader = threading.Thread(target=manager.get, args=("held",))
+    reader.start()
+    reader.join(timeout=1)
+    blocked = reader.is_alive()
+    store.release.set()
+    reader.join()
+    assert not blocked
+    assert manager.get("held") is held
+    restoring.join()
+    assert len(manager) == 2
+
+
+def test_concurrent_restores_share_one_game():
+    store = SlowStore("a")
+    manager = SessionManager(store)
+    games = []
+    threads = [threading.Thread(target=lambda: games.append(manager.get("a"))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    store.loading.wait(timeout=5)
+    store.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert games[0] is games[1] is manager.get("a")
@@ -0,0 +1,68 @@
+from dataclasses import replace
+
+import pytest  # type: ignore
+
+from hive.game import Game, Phase
+from hive.models.bugtype import BugType
+from hive.snapshot import GameSnapshot, decode_game, encode_game
+
+MOVES = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wA1 /wQ", "bB1 /bA1", "wB1 \\wQ", "bB1 bQ"]
+
+
+def test_encode_decode_round_trip():
+    game = Game.from_moves(MOVES)
+    data = encode_game(game)
+
+    # 4 header bytes plus 3 bytes per placed bug
+    assert len(data) == 4 + 3 * len(game.all_bugs)
+
+    restored = decode_game(data)
+    assert restored.snapshot() == game.snapshot()
+    assert restored.phase == Phase.PLACE_MOVE
+    assert restored.cur_player.color == "WHITE"
+    assert restored.player_black.reserve == game.player_black.reserve
+    assert [b.bug_type for b in restored.board.get_stack(game.player_black.queen_bug.position)] == [
+        BugType.QUEEN_BEE, BugType.BEETLE
+    ]
+
+
+def test_flags_round_trip():
+    snapshot = GameSnapshot(
+        white_placed=((BugType.QUEEN_BEE, 0, 0, 0),),
+        black_placed=((BugType.BEETLE, 0, 0, 1),),
+        cur_color="BLACK",
+        phase=Phase.GAME_OVER,
+        cur_player_passed=True,
+        prev_player_passed=True,
+        winner_color="BLACK",
+        draw=False,
+    )
+    assert GameSnapshot.from_bytes(snapshot.to_bytes()) == snapshot
+
+
+def test_empty_game_round_trip():
+    assert decode_game(encode_game(Game())).snapshot() == Game().snapshot()
+
+
+@pytest.mark.parametrize("data", [b"", b"\x01\x00\x01\x00", b"\x09\x00\x00\x00"])
+def test_from_bytes_rejects_invalid_data(data):
+    with pytest.raises(ValueError):
+        GameSnapshot.from_bytes(data)
+
+
+@pytest.mark.parametrize("data", [
+    b"\x01\x00\x01\x00\x00\x00\x05",  # Bug type index 5
+    b"\x01\x00\x01\x00\x00\x00\x07",  # Bug type index 7
+    b"\x01\xc0\x00\x00",  # Phase index 3
+    b"\x01\x30\x00\x00",  # Winner index 3
+])
+def test_from_bytes_rejects_corrupted_bits(data):
+    with pytest.raises(ValueError, match="invalid"):
+        GameSnapshot.from_bytes(data)
+
+
+def test_to_bytes_rejects_out_of_range_coordinates():
+    far = replace(Game().snapshot(), white_placed=((BugType.ANT, 500, 0, 0),))
+
+    with pytest.raises(ValueError):
+        far.to_bytes()
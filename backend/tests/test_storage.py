@@ -0,0 +1,85 @@
+import pytest  # type: ignore
+
+from hive.game import Game
+from hive.storage import GameStore
+
+MOVES = ["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wA1 /wQ", "bB1 /bA1", "wB1 \\wQ", "bB1 bQ",
+         "wG1 -wB1", "bA2 bB1/"]
+
+
+@pytest.fixture
+def store(tmp_path):
+    # Long flush interval so tests control when writes happen
+    store = GameStore(str(tmp_path / "games.db"), flush_interval=60)
+    yield store
+    store.close()
+
+
+def test_load_unknown_game_returns_none(store):
+    assert store.load("missing") is None
+
+
+def test_pending_save_is_visible_before_flush(store):
+    game = Game.from_moves(MOVES)
+    store.save("g1", game)
+
+    restored = store.load("g1")
+    assert restored.move_log == game.move_log
+
+
+def test_flush_batches_pending_games(store):
+    store.save("g1", Game.from_moves(MOVES))
+    store.save("g2", Game.from_moves(MOVES[:3]))
+    store.save("g1", Game.from_moves(MOVES[:5]))  # Supersedes the earlier save
+
+    assert store.flush() == 2
+    assert store.flush() == 0
+    assert store.load("g1").move_log == MOVES[:5]
+    assert store.load("g2").move_log == MOVES[:3]
+
+
+def test_games_survive_reopening(tmp_path):
+    path = str(tmp_path / "games.db")
+    game = Game.from_moves(MOVES)
+
+    store = GameStore(path, flush_interval=60)
+    store.save("g1", game)
+    store.close()  # Flushes pending writes
+
+    reopened = GameStore(path, flush_interval=60)
+    restored = reopened.load("g1")
+    reopened.close()
+
+    assert restored.move_log == game.move_log
+    assert restored.history.checkpoints == game.history.checkpoints
+    assert restored.snapshot() == game.snapshot()
+    assert restored.likely_valid_positions == game.likely_valid_positions
+
+
+def test_saving_shorter_game_drops_stale_checkpoints(store):
+    store.save("g1", Game.from_moves(MOVES))
+    store.flush()
+    store.save("g1", Game())
+    store.flush()
+
+    restored = store.load("g1")
+    assert restored.move_log == []
+    assert restored.history.checkpoints == {}
+
+
+def test_background_writer_flushes(tmp_path):
+    path = str(tmp_path / "games.db")
+    store = GameStore(path, flush_interval=0.01)
+    store.save("g1", Game.from_moves(MOVES))
+
+    # Wait for the writer thread to pick up the pending game
+    for _ in range(500):
+        if not store._pending and not store._in_flight:
+            break
+        store._stop.wait(0.01)
+    assert not store._pending
+
+    reader = GameStore(path, flush_interval=60)
+    assert reader.load("g1").move_log == MOVES
+    reader.close()
+    store.close()
@@ -0,0 +1,85 @@
+import pytest  # type: ignore
+
+from hive.board import Board
+from hive.game import Game
+from hive.models.bug import Bug
+from hive.models.bugtype import BugType
+from hive.models.player import Player
+from hive.models.position import Position
+from hive.symmetry import (
+    IDENTITY,
+    SYMMETRIES,
+    canonical_hash,
+    canonicalize,
+    position_hash,
+)
+
+# (bug_type, owner index, q, r) in stacking order
+LAYOUT = [
+    (BugType.QUEEN_BEE, 0, 0, 0),
+    (BugType.QUEEN_BEE, 1, 1, 0),
+    (BugType.ANT, 0, -1, 1),
+    (BugType.SPIDER, 1, 2, -1),
+    (BugType.BEETLE, 1, 1, 0),  # stacked on the black queen
+]
+
+
+def build_board(transform=lambda pos: pos):
+    board = Board()
+    players = [Player("WHITE"), Player("BLACK")]
+    for bug_type, owner, q, r in LAYOUT:
+        board._drop_bug(Bug(bug_type, players[owner]), transform(Position(q, r)))
+    return board
+
+
+def test_twelve_distinct_symmetries_preserve_adjacency():
+    origin_nbors = set(Position(0, 0).neighbors())
+
+    assert len(set(SYMMETRIES)) == 12
+    for symmetry in SYMMETRIES:
+        assert {symmetry.apply(p) for p in origin_nbors} == origin_nbors
+        assert symmetry.compose(symmetry.inverse()) == IDENTITY
+
+
+@pytest.mark.parametrize("symmetry", SYMMETRIES)
+def test_hash_invariant_under_symmetry_and_translation(symmetry):
+    def transform(pos):
+        mapped = symmetry.apply(pos)
+        return Position(mapped.q + 5, mapped.r - 3)
+
+    assert canonical_hash(build_board(transform)) == canonical_hash(build_board())
+
+
+def test_hash_distinguishes_colors_and_stacks():
+    board = build_board()
+    other = Board()
+    players = [Player("BLACK"), Player("WHITE")]  # Swapped colors
+    for bug_type, owner, q, r in LAYOUT:
+        other._drop_bug(Bug(bug_type, players[owner]), Position(q, r))
+
+    assert canonical_hash(board) != canonical_hash(other)
+
+
+def test_canonical_frame_round_trip():
+    board = build_board()
+    form = canonicalize(board)
+
+    for pos in board.occupied_positions():
+        canonical = form.to_canonical(pos)
+        assert form.from_canonical(canonical) == pos
+
+    # The smallest canonical cell sits at the origin
+    assert form.key[0][:2] == (0, 0)
+
+
+def test_empty_board_and_position_hash():
+    assert canonicalize(Board()).key == ()
+
+    game = Game()
+    assert game.place_bug(BugType.QUEEN_BEE, Position(0, 0))
+    mirrored = Game()
+    assert mirrored.place_bug(BugType.QUEEN_BEE, Position(0, 0))
+
+    assert game.place_bug(BugType.ANT, Position(1, 0))
+    assert mirrored.place_bug(BugType.ANT, Position(-1, 1))
+    assert position_hash(game) == position_hash(mirrored)
@@ -0,0 +1,87 @@
+import pytest  # type: ignore
+
+from hive.game import Game
+from hive.symmetry import position_hash
+from hive.transposition import Bound, TranspositionTable, TTEntry
+
+
+@pytest.fixture
+def table():
+    return TranspositionTable(capacity=2)  # a single bucket, so every key collides
+
+
+def test_store_and_probe(table):
+    table.store(1, 3, Bound.EXACT, "wQ", 0.5)
+    entry = table.probe(1)
+
+    assert entry == TTEntry(1, 3, Bound.EXACT, "wQ", 0.5, 0)
+    assert table.probe(2) is None
+    assert (table.probes, table.hits) == (2, 1)
+
+
+def test_transposed_move_orders_share_key():
+    first = Game.from_moves(["wQ", "bQ wQ-", "wA1 -wQ", "bA1 bQ-", "wS1 /wQ"])
+    second = Game.from_moves(["wQ", "bQ wQ-", "wS1 /wQ", "bA1 bQ-", "wA1 -wQ"])
+    assert position_hash(first) == position_hash(second)
+
+
+def test_depth_preferred_slot_keeps_deeper_entry(table):
+    table.store(1, 5, Bound.EXACT, "wQ", 1.0)
+    table.store(2, 2, Bound.EXACT, "wA1", 2.0)
+    table.store(3, 1, Bound.EXACT, "wS1", 3.0)
+
+    assert table.probe(1).depth == 5
+    assert table.probe(2) is None  # always-replace slot overwritten
+    assert table.probe(3).depth == 1
+    assert len(table) == table.capacity
+
+
+def test_deeper_entry_demotes_preferred(table):
+    table.store(1, 2, Bound.EXACT, "wQ", 1.0)
+    table.store(2, 4, Bound.EXACT, "wA1", 2.0)
+
+    assert table.probe(1) is not None
+    assert table.probe(2) is not None
+
+
+def test_new_search_ages_out_deep_entries(table):
+    table.store(1, 5, Bound.EXACT, "wQ", 1.0)
+    table.new_search()
+    table.store(2, 1, Bound.EXACT, "wA1", 2.0)
+    table.store(3, 1, Bound.EXACT, "wS1", 3.0)
+
+    assert table.probe(1) is None
+
+
+def test_store_keeps_previous_best_move(table):
+    table.store(1, 2, Bound.LOWER, "wQ", 1.0)
+    table.store(1, 3, Bound.UPPER, None, 0.0)
+
+    entry = table.probe(1)
+    assert entry.best_move == "wQ"
+    assert entry.depth == 3
+
+
+@pytest.mark.parametrize("bound, score, expected", [
+    (Bound.EXACT, 0.5, 0.5),
+    (Bound.LOWER, 2.0, 2.0),
+    (Bound.LOWER, 0.5, None),
+    (Bound.UPPER, -2.0, -2.0),
+    (Bound.UPPER, 0.5, None),
+])
+def test_cutoff_score(bound, score, expected):
+    entry = TTEntry(1, 3, bound, None, score, 0)
+    assert entry.cutoff_score(3, alpha=-1.0, beta=1.0) == expected
+    assert entry.cutoff_score(4, alpha=-1.0, beta=1.0) is None
+
+
+def test_clear(table):
+    table.store(1, 1, Bound.EXACT, None, 0.0)
+    table.clear()
+    assert len(table) == 0
+    assert table.probe(1) is None
+
+
+def test_capacity_too_small():
+    with pytest.raises(ValueError):
+        TranspositionTable(capacity=1)